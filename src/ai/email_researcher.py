@@ -6,20 +6,37 @@ Phase 2: Contact hunting (only if Phase 1 succeeds)
 
 from __future__ import annotations
 
+import inspect
 import json
+import threading
 from dataclasses import dataclass
 from difflib import SequenceMatcher
-from typing import Optional
+from typing import Any, Optional
 from urllib.parse import urlparse
 
+import requests
 from tavily import TavilyClient
 from openai import OpenAI
 
 from ..api_manager.utils.logger import get_logger, log_event
+from ..api_manager.utils.rate_limiter import TokenBucket
+from ..api_manager.utils.retry import with_retry
 from ..utils.config_loader import load_yaml_config
+from .openai_parser import CHARS_PER_TOKEN, RETRYABLE_OPENAI_ERRORS, _load_encoding
 
+try:
+    from tavily.errors import TimeoutError as TavilyTimeoutError, UsageLimitExceededError
+except ImportError:  # older tavily-python releases only raise requests errors
+    TavilyTimeoutError = UsageLimitExceededError = requests.Timeout
 
-@dataclass
+# Transient Tavily failures retried with exponential backoff (1s, 2s)
+RETRYABLE_TAVILY_ERRORS = (TavilyTimeoutError, UsageLimitExceededError, requests.ConnectionError)
+
+# Older tavily-python releases open a connection per call and take no session
+_TAVILY_TAKES_SESSION = "session" in inspect.signature(TavilyClient.__init__).parameters
+
+
+@dataclass(slots=True)
 class CompanyEnrichment:
     """Company enrichment data from Phase 1."""
 
@@ -31,7 +48,7 @@ class CompanyEnrichment:
     source_url: str
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailResearchResult:
     """Result of two-phase email research using Tavily + OpenAI."""
 
@@ -50,6 +67,7 @@ class EmailResearchResult:
     notes: str
     search_phase_reached: int  # 1 or 2
     error: Optional[str] = None
+    tokens_used: int = 0  # Prompt tokens sent to OpenAI (both phases)
 
 
 class EmailResearcher:
@@ -63,18 +81,40 @@ class EmailResearcher:
     MAX_RESULTS = 5
     TEMPERATURE = 0.0  # Deterministic output
 
-    def __init__(self, tavily_api_key: str, openai_api_key: str, config_path: str = "config/rules/enrichment_rules.yaml") -> None:
+    def __init__(
+        self,
+        tavily_api_key: str,
+        openai_api_key: str,
+        config_path: str = "config/rules/enrichment_rules.yaml",
+        pool_size: int = 10,
+    ) -> None:
         """Initialize email researcher.
 
         Args:
             tavily_api_key: Tavily API key.
             openai_api_key: OpenAI API key.
             config_path: Path to enrichment rules YAML.
+            pool_size: Keep-alive connections to Tavily (one per concurrent worker).
         """
-        self.tavily_client = TavilyClient(api_key=tavily_api_key)
-        self.openai_client = OpenAI(api_key=openai_api_key)
+        # Own session (not the scraper's): it carries the Tavily auth header and verifies TLS
+        self._tavily_session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self._tavily_session.mount("https://", adapter)
+        if _TAVILY_TAKES_SESSION:
+            self.tavily_client = TavilyClient(api_key=tavily_api_key, session=self._tavily_session)
+        else:
+            self.tavily_client = TavilyClient(api_key=tavily_api_key)
+        # Retries go through _chat so that they also respect the rate limits
+        self.openai_client = OpenAI(api_key=openai_api_key, max_retries=0)
         self.logger = get_logger("tier2.email_researcher")
         self.tavily_call_count = 0
+        # Shared per-minute budgets (set by Tier2Enricher; None = unlimited)
+        self.openai_request_limiter: Optional[TokenBucket] = None
+        self.openai_token_limiter: Optional[TokenBucket] = None
+        self.tavily_limiter: Optional[TokenBucket] = None
+        self._encoding = _load_encoding(self.MODEL)
+        # Prompt tokens of the research_email call running in each thread
+        self._usage = threading.local()
 
         # Load config
         try:
@@ -97,6 +137,43 @@ class EmailResearcher:
             self.skip_phase2_if_not_found = True
             self.confidence_threshold = 0.5
 
+    @with_retry(RETRYABLE_TAVILY_ERRORS, max_attempts=3, base_delay=1.0)
+    def _search(self, query: str) -> dict:
+        """Run a Tavily search within the RPM budget."""
+        if self.tavily_limiter is not None:
+            self.tavily_limiter.acquire()
+        return self.tavily_client.search(query=query, max_results=self.MAX_RESULTS, search_depth="advanced")
+
+    @with_retry(RETRYABLE_OPENAI_ERRORS, max_attempts=3, base_delay=1.0)
+    def _chat(self, system_prompt: str, prompt: str, max_tokens: int = 300) -> Any:
+        """Ask OpenAI for a JSON answer within the RPM/TPM budget."""
+        if self.openai_request_limiter is not None:
+            self.openai_request_limiter.acquire()
+        prompt_tokens = self._count_tokens(system_prompt) + self._count_tokens(prompt)
+        if self.openai_token_limiter is not None:
+            self.openai_token_limiter.acquire(prompt_tokens + max_tokens)
+        response = self.openai_client.chat.completions.create(
+            model=self.MODEL,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt},
+            ],
+            response_format={"type": "json_object"},
+            temperature=self.TEMPERATURE,
+            max_tokens=max_tokens,
+        )
+        usage = getattr(response, "usage", None)
+        self._usage.prompt_tokens = getattr(self._usage, "prompt_tokens", 0) + (
+            getattr(usage, "prompt_tokens", None) or prompt_tokens
+        )
+        return response
+
+    def _count_tokens(self, text: str) -> int:
+        """Count tokens with the model tokenizer (or estimate them from length)."""
+        if self._encoding is None:
+            return len(text) // CHARS_PER_TOKEN
+        return len(self._encoding.encode(text, disallowed_special=()))
+
     def _extract_domain(self, website: Optional[str]) -> Optional[str]:
         """Extract clean domain from website URL.
 
@@ -154,11 +231,7 @@ class EmailResearcher:
                 extra={"query": query},
             )
 
-            search_response = self.tavily_client.search(
-                query=query,
-                max_results=self.MAX_RESULTS,
-                search_depth="advanced",
-            )
+            search_response = self._search(query)
 
             results = search_response.get("results", [])
             if not results:
@@ -212,18 +285,9 @@ Extract and return JSON with:
 Return valid JSON only:"""
 
             try:
-                response = self.openai_client.chat.completions.create(
-                    model=self.MODEL,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a company data extraction assistant. Extract official company information and return only valid JSON.",
-                        },
-                        {"role": "user", "content": prompt},
-                    ],
-                    response_format={"type": "json_object"},
-                    temperature=self.TEMPERATURE,
-                    max_tokens=300,
+                response = self._chat(
+                    "You are a company data extraction assistant. Extract official company information and return only valid JSON.",
+                    prompt,
                 )
 
                 content = response.choices[0].message.content.strip()
@@ -318,11 +382,7 @@ Return valid JSON only:"""
                 extra={"query": query},
             )
 
-            search_response = self.tavily_client.search(
-                query=query,
-                max_results=self.MAX_RESULTS,
-                search_depth="advanced",
-            )
+            search_response = self._search(query)
 
             results = search_response.get("results", [])
             if not results:
@@ -365,18 +425,9 @@ Rules:
 Return valid JSON only:"""
 
             try:
-                response = self.openai_client.chat.completions.create(
-                    model=self.MODEL,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a contact extraction assistant. Extract specific contact information and return only valid JSON.",
-                        },
-                        {"role": "user", "content": prompt},
-                    ],
-                    response_format={"type": "json_object"},
-                    temperature=self.TEMPERATURE,
-                    max_tokens=300,
+                response = self._chat(
+                    "You are a contact extraction assistant. Extract specific contact information and return only valid JSON.",
+                    prompt,
                 )
 
                 content = response.choices[0].message.content.strip()
@@ -415,6 +466,10 @@ Return valid JSON only:"""
             )
             return None, None, None, None, company_enrichment.source_url
 
+    def close(self) -> None:
+        """Release the Tavily connection pool."""
+        self._tavily_session.close()
+
     def research_email(
         self,
         company: str,
@@ -431,10 +486,17 @@ Return valid JSON only:"""
         Returns:
             EmailResearchResult with Phase 1 and Phase 2 data.
         """
-        self.logger.info(f"_research_email_with_ai LLAMADA para: {company} (city={city}, website={website})")
+        self._usage.prompt_tokens = 0
+        result = self._research(company, city, website)
+        result.tokens_used = self._usage.prompt_tokens
+        return result
+
+    def _research(self, company: str, city: Optional[str], website: Optional[str]) -> EmailResearchResult:
+        """Run both research phases (see ``research_email``)."""
+        self.logger.info("_research_email_with_ai LLAMADA para: %s (city=%s, website=%s)", company, city, website)
         
         if not company or not company.strip():
-            self.logger.warning(f"Empty company name provided to research_email")
+            self.logger.warning("Empty company name provided to research_email")
             return EmailResearchResult(
                 company_enrichment=CompanyEnrichment(
                     razon_social_oficial=None,
@@ -456,16 +518,17 @@ Return valid JSON only:"""
             )
 
         # Phase 1: Company enrichment
-        self.logger.info(f"Iniciando Phase 1 (company enrichment) para: {company}")
+        self.logger.info("Iniciando Phase 1 (company enrichment) para: %s", company)
         company_enrichment = self._phase1_company_enrichment(company, city, website)
         self.logger.info(
-            f"Phase 1 completado - company_exists={company_enrichment.company_exists}, "
-            f"confidence={company_enrichment.confidence_score:.2f}"
+            "Phase 1 completado - company_exists=%s, confidence=%.2f",
+            company_enrichment.company_exists,
+            company_enrichment.confidence_score,
         )
 
         # Check if we should skip Phase 2
         if self.skip_phase2_if_not_found and not company_enrichment.company_exists:
-            self.logger.info(f"Saltando Phase 2 - company not found (skip_phase2_if_not_found=True)")
+            self.logger.info("Saltando Phase 2 - company not found (skip_phase2_if_not_found=True)")
             return EmailResearchResult(
                 company_enrichment=company_enrichment,
                 email=None,
@@ -486,7 +549,7 @@ Return valid JSON only:"""
             notes = ""
 
         # Phase 2: Contact hunting
-        self.logger.info(f"Iniciando Phase 2 (contact hunting) para: {company}")
+        self.logger.info("Iniciando Phase 2 (contact hunting) para: %s", company)
         email, contact_name, contact_position, linkedin_url, source_url = self._phase2_contact_hunting(
             company_enrichment, city
         )
@@ -519,7 +582,7 @@ Return valid JSON only:"""
         )
 
 
-def load_email_researcher_from_config() -> Optional[EmailResearcher]:
+def load_email_researcher_from_config(pool_size: int = 10) -> Optional[EmailResearcher]:
     """Helper to build EmailResearcher from config/api_keys.yaml."""
     try:
         api_keys = load_yaml_config("config/api_keys.yaml")
@@ -536,7 +599,7 @@ def load_email_researcher_from_config() -> Optional[EmailResearcher]:
             )
             return None
 
-        return EmailResearcher(tavily_api_key=tavily_key, openai_api_key=openai_key)
+        return EmailResearcher(tavily_api_key=tavily_key, openai_api_key=openai_key, pool_size=pool_size)
     except FileNotFoundError:
         return None
     except Exception as exc:
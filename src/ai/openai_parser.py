@@ -1,16 +1,31 @@
 from __future__ import annotations
 
 import json
+import time
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import Callable, List, Dict, Any, Optional, Tuple
 
 import openai
 from openai import OpenAI
 
+try:
+    import tiktoken
+except ImportError:  # Optional: fall back to the 1 token ≈ 4 chars estimate
+    tiktoken = None
+
 from ..api_manager.utils.logger import get_logger, log_event
+from ..api_manager.utils.rate_limiter import TokenBucket
+from ..api_manager.utils.retry import with_retry
+
+# Rough chars-per-token ratio used when no tokenizer is available
+CHARS_PER_TOKEN = 4
+
+# Transient OpenAI failures retried with exponential backoff (1s, 2s)
+RETRYABLE_OPENAI_ERRORS = (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)
 
 
-@dataclass
+@dataclass(slots=True)
 class ContactInfo:
     """Structured contact information."""
 
@@ -19,7 +34,7 @@ class ContactInfo:
     email: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedContactData:
     """Result of parsing HTML for contact information."""
 
@@ -27,6 +42,27 @@ class ParsedContactData:
     contacts: List[ContactInfo]
     raw_response: Optional[str] = None
     error: Optional[str] = None
+    tokens_used: int = 0  # Prompt tokens sent to OpenAI
+
+
+@lru_cache(maxsize=None)
+def _load_encoding(model: str) -> Optional[Any]:
+    """Load the tiktoken encoding for a model once per process (None if unavailable).
+
+    The encoding is thread-safe and shared by every parser instance.
+    """
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except Exception as exc:  # Unknown model or BPE file not downloadable
+        log_event(
+            get_logger("tier2.openai_parser"),
+            level=30,
+            message="tiktoken encoding unavailable, estimating tokens from length",
+            extra={"model": model, "error": str(exc)},
+        )
+        return None
 
 
 class OpenAIParser:
@@ -39,7 +75,13 @@ class OpenAIParser:
     MODEL = "gpt-4o-mini"
     MAX_TOKENS = 4000  # Strict limit per lead
     MAX_OUTPUT_TOKENS = 500  # Limit response size
-    GENERIC_EMAIL_DOMAINS = {"info", "contact", "admin", "noreply", "no-reply", "support", "help"}
+    GENERIC_EMAIL_DOMAINS = frozenset({"info", "contact", "admin", "noreply", "no-reply", "support", "help"})
+    SYSTEM_PROMPT = (
+        "You are a data extraction assistant. Extract contact information from HTML and return only valid JSON."
+    )
+    BATCH_ENDPOINT = "/v1/chat/completions"
+    # Batch API job states after which no more results will arrive
+    BATCH_FINAL_STATES = frozenset({"completed", "failed", "expired", "cancelled"})
 
     def __init__(self, api_key: str) -> None:
         """Initialize OpenAI parser.
@@ -47,14 +89,71 @@ class OpenAIParser:
         Args:
             api_key: OpenAI API key.
         """
-        self.client = OpenAI(api_key=api_key)
+        # Retries go through _create_completion so that they also respect the rate limits
+        self.client = OpenAI(api_key=api_key, max_retries=0)
         self.logger = get_logger("tier2.openai_parser")
+        # Shared per-minute budgets (set by Tier2Enricher; None = unlimited)
+        self.request_limiter: Optional[TokenBucket] = None
+        self.token_limiter: Optional[TokenBucket] = None
+        self._encoding = _load_encoding(self.MODEL)
+        # Tokens used by the prompt template itself; the rest of MAX_TOKENS is for the HTML
+        self._template_tokens = self._count_tokens(self._build_prompt(""))
+        self._html_token_budget = max(0, self.MAX_TOKENS - self._template_tokens)
+        self._batch_template_tokens = self._count_tokens(self._build_batch_prompt([]))
+
+    def _count_tokens(self, text: str) -> int:
+        """Count tokens with the model tokenizer (or estimate them from length)."""
+        if self._encoding is None:
+            return len(text) // CHARS_PER_TOKEN
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+    def _fit_html(self, html_content: str) -> Tuple[str, int]:
+        """Truncate HTML to the prompt token budget.
+
+        Args:
+            html_content: Raw HTML content.
+
+        Returns:
+            Tuple of (HTML within budget, its token count).
+        """
+        budget = self._html_token_budget
+        if self._encoding is None:
+            html_content = html_content[: budget * CHARS_PER_TOKEN]
+            return html_content, len(html_content) // CHARS_PER_TOKEN
+
+        ids = self._encoding.encode(html_content, disallowed_special=())
+        if len(ids) <= budget:
+            return html_content, len(ids)
+        log_event(
+            self.logger,
+            level=30,
+            message="HTML content too large, truncating",
+            extra={"html_tokens": len(ids), "max_tokens": budget},
+        )
+        return self._encoding.decode(ids[:budget]), budget
+
+    @with_retry(RETRYABLE_OPENAI_ERRORS, max_attempts=3, base_delay=1.0)
+    def _create_completion(self, body: Dict[str, Any], prompt_tokens: int) -> Any:
+        """Call chat completions within the RPM/TPM budget.
+
+        Args:
+            body: Request parameters (see ``_chat_body``).
+            prompt_tokens: Prompt tokens, reserved with the output limit from the TPM budget.
+
+        Returns:
+            OpenAI chat completion response.
+        """
+        if self.request_limiter is not None:
+            self.request_limiter.acquire()
+        if self.token_limiter is not None:
+            self.token_limiter.acquire(prompt_tokens + body["max_tokens"])
+        return self.client.chat.completions.create(**body)
 
     def _is_generic_email(self, email: str) -> bool:
         """Check if email is generic (info@, contact@, etc.)."""
         if not email or "@" not in email:
             return True
-        local_part = email.split("@")[0].lower().strip()
+        local_part = email.partition("@")[0].lower().strip()
         return local_part in self.GENERIC_EMAIL_DOMAINS
 
     def _build_prompt(self, html_content: str) -> str:
@@ -80,6 +179,34 @@ Rules:
 HTML content:
 """ + html_content[:50000]  # Limit HTML to ~50k chars to stay within token limits
 
+    def _build_batch_prompt(self, html_contents: List[str]) -> str:
+        """Build one prompt asking for the contacts of several pages."""
+        documents = "".join(
+            f"\n<<<DOC {number}>>>\n{html_content}" for number, html_content in enumerate(html_contents, start=1)
+        )
+        return """Extract all specific email addresses and contact information from each of the company contact page HTML documents below. Each document starts with a <<<DOC n>>> separator.
+
+Return a JSON object with this exact structure, with one entry per document:
+{
+  "documents": [
+    {
+      "doc": 1,
+      "emails": ["email1@example.com"],
+      "contacts": [{"name": "John Doe", "title": "Sales Manager", "email": "john@example.com"}]
+    }
+  ]
+}
+
+Rules:
+- Ignore generic emails like info@, contact@, admin@, noreply@, support@, help@
+- Only include specific person emails (e.g., firstname.lastname@, name@)
+- Extract full names and job titles when available
+- If a contact has no email, include them in contacts array but set email to null
+- Never mix data between documents; use empty lists when a document has no contacts
+- Return valid JSON only, no markdown or extra text
+
+HTML documents:""" + documents
+
     def parse_html(self, html_content: str) -> ParsedContactData:
         """Parse HTML content to extract emails and contacts.
 
@@ -97,82 +224,236 @@ HTML content:
             )
 
         try:
-            prompt = self._build_prompt(html_content)
-
-            # Estimate tokens (rough: 1 token ≈ 4 characters)
-            estimated_tokens = len(prompt) // 4
-            if estimated_tokens > self.MAX_TOKENS:
-                log_event(
-                    self.logger,
-                    level=30,
-                    message="HTML content too large, truncating",
-                    extra={"estimated_tokens": estimated_tokens, "max_tokens": self.MAX_TOKENS},
+            body, tokens_used = self._chat_body(html_content)
+            response = self._create_completion(body, tokens_used)
+
+            content = _strip_code_fence(response.choices[0].message.content)
+            data = json.loads(content)
+            return self._to_contact_data(data, content, tokens_used)
+
+        except Exception as exc:
+            return self._error_result(exc)
+
+    def _chat_body(self, html_content: str) -> Tuple[Dict[str, Any], int]:
+        """Build the chat completion request for one page.
+
+        Args:
+            html_content: Raw HTML content (truncated to the token budget).
+
+        Returns:
+            Tuple of (request parameters, prompt tokens).
+        """
+        html_content, html_tokens = self._fit_html(html_content)
+        body = {
+            "model": self.MODEL,
+            "messages": [
+                {"role": "system", "content": self.SYSTEM_PROMPT},
+                {"role": "user", "content": self._build_prompt(html_content)},
+            ],
+            "max_tokens": self.MAX_OUTPUT_TOKENS,
+            "temperature": 0.1,  # Low temperature for consistent JSON output
+        }
+        return body, self._template_tokens + html_tokens
+
+    def submit_offline_batch(self, html_contents: Dict[str, str]) -> str:
+        """Queue pages as an OpenAI Batch API job (about half the price, results within 24h).
+
+        Args:
+            html_contents: Custom id -> raw HTML of each (non-empty) page.
+
+        Returns:
+            Batch id, to pass to ``collect_offline_batch``.
+        """
+        lines = []
+        for custom_id, html_content in html_contents.items():
+            body, _ = self._chat_body(html_content)
+            request = {"custom_id": custom_id, "method": "POST", "url": self.BATCH_ENDPOINT, "body": body}
+            lines.append(json.dumps(request, ensure_ascii=False))
+
+        batch_file = self.client.files.create(
+            file=("contact_pages.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint=self.BATCH_ENDPOINT,
+            completion_window="24h",
+        )
+        log_event(
+            self.logger,
+            level=20,
+            message="OpenAI batch submitted",
+            extra={"batch_id": batch.id, "pages": len(lines)},
+        )
+        return batch.id
+
+    def collect_offline_batch(
+        self,
+        batch_id: str,
+        poll_interval: float = 60.0,
+        timeout: float = 24 * 3600.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> Dict[str, ParsedContactData]:
+        """Wait for a Batch API job and parse its answers.
+
+        Args:
+            batch_id: Id returned by ``submit_offline_batch``.
+            poll_interval: Seconds between status checks.
+            timeout: Seconds to wait before giving up.
+            sleep: Sleep function (injectable for tests).
+
+        Returns:
+            Custom id -> ParsedContactData (ids without an answer are left out).
+
+        Raises:
+            TimeoutError: If the job is not finished within ``timeout``.
+        """
+        waited = 0.0
+        batch = self.client.batches.retrieve(batch_id)
+        while batch.status not in self.BATCH_FINAL_STATES:
+            if waited >= timeout:
+                raise TimeoutError(f"OpenAI batch {batch_id} still {batch.status} after {timeout:.0f}s")
+            sleep(poll_interval)
+            waited += poll_interval
+            batch = self.client.batches.retrieve(batch_id)
+
+        log_event(
+            self.logger,
+            level=20 if batch.status == "completed" else 30,
+            message="OpenAI batch finished",
+            extra={"batch_id": batch_id, "status": batch.status},
+        )
+        if not batch.output_file_id:
+            return {}
+
+        results: Dict[str, ParsedContactData] = {}
+        for line in self.client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            answer = json.loads(line)
+            response = answer.get("response") or {}
+            body = response.get("body") or {}
+            if response.get("status_code") != 200:
+                error = answer.get("error") or body.get("error") or {}
+                results[answer["custom_id"]] = self._error_result(
+                    RuntimeError(error.get("message") or f"status {response.get('status_code')}")
                 )
-                # Truncate prompt to fit
-                max_chars = self.MAX_TOKENS * 4
-                prompt = prompt[:max_chars]
-
-            response = self.client.chat.completions.create(
-                model=self.MODEL,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a data extraction assistant. Extract contact information from HTML and return only valid JSON.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                max_tokens=self.MAX_OUTPUT_TOKENS,
-                temperature=0.1,  # Low temperature for consistent JSON output
-            )
+                continue
+            try:
+                content = _strip_code_fence(body["choices"][0]["message"]["content"])
+                tokens_used = (body.get("usage") or {}).get("prompt_tokens", 0)
+                results[answer["custom_id"]] = self._to_contact_data(json.loads(content), content, tokens_used)
+            except Exception as exc:
+                results[answer["custom_id"]] = self._error_result(exc)
+        return results
 
-            content = response.choices[0].message.content.strip()
+    def parse_html_batch(self, html_contents: List[str]) -> List[ParsedContactData]:
+        """Parse several contact pages with a single OpenAI call.
 
-            # Try to extract JSON from response (may have markdown code blocks)
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
+        Each page keeps its own token budget; the model answers with one JSON
+        object per page. A single page goes through ``parse_html``.
 
-            data = json.loads(content)
+        Args:
+            html_contents: Raw HTML content of each page.
 
-            # Parse emails (filter out generic ones)
-            emails = []
-            if isinstance(data.get("emails"), list):
-                for email in data.get("emails", []):
-                    if email and isinstance(email, str) and not self._is_generic_email(email):
-                        emails.append(email.lower().strip())
-
-            # Parse contacts
-            contacts = []
-            if isinstance(data.get("contacts"), list):
-                for contact in data.get("contacts", []):
-                    if not isinstance(contact, dict):
-                        continue
-                    name = contact.get("name", "").strip()
-                    if not name:
-                        continue
-
-                    email = contact.get("email")
-                    if email:
-                        email = email.strip().lower()
-                        if self._is_generic_email(email):
-                            email = None
-
-                    contacts.append(
-                        ContactInfo(
-                            name=name,
-                            title=contact.get("title"),
-                            email=email,
+        Returns:
+            One ParsedContactData per page, in the same order.
+        """
+        results: List[Optional[ParsedContactData]] = [None] * len(html_contents)
+        documents: List[Tuple[int, str, int]] = []  # (position, fitted HTML, HTML tokens)
+        for position, html_content in enumerate(html_contents):
+            if not html_content or not html_content.strip():
+                results[position] = ParsedContactData(emails=[], contacts=[], error="Empty HTML content")
+            else:
+                documents.append((position, *self._fit_html(html_content)))
+
+        if len(documents) == 1:
+            position = documents[0][0]
+            results[position] = self.parse_html(html_contents[position])
+        elif documents:
+            try:
+                prompt = self._build_batch_prompt([html for _, html, _ in documents])
+                body = {
+                    "model": self.MODEL,
+                    "messages": [
+                        {"role": "system", "content": self.SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt},
+                    ],
+                    "max_tokens": self.MAX_OUTPUT_TOKENS * len(documents),
+                    "temperature": 0.1,
+                    "response_format": {"type": "json_object"},
+                }
+                prompt_tokens = self._batch_template_tokens + sum(tokens for _, _, tokens in documents)
+                response = self._create_completion(body, prompt_tokens)
+                content = _strip_code_fence(response.choices[0].message.content)
+                data = json.loads(content)
+
+                answers: Dict[int, Dict[str, Any]] = {}
+                for answer in (data.get("documents") if isinstance(data, dict) else None) or []:
+                    if isinstance(answer, dict) and isinstance(answer.get("doc"), int):
+                        answers[answer["doc"]] = answer
+
+                # The batch template is shared by all pages
+                shared_tokens = self._batch_template_tokens // len(documents)
+                for number, (position, _, html_tokens) in enumerate(documents, start=1):
+                    answer = answers.get(number)
+                    if answer is None:
+                        results[position] = ParsedContactData(
+                            emails=[], contacts=[], error="MISSING_IN_BATCH_RESPONSE"
+                        )
+                    else:
+                        results[position] = self._to_contact_data(
+                            answer, json.dumps(answer, ensure_ascii=False), shared_tokens + html_tokens
                         )
+            except Exception as exc:
+                for position, _, _ in documents:
+                    results[position] = self._error_result(exc)
+
+        return results
+
+    def _to_contact_data(self, data: Dict[str, Any], raw_response: str, tokens_used: int) -> ParsedContactData:
+        """Build ParsedContactData from the model's JSON, dropping generic emails."""
+        # Parse emails (filter out generic ones)
+        emails = []
+        if isinstance(data.get("emails"), list):
+            for email in data.get("emails", []):
+                if email and isinstance(email, str) and not self._is_generic_email(email):
+                    emails.append(email.lower().strip())
+
+        # Parse contacts
+        contacts = []
+        if isinstance(data.get("contacts"), list):
+            for contact in data.get("contacts", []):
+                if not isinstance(contact, dict):
+                    continue
+                name = contact.get("name", "").strip()
+                if not name:
+                    continue
+
+                email = contact.get("email")
+                if email:
+                    email = email.strip().lower()
+                    if self._is_generic_email(email):
+                        email = None
+
+                contacts.append(
+                    ContactInfo(
+                        name=name,
+                        title=contact.get("title"),
+                        email=email,
                     )
+                )
 
-            return ParsedContactData(
-                emails=emails,
-                contacts=contacts,
-                raw_response=content,
-            )
+        return ParsedContactData(
+            emails=emails,
+            contacts=contacts,
+            raw_response=raw_response,
+            tokens_used=tokens_used,
+        )
 
-        except json.JSONDecodeError as exc:
+    def _error_result(self, exc: Exception) -> ParsedContactData:
+        """Log a failed parse and turn it into an error result."""
+        if isinstance(exc, json.JSONDecodeError):
             log_event(
                 self.logger,
                 level=40,
@@ -185,18 +466,27 @@ HTML content:
                 error=f"JSON_PARSE_ERROR: {str(exc)}",
             )
 
-        except Exception as exc:
-            log_event(
-                self.logger,
-                level=40,
-                message="OpenAI parsing failed",
-                extra={"error": str(exc)},
-            )
-            return ParsedContactData(
-                emails=[],
-                contacts=[],
-                error=f"OPENAI_ERROR: {str(exc)}",
-            )
+        log_event(
+            self.logger,
+            level=40,
+            message="OpenAI parsing failed",
+            extra={"error": str(exc)},
+        )
+        return ParsedContactData(
+            emails=[],
+            contacts=[],
+            error=f"OPENAI_ERROR: {str(exc)}",
+        )
+
+
+def _strip_code_fence(content: str) -> str:
+    """Extract the JSON payload from a response that may wrap it in markdown code blocks."""
+    content = content.strip()
+    if "```json" in content:
+        content = content.split("```json")[1].split("```")[0].strip()
+    elif "```" in content:
+        content = content.split("```")[1].split("```")[0].strip()
+    return content
 
 
 def load_openai_parser_from_config() -> Optional[OpenAIParser]:
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Dict, Any, List
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+import pandas as pd
 
 from .base import CIFResult, PhoneResult, PhoneValidation, BatchReport
 from .utils.logger import get_logger, log_event
@@ -14,6 +16,36 @@ import os
 import re
 
 
+# Columns produced by Tier1Enricher.enrich_lead on top of the input lead
+TIER1_OUTPUT_COLUMNS = (
+    "CIF",
+    "CIF_VALID",
+    "CIF_FORMAT_OK",
+    "RAZON_SOCIAL",
+    "RAZON_SOCIAL_SOURCE",
+    "PHONE",
+    "PHONE_VALID",
+    "PHONE_TYPE",
+    "PHONE_SOURCE",
+    "ENRICHMENT_TIMESTAMP",
+    "ERRORS",
+)
+
+# Lead columns read by Tier1Enricher.enrich_lead (and its error logging)
+TIER1_INPUT_COLUMNS = (
+    "CIF",
+    "CIF/NIF",
+    "CIF_NIF",
+    "NOMBRE_EMPRESA",
+    "NOMBRE CLIENTE",
+    "NOMBRE_CLIENTE",
+    "RAZON_SOCIAL",
+    "CIUDAD",
+    "POBLACIÓN CLIENTE",
+    "WEBSITE",
+)
+
+
 class Tier1Enricher:
     """Main orchestrator for Tier 1 enrichment (CIF, phone, razón social)."""
 
@@ -251,13 +283,56 @@ class Tier1Enricher:
     def enrich_batch(self, leads: List[Dict[str, Any]], progress_callback: callable = None, check_stop_callback: callable = None) -> BatchReport:
         """Enrich a batch of leads in place and return aggregate stats."""
 
+        def store(idx: int, enriched: Dict[str, Any]) -> None:
+            leads[idx] = enriched
+
+        return self._enrich_all(leads, len(leads), store, progress_callback, check_stop_callback)
+
+    def enrich_dataframe(
+        self,
+        df: pd.DataFrame,
+        progress_callback: callable = None,
+        check_stop_callback: callable = None,
+    ) -> Tuple[Dict[str, List[Any]], BatchReport]:
+        """Enrich every row of a DataFrame and return only the Tier1 output columns.
+
+        Only the columns listed in ``TIER1_INPUT_COLUMNS`` are fed to ``enrich_lead``
+        (straight from ``itertuples``), and results are written into per-column lists
+        allocated up front, so callers avoid a ``to_dict(orient="records")`` ->
+        ``pd.DataFrame(records)`` round-trip over every input column.
+
+        Returns:
+            Tuple of (output column -> values in row order, BatchReport).
+        """
+
+        total = len(df)
+        columns: Dict[str, List[Any]] = {col: [None] * total for col in TIER1_OUTPUT_COLUMNS}
+
+        def store(idx: int, enriched: Dict[str, Any]) -> None:
+            for col, values in columns.items():
+                values[idx] = enriched.get(col)
+
+        names = [col for col in TIER1_INPUT_COLUMNS if col in df.columns]
+        leads = (dict(zip(names, row)) for row in df[names].itertuples(index=False, name=None))
+        report = self._enrich_all(leads, total, store, progress_callback, check_stop_callback)
+        return columns, report
+
+    def _enrich_all(
+        self,
+        leads: Iterable[Dict[str, Any]],
+        total: int,
+        store: Callable[[int, Dict[str, Any]], None],
+        progress_callback: callable = None,
+        check_stop_callback: callable = None,
+    ) -> BatchReport:
+        """Enrich leads one by one, handing each result to ``store``."""
+
         try:
             from tqdm import tqdm  # type: ignore[import]
-            iterator = tqdm(leads, desc="Tier1 enrichment")
+            iterator = tqdm(leads, desc="Tier1 enrichment", total=total)
         except Exception:  # pragma: no cover - optional dependency
             iterator = leads
 
-        total = len(leads)
         cif_validated = 0
         phone_found = 0
         errors: List[str] = []
@@ -269,7 +344,7 @@ class Tier1Enricher:
                 raise KeyboardInterrupt("Processing stopped by user")
             
             enriched = self.enrich_lead(lead)
-            leads[idx] = enriched
+            store(idx, enriched)
             if enriched.get("CIF_VALID"):
                 cif_validated += 1
             if enriched.get("PHONE"):
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import json
 import os
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict
+from typing import Callable, Dict, Optional
 
 from .logger import get_logger, log_event
 
@@ -105,3 +107,59 @@ class RateLimiter:
 
         return True
 
+
+
+class TokenBucket:
+    """Thread-safe token bucket for per-minute API budgets (requests or tokens).
+
+    ``rate`` units are added every ``period`` seconds, up to ``capacity``.
+    ``acquire`` takes units right away when available and otherwise sleeps the
+    caller until the bucket has refilled; callers queue up in order because
+    each reservation is taken before sleeping (the balance may go negative).
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        period: float = 60.0,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Units allowed per ``period`` (e.g. requests or tokens per minute).
+            period: Refill period in seconds.
+            capacity: Maximum burst (default: ``rate``).
+            clock: Monotonic time source (injectable for tests).
+            sleep: Sleep function (injectable for tests).
+        """
+        self.rate = rate
+        self.period = period
+        self.capacity = capacity if capacity is not None else rate
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._available = self.capacity
+        self._updated = clock()
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """Take ``amount`` units, waiting for them if needed.
+
+        Args:
+            amount: Units needed by the call (1 request, or its token estimate).
+
+        Returns:
+            Seconds waited.
+        """
+        with self._lock:
+            now = self._clock()
+            refill = (now - self._updated) * self.rate / self.period
+            self._available = min(self.capacity, self._available + refill)
+            self._updated = now
+            self._available -= amount
+            wait = -self._available * self.period / self.rate if self._available < 0 else 0.0
+        if wait > 0:
+            self._sleep(wait)
+        return wait
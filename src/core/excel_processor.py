@@ -1,8 +1,9 @@
 """Excel file processor with format preservation."""
 
 import logging
+from contextlib import suppress
 from pathlib import Path
-from typing import Tuple, Dict, Any, List
+from typing import Tuple, Dict, Any, List, Optional
 from copy import copy
 import pandas as pd
 from openpyxl import load_workbook
@@ -204,6 +205,7 @@ def write_excel(
     output_path: Path,
     preserve_format: bool = True,
     force_tier2: bool = False,
+    errors: Optional[List[Dict[str, Any]]] = None,
 ) -> None:
     """Write DataFrame to Excel with 3 sheets: BBDD ORIGINAL, HIGHLIGHT, DATOS_TÉCNICOS.
 
@@ -212,6 +214,8 @@ def write_excel(
         metadata: Metadata from read_excel (includes original filepath).
         output_path: Path for output Excel file.
         preserve_format: Whether to preserve original formatting (only for HOJA 1).
+        errors: Optional error records ({row, field, error}) written to an
+            extra "Errores" sheet in the same save.
     """
     logger.info(f"Writing Excel file with 3 sheets: {output_path}")
 
@@ -626,140 +630,158 @@ def write_excel(
     # ============================================
     # Escribir df_highlight normalmente (headers en fila 1, data en fila 2+)
     # Luego insertaremos el summary en fila 1 y moveremos todo hacia abajo
-    with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+    # The writer is saved only once, after formatting its in-memory workbook
+    writer = pd.ExcelWriter(output_path, engine='openpyxl')
+    try:
         df_highlight.to_excel(writer, sheet_name='LEADS ENRIQUECIDOS', index=False)
         df_original.to_excel(writer, sheet_name='BBDD ORIGINAL', index=False)
     
-    # Now apply formatting
-    wb = load_workbook(output_path)
+        # Now apply formatting
+        wb = writer.book
     
-    # ============================================
-    # Format HOJA 1: Preserve original format (then apply COLOR fills)
-    # ============================================
-    ws_original = wb['BBDD ORIGINAL']
+        # ============================================
+        # Format HOJA 1: Preserve original format (then apply COLOR fills)
+        # ============================================
+        ws_original = wb['BBDD ORIGINAL']
     
-    if preserve_format and "filepath" in metadata:
-        original_path = metadata["filepath"]
-        original_path_obj = Path(original_path) if isinstance(original_path, str) else original_path
+        if preserve_format and "filepath" in metadata:
+            original_path = metadata["filepath"]
+            original_path_obj = Path(original_path) if isinstance(original_path, str) else original_path
         
-        try:
-            if original_path_obj.exists():
-                wb_source = load_workbook(original_path_obj)
-                ws_source = wb_source.active
-                
-                # Copy header formatting
-                for col_idx in range(1, min(len(hoja1_columns) + 1, ws_source.max_column + 1)):
-                    cell = ws_original.cell(row=1, column=col_idx)
-                    if col_idx <= ws_source.max_column:
-                        orig_cell = ws_source.cell(row=1, column=col_idx)
-                        try:
-                            if orig_cell.fill and orig_cell.fill.patternType:
-                                cell.fill = PatternFill(
-                                    start_color=orig_cell.fill.start_color,
-                                    end_color=orig_cell.fill.end_color,
-                                    fill_type=orig_cell.fill.fill_type
-                                )
-                        except Exception:
-                            pass
-                        try:
-                            if orig_cell.font:
-                                cell.font = orig_cell.font.copy()
-                        except Exception:
-                            pass
+            try:
+                if original_path_obj.exists():
+                    wb_source = load_workbook(original_path_obj)
+                    ws_source = wb_source.active
                 
-                # Copy data row formatting (use row 2 as template) - BUT skip fill (we'll apply COLOR-based fills)
-                original_columns_count = len(original_columns)
-                for row_idx in range(2, ws_original.max_row + 1):
-                    for col_idx in range(1, len(hoja1_columns) + 1):
-                        cell = ws_original.cell(row=row_idx, column=col_idx)
-                        if col_idx <= original_columns_count and ws_source.max_row >= 2:
+                    # Copy header formatting
+                    for col_idx in range(1, min(len(hoja1_columns) + 1, ws_source.max_column + 1)):
+                        cell = ws_original.cell(row=1, column=col_idx)
+                        if col_idx <= ws_source.max_column:
+                            orig_cell = ws_source.cell(row=1, column=col_idx)
+                            try:
+                                if orig_cell.fill and orig_cell.fill.patternType:
+                                    cell.fill = PatternFill(
+                                        start_color=orig_cell.fill.start_color,
+                                        end_color=orig_cell.fill.end_color,
+                                        fill_type=orig_cell.fill.fill_type
+                                    )
+                            except Exception:
+                                pass
                             try:
-                                orig_cell = ws_source.cell(row=2, column=col_idx)
-                                if orig_cell.has_style:
-                                    cell.font = copy(orig_cell.font)
-                                    # Skip fill - we'll apply COLOR-based fills below
-                                    cell.border = copy(orig_cell.border)
-                                    cell.alignment = copy(orig_cell.alignment)
-                                    cell.number_format = orig_cell.number_format
+                                if orig_cell.font:
+                                    cell.font = orig_cell.font.copy()
                             except Exception:
                                 pass
                 
-                wb_source.close()
-        except Exception as e:
-            logger.warning(f"Could not preserve format for HOJA 1: {e}")
-    
-    # Apply COLOR-based background colors AFTER preserving other formatting
-    # Find COLOR column index
-    color_col_idx = None
-    for idx, col_name in enumerate(hoja1_columns, start=1):
-        if col_name == "COLOR":
-            color_col_idx = idx
-            break
-    
-    # Define color mappings - SIMPLE colors (ARGB format for openpyxl)
-    color_fills = {
-        "VERDE": PatternFill(start_color="FF90EE90", end_color="FF90EE90", fill_type="solid"),  # Light green - Datos nuevos
-        "AMARILLO": PatternFill(start_color="FFFFEB9C", end_color="FFFFEB9C", fill_type="solid"),  # Light yellow - Prioritario sin datos
-        "GRIS": PatternFill(start_color="FFD9D9D9", end_color="FFD9D9D9", fill_type="solid"),  # Light gray - No prioritario
-        "ROJO": PatternFill(start_color="FFFFC7CE", end_color="FFFFC7CE", fill_type="solid"),  # Light red - Ignorado
-    }
-    
-    # Apply background colors to entire rows based on COLOR column
-    if color_col_idx:
-        logger.info(f"Applying COLOR-based background fills to HOJA 1 (COLOR column at index {color_col_idx})")
-        for row_idx in range(2, ws_original.max_row + 1):  # Start from row 2 (skip header)
-            color_cell = ws_original.cell(row=row_idx, column=color_col_idx)
-            color_value = str(color_cell.value or "").strip()
+                    # Copy data row formatting (use row 2 as template) - BUT skip fill (we'll apply COLOR-based fills)
+                    original_columns_count = len(original_columns)
+                    for row_idx in range(2, ws_original.max_row + 1):
+                        for col_idx in range(1, len(hoja1_columns) + 1):
+                            cell = ws_original.cell(row=row_idx, column=col_idx)
+                            if col_idx <= original_columns_count and ws_source.max_row >= 2:
+                                try:
+                                    orig_cell = ws_source.cell(row=2, column=col_idx)
+                                    if orig_cell.has_style:
+                                        cell.font = copy(orig_cell.font)
+                                        # Skip fill - we'll apply COLOR-based fills below
+                                        cell.border = copy(orig_cell.border)
+                                        cell.alignment = copy(orig_cell.alignment)
+                                        cell.number_format = orig_cell.number_format
+                                except Exception:
+                                    pass
+                
+                    wb_source.close()
+            except Exception as e:
+                logger.warning(f"Could not preserve format for HOJA 1: {e}")
+    
+        # Apply COLOR-based background colors AFTER preserving other formatting
+        # Find COLOR column index
+        color_col_idx = None
+        for idx, col_name in enumerate(hoja1_columns, start=1):
+            if col_name == "COLOR":
+                color_col_idx = idx
+                break
+    
+        # Define color mappings - SIMPLE colors (ARGB format for openpyxl)
+        color_fills = {
+            "VERDE": PatternFill(start_color="FF90EE90", end_color="FF90EE90", fill_type="solid"),  # Light green - Datos nuevos
+            "AMARILLO": PatternFill(start_color="FFFFEB9C", end_color="FFFFEB9C", fill_type="solid"),  # Light yellow - Prioritario sin datos
+            "GRIS": PatternFill(start_color="FFD9D9D9", end_color="FFD9D9D9", fill_type="solid"),  # Light gray - No prioritario
+            "ROJO": PatternFill(start_color="FFFFC7CE", end_color="FFFFC7CE", fill_type="solid"),  # Light red - Ignorado
+        }
+    
+        # Apply background colors to entire rows based on COLOR column
+        if color_col_idx:
+            logger.info(f"Applying COLOR-based background fills to HOJA 1 (COLOR column at index {color_col_idx})")
+            for row_idx in range(2, ws_original.max_row + 1):  # Start from row 2 (skip header)
+                color_cell = ws_original.cell(row=row_idx, column=color_col_idx)
+                color_value = str(color_cell.value or "").strip()
             
-            if color_value in color_fills:
-                fill = color_fills[color_value]
-                # Apply fill to entire row
-                for col_idx in range(1, ws_original.max_column + 1):
-                    cell = ws_original.cell(row=row_idx, column=col_idx)
-                    cell.fill = fill
-    
-    # Auto-adjust widths for HOJA 1
-    _auto_adjust_column_widths(ws_original)
-    
-    # ============================================
-    # Format HOJA 2: Headers bold, clean white background, summary row
-    # ============================================
-    ws_highlight = wb['LEADS ENRIQUECIDOS']
-    
-    # Insert summary row at the top (row 1) - esto mueve headers a fila 2
-    from openpyxl.styles import Alignment
-    summary_fill = PatternFill(start_color="FFE6E6FA", end_color="FFE6E6FA", fill_type="solid")  # Lavender
-    
-    # Insert a new row 1 for summary (moves everything down: headers to row 2, data to row 3+)
-    ws_highlight.insert_rows(1)
-    
-    # Merge cells in row 1 for summary (span all columns)
-    num_cols = len(list(df_highlight.columns))
-    ws_highlight.merge_cells(start_row=1, start_column=1, end_row=1, end_column=num_cols)
-    summary_cell = ws_highlight.cell(row=1, column=1)
-    summary_cell.value = summary_text
-    summary_cell.fill = summary_fill
-    summary_cell.font = Font(bold=True, size=11)
-    summary_cell.alignment = Alignment(horizontal='left', vertical='center')
-    
-    # Make headers bold (row 2, since row 1 is summary) and add background color
-    header_fill = PatternFill(start_color="FFD3D3D3", end_color="FFD3D3D3", fill_type="solid")  # Light gray
-    header_row = 2  # Headers están en fila 2 después de insertar summary en fila 1
-    for col_idx in range(1, num_cols + 1):
-        cell = ws_highlight.cell(row=header_row, column=col_idx)
-        if cell.value:  # Solo formatear si tiene valor (es un header)
-            cell.font = Font(bold=True, size=10)
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-    
-    logger.info(f"LEADS ENRIQUECIDOS: Summary in row 1, Headers in row 2, Data starts in row 3")
-    
-    # Auto-adjust widths
-    _auto_adjust_column_widths(ws_highlight)
-    
-    # Save workbook (only 2 sheets now: LEADS ENRIQUECIDOS and BBDD ORIGINAL)
-    wb.save(output_path)
-    wb.close()
+                if color_value in color_fills:
+                    fill = color_fills[color_value]
+                    # Apply fill to entire row
+                    for col_idx in range(1, ws_original.max_column + 1):
+                        cell = ws_original.cell(row=row_idx, column=col_idx)
+                        cell.fill = fill
+    
+        # Auto-adjust widths for HOJA 1
+        _auto_adjust_column_widths(ws_original)
+    
+        # ============================================
+        # Format HOJA 2: Headers bold, clean white background, summary row
+        # ============================================
+        ws_highlight = wb['LEADS ENRIQUECIDOS']
+    
+        # Insert summary row at the top (row 1) - esto mueve headers a fila 2
+        from openpyxl.styles import Alignment
+        summary_fill = PatternFill(start_color="FFE6E6FA", end_color="FFE6E6FA", fill_type="solid")  # Lavender
+    
+        # Insert a new row 1 for summary (moves everything down: headers to row 2, data to row 3+)
+        ws_highlight.insert_rows(1)
+    
+        # Merge cells in row 1 for summary (span all columns)
+        num_cols = len(list(df_highlight.columns))
+        ws_highlight.merge_cells(start_row=1, start_column=1, end_row=1, end_column=num_cols)
+        summary_cell = ws_highlight.cell(row=1, column=1)
+        summary_cell.value = summary_text
+        summary_cell.fill = summary_fill
+        summary_cell.font = Font(bold=True, size=11)
+        summary_cell.alignment = Alignment(horizontal='left', vertical='center')
+    
+        # Make headers bold (row 2, since row 1 is summary) and add background color
+        header_fill = PatternFill(start_color="FFD3D3D3", end_color="FFD3D3D3", fill_type="solid")  # Light gray
+        header_row = 2  # Headers están en fila 2 después de insertar summary en fila 1
+        for col_idx in range(1, num_cols + 1):
+            cell = ws_highlight.cell(row=header_row, column=col_idx)
+            if cell.value:  # Solo formatear si tiene valor (es un header)
+                cell.font = Font(bold=True, size=10)
+                cell.fill = header_fill
+                cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+    
+        logger.info(f"LEADS ENRIQUECIDOS: Summary in row 1, Headers in row 2, Data starts in row 3")
+    
+        # Auto-adjust widths
+        _auto_adjust_column_widths(ws_highlight)
+    
+        # ============================================
+        # Errores sheet (only when there are errors)
+        # ============================================
+        if errors:
+            logger.info(f"Writing {len(errors)} errors to Excel sheet...")
+            ws_errors = wb.create_sheet("Errores")
+            error_columns = list(dict.fromkeys(key for error in errors for key in error))
+            ws_errors.append(error_columns)
+            for error in errors:
+                ws_errors.append([error.get(col) for col in error_columns])
+    except Exception:
+        # Do not leave a truncated .xlsx behind
+        with suppress(Exception):
+            writer.close()
+        Path(output_path).unlink(missing_ok=True)
+        raise
+
+    # Save workbook (LEADS ENRIQUECIDOS, BBDD ORIGINAL and optionally Errores)
+    writer.close()
     
     logger.info(f"Excel file written with 2 sheets (LEADS ENRIQUECIDOS, BBDD ORIGINAL): {output_path}")
 
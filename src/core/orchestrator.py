@@ -1,29 +1,184 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import Tuple, Dict, Any, List
+from typing import Tuple, Dict, Any, List, Literal, Optional, Sequence
+import json
+import logging
 import os
 import re
 import asyncio
 
+import numpy as np
 import pandas as pd
 
 from src.core.priority_engine import PriorityEngine
 from src.api_manager.tier1_enricher import Tier1Enricher
 from src.api_manager.base import BatchReport
-from src.enrichers.tier2_enricher import Tier2Enricher, Tier2BatchReport
+from src.enrichers.tier2_enricher import Tier2Enricher, Tier2BatchReport, TIER2_OUTPUT_COLUMNS
 from src.enrichers.tier3_enricher import Tier3Enricher
 from src.tier1.cif_validator import CifValidator
 from src.tier1.phone_validator import PhoneValidator
-from src.validators.email_batch_validator import validate_all_emails
-from src.validators.phone_batch_validator import validate_all_phones
-from src.validators.cif_batch_validator import revalidate_cifs
+from src.validators.email_batch_validator import EMAIL_VALIDATION_COLUMNS, validate_all_emails
+from src.validators.phone_batch_validator import PHONE_VALIDATION_COLUMNS, validate_all_phones
+from src.validators.cif_batch_validator import CIF_VALIDATION_COLUMNS, revalidate_cifs
 from src.core.scoring_engine import ScoringEngine
 from src.utils.logger import setup_logger
 from src.utils.config_loader import load_yaml_config
 
 logger = setup_logger()
 
+# PHONE_SOURCE values meaning Tier1 did not find a usable phone
+_EMPTY_PHONE_SOURCES = frozenset({"NOT_FOUND", "error", ""})
+
+# Phone and email patterns extracted from Tavily results
+_TAVILY_PHONE_RE = re.compile(r'(?:\+34|34)?[\s.-]?([6-9]\d{8})')
+_TAVILY_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
+# Placeholder/generic emails discarded from Tavily results
+_BAD_EMAIL_RE = re.compile(r"example|test|no-?reply|info@|contact@|hello@", re.IGNORECASE)
+
+# Columns holding the company name, in order of preference
+_COMPANY_NAME_COLUMNS = ("NOMBRE CLIENTE", "NOMBRE_CLIENTE", "RAZON_SOCIAL", "NOMBRE_EMPRESA")
+
+# Low-cardinality label columns stored as categoricals once fully written
+_CATEGORICAL_COLUMNS = (
+    "ENRICHMENT_STATUS",
+    "TIER1_STATUS",
+    "TIER2_STATUS",
+    "TIER3_STATUS",
+    "DATA_QUALITY",
+    "PHONE_SOURCE",
+    "PHONE_TYPE",
+    "RAZON_SOCIAL_SOURCE",
+    "EMAIL_VALIDATION_LEVEL",
+    "WEBSITE_SOURCE",
+    "CNAE_SOURCE",
+)
+
+# Stripped values meaning nothing was found, per kind of column
+_SENTINELS = {
+    "EMAIL": ("", "NO_EMAIL_FOUND", "NOT_FOUND"),
+    "CONTACT": ("", "NOT_FOUND", "NO_CONTACT_FOUND"),
+}
+
+
+def _record_error(errors: Optional[List[Dict[str, Any]]], row: Any, field: str, error: Any) -> None:
+    """Append a ``{row, field, error}`` entry to ``errors`` (no-op when not collecting)."""
+    if errors is not None:
+        errors.append({"row": row, "field": field, "error": str(error)})
+
+
+def _row_errors(df: pd.DataFrame, column: str, field: str) -> List[Dict[str, Any]]:
+    """One ``{row, field, error}`` entry per row whose ``column`` holds error text.
+
+    Args:
+        df: DataFrame with a per-row error column (e.g. ERRORS, TIER2_ERRORS).
+        column: Error column to read.
+        field: Stage reported in the ``field`` key.
+
+    Returns:
+        Error entries in row order (empty if the column is missing).
+    """
+    if column not in df.columns:
+        return []
+    text = _str_array(df[column])
+    has_error = text != ""
+    return [
+        {"row": row, "field": field, "error": error}
+        for row, error in zip(df.index[has_error].tolist(), text[has_error].tolist())
+    ]
+
+
+def _str_array(values: pd.Series) -> np.ndarray:
+    """Return values as a stripped NumPy unicode array (None/NaN become "").
+
+    Args:
+        values: Series to convert.
+
+    Returns:
+        NumPy array of stripped strings.
+    """
+    return np.char.strip(values.fillna("").astype(str).to_numpy(dtype=str))
+
+
+def _to_categorical(df: pd.DataFrame, columns: Sequence[str]) -> None:
+    """Convert the given label columns (when present) to ``category`` dtype in place.
+
+    Only call this once the columns are final: assigning a value that is not
+    already a category raises.
+
+    Args:
+        df: DataFrame to update in place.
+        columns: Candidate column names.
+    """
+    for column in columns:
+        if column in df.columns:
+            df[column] = df[column].astype("category")
+
+
+def _has_value(values: pd.Series, sentinels: Sequence[str]) -> np.ndarray:
+    """Return True where the stripped value is not one of ``sentinels``.
+
+    Args:
+        values: Series to check (None/NaN count as "").
+        sentinels: Placeholder values meaning nothing was found.
+
+    Returns:
+        Boolean NumPy array.
+    """
+    return ~np.isin(_str_array(values), sentinels)
+
+
+def _coalesce_text(df: pd.DataFrame, columns: Sequence[str]) -> pd.Series:
+    """Return the first non-blank stripped value across ``columns`` for each row.
+
+    Args:
+        df: Input DataFrame (missing columns are ignored).
+        columns: Column names in order of preference.
+
+    Returns:
+        Series of strings ("" when every column is blank).
+    """
+    result = pd.Series("", index=df.index, dtype=object)
+    for col in columns:
+        if col in df.columns:
+            values = df[col].fillna("").astype(str).str.strip()
+            result = result.where(result != "", values)
+    return result
+
+
+def _fill_blank(df: pd.DataFrame, index: pd.Index, column: str, value: str) -> None:
+    """Set ``column`` to ``value`` for rows in ``index`` where it is None/NaN/blank.
+
+    Args:
+        df: DataFrame to update in place.
+        index: Row labels to consider.
+        column: Column to fill.
+        value: Placeholder value for blank cells.
+    """
+    values = df.loc[index, column]
+    blank_mask = values.isna() | (values.astype(str).str.strip() == "")
+    df.loc[index[blank_mask.to_numpy()], column] = value
+
+
+def _append_enrichment_notes(df: pd.DataFrame, index: pd.Index, notes: Any) -> None:
+    """Append notes to ENRICHMENT_NOTES for the given rows, joined with " | ".
+
+    Args:
+        df: DataFrame with an ENRICHMENT_NOTES column (modified in place).
+        index: Row labels to update.
+        notes: A single note or an array with one note per row in ``index``.
+    """
+    if len(index) == 0:
+        return
+    current = df.loc[index, "ENRICHMENT_NOTES"]
+    has_notes = (current.notna() & (current.astype(str) != "")).to_numpy()
+    new_notes = np.broadcast_to(np.asarray(notes, dtype=object), (len(index),))
+    joined = current.astype(str).to_numpy(dtype=object) + " | " + new_notes
+    df.loc[index, "ENRICHMENT_NOTES"] = np.where(has_notes, joined, new_notes)
+
 
 def run_pipeline(
     df: pd.DataFrame,
@@ -31,19 +186,22 @@ def run_pipeline(
     config_path: str = "config/tier1_config.yaml",
     progress_callback: callable = None,
     check_stop_callback: callable = None,
+    errors: Optional[List[Dict[str, Any]]] = None,
 ) -> Tuple[pd.DataFrame, BatchReport]:
     """Run full pipeline: priority + Tier1 enrichment.
 
     This function expects a DataFrame with the temporary column ``_IS_RED_ROW``
     already present (as produced by ``read_excel``). Red rows are skipped for
-    processing but preserved in the output.
+    processing but preserved in the output. Tier1 columns that cannot be
+    written back are reported in ``errors`` (``{row, field, error}`` dicts).
     """
 
     df_result = df.copy()
 
     # Filter out red rows for processing (but keep them marked in df_result)
     mask_process = ~df_result.get("_IS_RED_ROW", False)
-    df_process = df_result[mask_process].copy()
+    # Boolean indexing already returns a new frame; df_process is only read
+    df_process = df_result[mask_process]
 
     logger.info(
         "Core orchestrator: processing %d rows (skipping %d red rows)",
@@ -75,50 +233,71 @@ def run_pipeline(
     logger.info("Running Tier1 enrichment (phone finder + company name)...")
     enricher = Tier1Enricher(config_path=config_path)
 
-    records = df_process.to_dict(orient="records")
-    total_leads = len(records)
-    
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
     # Log sample record before enrichment for debugging
-    if records:
-        sample = records[0]
-        logger.debug(f"BEFORE Tier1: Sample record keys: {list(sample.keys())}")
+    if debug_enabled and len(df_process):
+        sample = df_process.iloc[0]
+        logger.debug(f"BEFORE Tier1: Sample record keys: {list(sample.index)}")
         logger.debug(f"BEFORE Tier1: CIF/NIF={sample.get('CIF/NIF')}, CIF={sample.get('CIF')}, "
                      f"TELEFONO 1={sample.get('TELEFONO 1')}, NOMBRE CLIENTE={sample.get('NOMBRE CLIENTE')}")
     
-    # Enrich with progress callback (now passed to enrich_batch)
-    batch_report = enricher.enrich_batch(records, progress_callback=progress_callback, check_stop_callback=check_stop_callback)
+    # Enrich with progress callback; only the Tier1 output columns come back
+    tier1_columns, batch_report = enricher.enrich_dataframe(
+        df_process,
+        progress_callback=progress_callback,
+        check_stop_callback=check_stop_callback,
+    )
 
     # Log sample record after enrichment for debugging
-    if records:
-        sample = records[0]
-        logger.debug(f"AFTER Tier1: Sample record keys: {list(sample.keys())}")
+    if debug_enabled and len(df_process):
+        sample = {col: values[0] for col, values in tier1_columns.items()}
         logger.debug(f"AFTER Tier1: CIF={sample.get('CIF')}, PHONE={sample.get('PHONE')}, "
                      f"RAZON_SOCIAL={sample.get('RAZON_SOCIAL')}, CIF_VALID={sample.get('CIF_VALID')}")
 
     # Bring enriched columns back into the main DataFrame
-    df_enriched = pd.DataFrame(records)
-    indices = df_process.index.to_list()
-    
-    logger.info(f"Tier1 enriched DataFrame columns: {list(df_enriched.columns)}")
-    logger.info(f"Tier1 enriched DataFrame shape: {df_enriched.shape}")
-
-    # Update enriched columns, but NEVER touch OBSERVACIONES (must remain exactly as input)
-    for col in df_enriched.columns:
-        if col != "OBSERVACIONES":  # OBSERVACIONES is NEVER modified
-            if col not in df_result.columns:
-                df_result[col] = None  # Initialize column if it doesn't exist
-                logger.info(f"Initialized new column: {col}")
+    indices = df_process.index
+    logger.info(f"Tier1 enriched columns: {list(tier1_columns)}")
+
+    # Update enriched columns, but NEVER touch OBSERVACIONES (must remain exactly as input).
+    # Missing columns are added together and all values are written in one assignment.
+    update_columns = [col for col in tier1_columns if col != "OBSERVACIONES"]
+    existing_columns = set(df_result.columns)
+    new_columns = [col for col in update_columns if col not in existing_columns]
+    if new_columns:
+        df_result = df_result.assign(**dict.fromkeys(new_columns))
+    try:
+        df_result.loc[indices, update_columns] = pd.DataFrame(
+            {col: tier1_columns[col] for col in update_columns}, index=indices
+        )
+    except Exception as e:
+        # Fall back to one assignment per column so a bad column only loses itself
+        logger.warning("Bulk Tier1 column update failed (%r), updating column by column", e)
+        for col in update_columns:
             try:
-                df_result.loc[indices, col] = df_enriched[col].values
-                non_null_count = df_enriched[col].notna().sum()
-                if non_null_count > 0:
-                    logger.info(f"Updated column {col}: {non_null_count}/{len(indices)} non-null values")
-                    # Log sample values
-                    sample_values = df_enriched[col].dropna().head(2).tolist()
-                    logger.info(f"  Sample values in {col}: {sample_values}")
-            except Exception as e:
-                logger.error(f"Error updating column {col}: {e}", exc_info=True)
-    
+                df_result.loc[indices, col] = tier1_columns[col]
+            except Exception as col_error:
+                logger.error("Error updating column %s: %r", col, col_error)
+                logger.debug("Column update traceback", exc_info=True)
+                _record_error(errors, "N/A", col, col_error)
+
+    # Per-column stats are only computed when DEBUG logging is enabled
+    if debug_enabled:
+        for col in update_columns:
+            col_values = pd.Series(tier1_columns[col], dtype=object)
+            non_null_count = col_values.notna().sum()
+            if non_null_count > 0:
+                sample_values = col_values.dropna().head(2).tolist()
+                logger.debug(
+                    f"Updated column {col}: {non_null_count}/{len(indices)} non-null values, "
+                    f"sample: {sample_values}"
+                )
+
+    logger.info(
+        "Tier1 updated %d columns (%d new)",
+        len(tier1_columns),
+        len(new_columns),
+    )
     logger.info(f"df_result columns after Tier1: {list(df_result.columns)}")
     logger.info(f"df_result shape after Tier1: {df_result.shape}")
 
@@ -176,24 +355,13 @@ def run_tier2_enrichment(
     
     logger.info(f"Tier2 mask true count: {mask_tier2.sum()} / {len(mask_tier2)} (force={force_tier2})")
     
-    # Use .loc for boolean indexing
-    df_tier2 = df_result.loc[mask_tier2].copy()
+    # Use .loc for boolean indexing (already a new frame, only read below)
+    df_tier2 = df_result.loc[mask_tier2]
 
     if len(df_tier2) == 0:
         logger.info("No leads with priority>=2, skipping Tier2 enrichment")
         # Initialize Tier2 columns with None
-        for col in [
-            "EMAIL_SPECIFIC",
-            "EMAIL_VALID",
-            "CONTACT_NAME",
-            "CONTACT_TITLE",
-            "LINKEDIN_COMPANY",
-            "EMAIL_RESEARCHED",
-            "EMAIL_SOURCE",
-            "EMAIL_CONFIDENCE",
-            "RESEARCH_NOTES",
-            "TIER2_ERRORS",
-        ]:
+        for col in TIER2_OUTPUT_COLUMNS:
             df_result[col] = None
         return df_result, Tier2BatchReport(
             total=0,
@@ -211,37 +379,24 @@ def run_tier2_enrichment(
     if "OBSERVACIONES" not in df_result.columns:
         df_result["OBSERVACIONES"] = ""
 
-    # Run Tier2 enrichment
+    # Run Tier2 enrichment; only the Tier2 output columns come back
     tier2_enricher = Tier2Enricher(config_path=tier2_config_path)
-    records = df_tier2.to_dict(orient="records")
-    tier2_report = tier2_enricher.enrich_batch(records, enable_email_research=enable_email_research)
-
-    # Bring enriched columns back into main DataFrame
-    df_tier2_enriched = pd.DataFrame(records)
-    indices = df_tier2.index.to_list()
+    try:
+        tier2_columns, tier2_report = tier2_enricher.enrich_dataframe(
+            df_tier2, enable_email_research=enable_email_research
+        )
+    finally:
+        tier2_enricher.close()
 
     # Initialize columns for all rows
-    tier2_columns = [
-        "EMAIL_SPECIFIC",
-        "EMAIL_VALID",
-        "CONTACT_NAME",
-        "CONTACT_TITLE",
-        "LINKEDIN_COMPANY",
-        "EMAIL_RESEARCHED",
-        "EMAIL_SOURCE",
-        "EMAIL_CONFIDENCE",
-        "RESEARCH_NOTES",
-        "TIER2_ERRORS",
-    ]
-    for col in tier2_columns:
+    for col in TIER2_OUTPUT_COLUMNS:
         if col not in df_result.columns:
             df_result[col] = None
 
     # Update only Tier2 rows
     # NOTE: OBSERVACIONES is NEVER modified - all Tier2 info is in separate columns
-    for col in df_tier2_enriched.columns:
-        if col in tier2_columns:
-            df_result.loc[indices, col] = df_tier2_enriched[col].values
+    for col, values in tier2_columns.items():
+        df_result.loc[df_tier2.index, col] = values
 
     return df_result, tier2_report
 
@@ -250,6 +405,7 @@ def run_tavily_complementary_search(
     df: pd.DataFrame,
     progress_callback: callable = None,
     check_stop_callback: callable = None,
+    errors: Optional[List[Dict[str, Any]]] = None,
 ) -> pd.DataFrame:
     """Run complementary Tavily search for PRIORITY >= 2 leads.
     
@@ -261,6 +417,7 @@ def run_tavily_complementary_search(
     
     Args:
         df: DataFrame with PRIORITY, PHONE, PHONE_SOURCE columns.
+        errors: If given, failed searches are appended as ``{row, field, error}``.
         
     Returns:
         DataFrame with updated PHONE, PHONE_SOURCE, EMAIL_FOUND, EMAIL_SOURCE columns.
@@ -278,6 +435,7 @@ def run_tavily_complementary_search(
         tavily_client = TavilyClient(api_key=tavily_key)
     except Exception as e:
         logger.warning(f"Could not initialize Tavily client: {e}")
+        _record_error(errors, "N/A", "TAVILY", e)
         return df_result
     
     # Filter to PRIORITY >= 2 leads
@@ -285,7 +443,7 @@ def run_tavily_complementary_search(
     red_mask = (df_result.get("_IS_RED_ROW", pd.Series(False, index=df_result.index)) == False)
     mask_priority = priority_mask & red_mask
     
-    df_priority = df_result.loc[mask_priority].copy()
+    df_priority = df_result.loc[mask_priority]
     
     if len(df_priority) == 0:
         logger.info("No leads with PRIORITY >= 2, skipping complementary Tavily search")
@@ -299,39 +457,40 @@ def run_tavily_complementary_search(
     if "EMAIL_SOURCE" not in df_result.columns:
         df_result["EMAIL_SOURCE"] = None
     
-    # Prepare leads for batch processing
-    leads_to_process = []
-    for idx, row in df_priority.iterrows():
-        company_name = (
-            str(row.get("NOMBRE CLIENTE", "") or "").strip() or
-            str(row.get("NOMBRE_CLIENTE", "") or "").strip() or
-            str(row.get("RAZON_SOCIAL", "") or "").strip() or
-            str(row.get("NOMBRE_EMPRESA", "") or "").strip() or
-            ""
+    # Check if we need phone (Google didn't find it), computed once for all rows
+    if "PHONE" in df_priority.columns:
+        phone_col = df_priority["PHONE"].astype("string")
+        phone_missing = phone_col.isna() | (phone_col.fillna("").str.len() == 0)
+    else:
+        phone_missing = pd.Series(True, index=df_priority.index)
+    if "PHONE_SOURCE" in df_priority.columns:
+        phone_source_empty = (
+            df_priority["PHONE_SOURCE"].astype("string").fillna("").str.strip().isin(_EMPTY_PHONE_SOURCES)
         )
-        
-        if not company_name:
-            continue
-        
-        # Check if we need phone (Google didn't find it)
-        phone = row.get("PHONE")
-        phone_source = str(row.get("PHONE_SOURCE", "") or "").strip()
-        needs_phone = (pd.isna(phone) or not phone or phone_source in ["NOT_FOUND", "error", ""])
-        
-        # Always search for email for PRIORITY >= 2
-        needs_email = True
-        
-        if not needs_phone and not needs_email:
-            continue
-        
-        leads_to_process.append({
+    else:
+        phone_source_empty = pd.Series(True, index=df_priority.index)
+    needs_phone_mask = (phone_missing | phone_source_empty).to_numpy(dtype=bool)
+
+    # Company name: first non-blank of the known name columns (leads without one are skipped)
+    company_names = _coalesce_text(df_priority, _COMPANY_NAME_COLUMNS)
+    has_company = (company_names != "").to_numpy()
+
+    # Prepare leads for batch processing (always search for email for PRIORITY >= 2)
+    leads_to_process = [
+        {
             "idx": idx,
             "company_name": company_name,
-            "needs_phone": needs_phone,
-            "needs_email": needs_email
-        })
+            "needs_phone": bool(needs_phone),
+            "needs_email": True,
+        }
+        for idx, company_name, needs_phone in zip(
+            df_priority.index[has_company],
+            company_names[has_company],
+            needs_phone_mask[has_company],
+        )
+    ]
     
-    # Process in parallel batches of 5-10
+    # Searches run concurrently (see process_all below)
     async def search_tavily_async(lead_info: Dict[str, Any]) -> Dict[str, Any]:
         """Async Tavily search for a single lead."""
         idx = lead_info["idx"]
@@ -355,17 +514,21 @@ def run_tavily_complementary_search(
             
             logger.debug(f"Tavily search for {company_name}: {len(tavily_response.get('results', []))} results")
             
-            if tavily_response.get("results"):
-                content_combined = " ".join([r.get("content", "") or "" for r in tavily_response.get("results", [])])
-                urls_combined = " ".join([r.get("url", "") or "" for r in tavily_response.get("results", [])])
-                all_text = content_combined + " " + urls_combined
+            results = tavily_response.get("results")
+            if results:
+                # All contents followed by all URLs, joined in a single pass
+                all_text = " ".join(
+                    chain(
+                        (r.get("content") or "" for r in results),
+                        (r.get("url") or "" for r in results),
+                    )
+                )
                 
                 logger.debug(f"Tavily content length for {company_name}: {len(all_text)} chars")
                 
                 # Extract phone if needed
                 if needs_phone:
-                    phone_pattern = r'(?:\+34|34)?[\s.-]?([6-9]\d{8})'
-                    matches = re.findall(phone_pattern, all_text)
+                    matches = _TAVILY_PHONE_RE.findall(all_text)
                     if matches:
                         phone_digits = matches[0].replace(" ", "").replace(".", "").replace("-", "").strip()
                         if len(phone_digits) == 9:
@@ -374,11 +537,11 @@ def run_tavily_complementary_search(
                 
                 # Extract email
                 if needs_email:
-                    email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-                    email_matches = re.findall(email_pattern, all_text)
+                    # Without an "@" there is nothing to find; skip the backtracking scan
+                    email_matches = _TAVILY_EMAIL_RE.findall(all_text) if "@" in all_text else []
                     if email_matches:
                         # Filter emails that look like company emails (not generic)
-                        valid_emails = [e for e in email_matches if not any(x in e.lower() for x in ['example', 'test', 'noreply', 'no-reply', 'info@', 'contact@', 'hello@'])]
+                        valid_emails = [e for e in email_matches if not _BAD_EMAIL_RE.search(e)]
                         if valid_emails:
                             # Prefer emails with company domain
                             company_domain = company_name.lower().replace(" ", "").replace(".", "").replace(",", "")[:15]
@@ -397,56 +560,69 @@ def run_tavily_complementary_search(
                 logger.debug(f"Tavily returned no results for {company_name}")
         
         except Exception as e:
-            logger.warning(f"Tavily complementary search failed for {company_name}: {e}", exc_info=True)
+            logger.warning("Tavily complementary search failed for %s: %r", company_name, e)
+            logger.debug("Tavily complementary search traceback", exc_info=True)
+            _record_error(errors, idx, "TAVILY", e)
         
         return result
     
-    async def process_batch(leads_batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Process a batch of leads in parallel."""
-        tasks = [search_tavily_async(lead) for lead in leads_batch]
-        return await asyncio.gather(*tasks)
-    
-    # Process in batches of 8 (good balance between speed and rate limits)
-    batch_size = 8
-    all_results = []
-    
-    total_batches = (len(leads_to_process) + batch_size - 1) // batch_size
-    for i in range(0, len(leads_to_process), batch_size):
-        batch = leads_to_process[i:i + batch_size]
-        batch_num = i // batch_size + 1
-        logger.info(f"Processing Tavily batch {batch_num}/{total_batches} ({len(batch)} leads)")
-        
-        # Update progress during Tavily
-        if progress_callback:
-            # Estimate progress: Tier1 was ~50%, Tavily is ~30%, Tier3 is ~20%
-            # So Tavily starts at 50% and goes to 80%
-            tavily_progress_start = 0.5
-            tavily_progress_end = 0.8
-            progress = tavily_progress_start + (batch_num / total_batches) * (tavily_progress_end - tavily_progress_start)
-            try:
-                progress_callback(int(progress * len(leads_to_process)), len(leads_to_process), f"Buscando con Tavily (batch {batch_num}/{total_batches})...")
-            except Exception as e:
-                logger.warning(f"Progress callback error during Tavily: {e}")
-        
-        # Check stop
-        if check_stop_callback and check_stop_callback():
-            logger.info("Stop requested by user during Tavily search")
-            raise KeyboardInterrupt("Processing stopped by user")
-        
+    # Process all leads concurrently with at most 8 requests in flight (good balance
+    # between speed and rate limits). There is no per-batch barrier, so a slow lead
+    # only holds its own slot instead of stalling the rest of its batch.
+    max_concurrency = 8
+    total_leads = len(leads_to_process)
+    all_results: List[Dict[str, Any]] = []
+    stop_requested = False
+
+    async def process_all() -> None:
+        nonlocal stop_requested
+        semaphore = asyncio.Semaphore(max_concurrency)
+        done = 0
+
+        async def bounded(lead_info: Dict[str, Any]) -> None:
+            nonlocal done, stop_requested
+            async with semaphore:
+                if stop_requested:
+                    return
+                if check_stop_callback and check_stop_callback():
+                    logger.info("Stop requested by user during Tavily search")
+                    stop_requested = True
+                    return
+                result = await search_tavily_async(lead_info)
+
+            all_results.append(result)
+            done += 1
+
+            # Update progress during Tavily
+            if progress_callback:
+                # Estimate progress: Tier1 was ~50%, Tavily is ~30%, Tier3 is ~20%
+                # So Tavily starts at 50% and goes to 80%
+                tavily_progress_start = 0.5
+                tavily_progress_end = 0.8
+                progress = tavily_progress_start + (done / total_leads) * (tavily_progress_end - tavily_progress_start)
+                try:
+                    progress_callback(int(progress * total_leads), total_leads, f"Buscando con Tavily ({done}/{total_leads})...")
+                except Exception as e:
+                    logger.warning(f"Progress callback error during Tavily: {e}")
+
+        for next_done in asyncio.as_completed([bounded(lead) for lead in leads_to_process]):
+            await next_done
+
+    if leads_to_process:
+        logger.info(f"Processing {total_leads} Tavily searches (max {max_concurrency} concurrent)")
         try:
-            batch_results = asyncio.run(process_batch(batch))
-            all_results.extend(batch_results)
-            
-            # Log results for debugging
-            phones_found = sum(1 for r in batch_results if r.get("phone"))
-            emails_found = sum(1 for r in batch_results if r.get("email"))
-            logger.info(f"Tavily batch {batch_num}: {phones_found} phones, {emails_found} emails found")
-        except KeyboardInterrupt:
-            raise
+            asyncio.run(process_all())
         except Exception as e:
-            logger.error(f"Error processing Tavily batch: {e}")
-            continue
-    
+            logger.error(f"Error processing Tavily searches: {e}")
+            _record_error(errors, "N/A", "TAVILY", e)
+
+        if stop_requested:
+            raise KeyboardInterrupt("Processing stopped by user")
+
+        phones_found = sum(1 for r in all_results if r.get("phone"))
+        emails_found = sum(1 for r in all_results if r.get("email"))
+        logger.info(f"Tavily search: {phones_found} phones, {emails_found} emails found")
+
     # Update DataFrame with results
     for result in all_results:
         idx = result["idx"]
@@ -466,6 +642,7 @@ def run_tavily_complementary_search(
 def run_tier3_and_validation(
     df: pd.DataFrame,
     enable_tier3: bool = True,
+    errors: Optional[List[Dict[str, Any]]] = None,
 ) -> pd.DataFrame:
     """Run Tier3 enrichment, batch validation, and scoring.
 
@@ -479,11 +656,14 @@ def run_tier3_and_validation(
     Args:
         df: DataFrame after Tier2 enrichment.
         enable_tier3: Whether to run Tier3 enrichment (default: True).
+        errors: If given, a failing Tier3 step or validator is appended here as
+            ``{row, field, error}`` and skipped; otherwise it raises.
 
     Returns:
         DataFrame with Tier3 enrichment, validation flags, and scoring columns.
     """
-    df_result = df.copy()
+    # Shallow copy: every write below replaces whole columns, so the caller's frame is untouched
+    df_result = df.copy(deep=False)
 
     # Load configs
     enrichment_rules = load_yaml_config("config/rules/enrichment_rules.yaml")
@@ -494,39 +674,65 @@ def run_tier3_and_validation(
         logger.info("Running Tier3 enrichment (WEBSITE, CNAE)...")
         tier3_rules = enrichment_rules.get("tier3", {})
         tier3_enricher = Tier3Enricher(rules=tier3_rules)
-        df_result = tier3_enricher.process_missing_only(df_result)
+        try:
+            df_result = tier3_enricher.process_missing_only(df_result)
+        except Exception as e:
+            if errors is None:
+                raise
+            logger.error("Tier3 enrichment failed: %r", e, exc_info=True)
+            _record_error(errors, "N/A", "TIER3", e)
+        finally:
+            tier3_enricher.close()
     else:
         logger.info("Tier3 enrichment skipped")
-        # Initialize Tier3 columns if not exist
-        if "WEBSITE" not in df_result.columns:
-            df_result["WEBSITE"] = None
-        if "CNAE" not in df_result.columns:
-            df_result["CNAE"] = None
-        if "WEBSITE_SOURCE" not in df_result.columns:
-            df_result["WEBSITE_SOURCE"] = None
-        if "CNAE_SOURCE" not in df_result.columns:
-            df_result["CNAE_SOURCE"] = None
-
-    # 2) Batch email validation
-    logger.info("Running batch email validation...")
-    email_rules = validation_rules.get("email", {})
-    df_result = validate_all_emails(df_result, email_rules)
-
-    # 3) Batch phone validation
-    logger.info("Running batch phone validation...")
-    phone_rules = validation_rules.get("phone", {})
-    df_result = validate_all_phones(df_result, phone_rules)
-
-    # 4) CIF revalidation
-    logger.info("Running CIF revalidation...")
-    cif_rules = validation_rules.get("cif", {})
-    df_result = revalidate_cifs(df_result, cif_rules)
+    # Initialize Tier3 columns if not exist (Tier3 skipped or failed)
+    if "WEBSITE" not in df_result.columns:
+        df_result["WEBSITE"] = None
+    if "CNAE" not in df_result.columns:
+        df_result["CNAE"] = None
+    if "WEBSITE_SOURCE" not in df_result.columns:
+        df_result["WEBSITE_SOURCE"] = None
+    if "CNAE_SOURCE" not in df_result.columns:
+        df_result["CNAE_SOURCE"] = None
+
+    # 2-4) Batch email validation, phone validation and CIF revalidation.
+    # The three validators write disjoint columns, so they run concurrently
+    # (email MX lookups are network-bound) and their columns are merged back.
+    logger.info("Running batch email/phone validation and CIF revalidation...")
+    validators = [
+        (validate_all_emails, validation_rules.get("email", {}), "EMAIL", EMAIL_VALIDATION_COLUMNS),
+        (validate_all_phones, validation_rules.get("phone", {}), "TELEFONO", PHONE_VALIDATION_COLUMNS),
+        (revalidate_cifs, validation_rules.get("cif", {}), "CIF", CIF_VALIDATION_COLUMNS),
+    ]
+    with ThreadPoolExecutor(max_workers=len(validators)) as executor:
+        futures = []
+        for validator, rules, input_column, columns in validators:
+            # Each validator copies its input, so only hand it the columns it reads/updates
+            read_column = rules.get("column", input_column)
+            needed = [col for col in (read_column, *columns) if col in df_result.columns]
+            futures.append((executor.submit(validator, df_result[needed], rules), read_column))
+        validated = []
+        for future, read_column in futures:
+            try:
+                validated.append((future.result(), read_column))
+            except Exception as e:
+                if errors is None:
+                    raise
+                logger.error("Validation of %s failed: %r", read_column, e, exc_info=True)
+                _record_error(errors, "N/A", f"{read_column}_VALIDATION", e)
+
+    # Everything a validator returns besides its input column is its output
+    for df_validated, read_column in validated:
+        for col in df_validated.columns:
+            if col != read_column:
+                df_result[col] = df_validated[col]
 
     # 5) Scoring
     logger.info("Calculating data quality scores...")
     scoring_rules = validation_rules.get("scoring", {})
     scoring_engine = ScoringEngine(validation_rules={"scoring": scoring_rules})
-    df_result = scoring_engine.annotate_dataframe(df_result)
+    for col, values in scoring_engine.score_columns(df_result).items():
+        df_result[col] = values
 
     logger.info("Tier3, validation, and scoring complete")
     return df_result
@@ -540,6 +746,7 @@ def process_file(
     force_tier2: bool = False,
     progress_callback: callable = None,
     check_stop_callback: callable = None,
+    errors_sink: Literal["excel", "json", "none"] = "excel",
 ) -> tuple[pd.DataFrame, dict[str, Any]]:
     """Process Excel file through the full pipeline.
 
@@ -548,13 +755,18 @@ def process_file(
         output_path: Path for output Excel file.
         tiers: List of tiers to run (1, 2, 3). Default: [1, 3].
         enable_email_research: Whether to enable email research in Tier2.
+        errors_sink: Where collected errors go: an "Errores" sheet in the output
+            workbook ("excel"), a ``<output>.errors.json`` file next to it
+            ("json", for batch runs) or nowhere ("none"). Errors are the
+            per-row Tier1/Tier2 errors plus failed Tavily searches, Tier3 and
+            validation steps, as ``{row, field, error}``.
 
     Returns:
         Tuple of (processed DataFrame, metrics dict).
     """
     from src.core.excel_processor import read_excel, write_excel
 
-    errors_list = []  # List to collect errors: {row: int, field: str, error: str}
+    errors_list: List[Dict[str, Any]] = []  # {row, field, error}, filled by every stage
 
     try:
         # Read Excel file
@@ -570,15 +782,16 @@ def process_file(
                 config_path="config/tier1_config.yaml",
                 progress_callback=progress_callback,
                 check_stop_callback=check_stop_callback,
+                errors=errors_list,
             )
+            errors_list.extend(_row_errors(df_result, "ERRORS", "TIER1"))
         else:
             # Just calculate priorities if Tier1 is skipped
             from src.core.priority_engine import PriorityEngine
             priority_engine = PriorityEngine()
             mask_process = ~df.get("_IS_RED_ROW", False)
-            df_process = df[mask_process].copy()
-            priorities = priority_engine.calculate_priorities(df_process)
-            df_result = df.copy()
+            priorities = priority_engine.calculate_priorities(df[mask_process])
+            df_result = df  # freshly read from disk, no need to copy
             df_result["PRIORITY"] = None
             df_result.loc[mask_process, "PRIORITY"] = priorities.values
             batch_report = None
@@ -589,7 +802,8 @@ def process_file(
         df_result = run_tavily_complementary_search(
             df_result,
             progress_callback=progress_callback,
-            check_stop_callback=check_stop_callback
+            check_stop_callback=check_stop_callback,
+            errors=errors_list,
         )
         
         # Run Tier2 if requested
@@ -602,184 +816,161 @@ def process_file(
                 enable_email_research=enable_email_research,
                 force_tier2=force_tier2,
             )
+            errors_list.extend(_row_errors(df_result, "TIER2_ERRORS", "TIER2"))
 
         # Run Tier3 if requested
         if 3 in tiers:
             logger.info("Running Tier3 enrichment + validation + scoring...")
-            df_result = run_tier3_and_validation(df_result, enable_tier3=True)
+            df_result = run_tier3_and_validation(df_result, enable_tier3=True, errors=errors_list)
 
         # ============================================
         # Add status columns for DATOS_TÉCNICOS
         # ============================================
         red_df_indices = metadata.get("red_df_indices", [])
         
-        # Initialize status columns
+        # Initialize status columns (tiers that did not run stay SKIPPED)
         df_result["ENRICHMENT_STATUS"] = None
         df_result["ENRICHMENT_NOTES"] = None
-        df_result["TIER1_STATUS"] = None
-        df_result["TIER2_STATUS"] = None
-        df_result["TIER3_STATUS"] = None
+        df_result["TIER1_STATUS"] = "SKIPPED"
+        df_result["TIER2_STATUS"] = "SKIPPED"
+        df_result["TIER3_STATUS"] = "SKIPPED"
         
+        # Positional red-row mask (red_df_indices are positions in df_result)
+        is_red = np.zeros(len(df_result), dtype=bool)
+        is_red[[i for i in red_df_indices if i < len(df_result)]] = True
+
         # Set status for red rows (skipped)
-        for idx in red_df_indices:
-            if idx < len(df_result):
-                row_idx = df_result.index[idx]
-                df_result.loc[row_idx, "ENRICHMENT_STATUS"] = "SKIPPED_RED"
-                df_result.loc[row_idx, "ENRICHMENT_NOTES"] = "original red row"
-                df_result.loc[row_idx, "TIER1_STATUS"] = "SKIPPED"
-                df_result.loc[row_idx, "TIER2_STATUS"] = "SKIPPED"
-                df_result.loc[row_idx, "TIER3_STATUS"] = "SKIPPED"
-        
+        red_index = df_result.index[is_red]
+        df_result.loc[red_index, "ENRICHMENT_STATUS"] = "SKIPPED_RED"
+        df_result.loc[red_index, "ENRICHMENT_NOTES"] = "original red row"
+
         # Set status for processed rows
-        mask_processed = ~df_result.index.isin([df_result.index[i] for i in red_df_indices if i < len(df_result)])
-        df_processed = df_result[mask_processed].copy()
-        
+        processed_index = df_result.index[~is_red]
+
         # Tier1 status
         if 1 in tiers:
-            for idx in df_processed.index:
-                errors = str(df_result.loc[idx, "ERRORS"] or "").strip()
-                if "GOOGLE_PLACES" in errors and "rate limit" in errors.lower():
-                    df_result.loc[idx, "TIER1_STATUS"] = "RATE_LIMITED"
-                    df_result.loc[idx, "ENRICHMENT_STATUS"] = "RATE_LIMITED"
-                    df_result.loc[idx, "ENRICHMENT_NOTES"] = "google_places rate limit"
-                elif "GOOGLE_PLACES" in errors:
-                    df_result.loc[idx, "TIER1_STATUS"] = "NOT_FOUND"
-                    if df_result.loc[idx, "ENRICHMENT_STATUS"] is None:
-                        df_result.loc[idx, "ENRICHMENT_STATUS"] = "NOT_FOUND"
-                    if df_result.loc[idx, "ENRICHMENT_NOTES"] is None:
-                        df_result.loc[idx, "ENRICHMENT_NOTES"] = "google_places no match"
-                elif errors:
-                    df_result.loc[idx, "TIER1_STATUS"] = "ERROR"
-                    if df_result.loc[idx, "ENRICHMENT_STATUS"] is None:
-                        df_result.loc[idx, "ENRICHMENT_STATUS"] = "ERROR"
-                    if df_result.loc[idx, "ENRICHMENT_NOTES"] is None:
-                        df_result.loc[idx, "ENRICHMENT_NOTES"] = f"tier1 error: {errors[:50]}"
-                else:
-                    df_result.loc[idx, "TIER1_STATUS"] = "OK"
-                    if df_result.loc[idx, "ENRICHMENT_STATUS"] is None:
-                        df_result.loc[idx, "ENRICHMENT_STATUS"] = "OK"
-        else:
-            for idx in df_processed.index:
-                df_result.loc[idx, "TIER1_STATUS"] = "SKIPPED"
+            tier1_errors = _str_array(df_result.loc[processed_index, "ERRORS"])
+            is_places_error = np.char.find(tier1_errors, "GOOGLE_PLACES") >= 0
+            tier1_conditions = [
+                is_places_error & (np.char.find(np.char.lower(tier1_errors), "rate limit") >= 0),
+                is_places_error,
+                tier1_errors != "",
+            ]
+            tier1_status = np.select(tier1_conditions, ["RATE_LIMITED", "NOT_FOUND", "ERROR"], default="OK")
+            tier1_notes = np.select(
+                tier1_conditions,
+                [
+                    "google_places rate limit",
+                    "google_places no match",
+                    np.char.add("tier1 error: ", tier1_errors.astype("<U50")),
+                ],
+                default="",
+            ).astype(object)
+            tier1_notes[tier1_notes == ""] = None
+            df_result.loc[processed_index, "TIER1_STATUS"] = tier1_status
+            df_result.loc[processed_index, "ENRICHMENT_STATUS"] = tier1_status
+            df_result.loc[processed_index, "ENRICHMENT_NOTES"] = tier1_notes
         
-        # Tier2 status
+        # Tier2 status (columns read once as arrays, written back with one assignment each)
         if 2 in tiers:
-            for idx in df_processed.index:
-                tier2_errors = str(df_result.loc[idx, "TIER2_ERRORS"] or "").strip()
-                if tier2_errors:
-                    if "tavily" in tier2_errors.lower() or "openai" in tier2_errors.lower():
-                        df_result.loc[idx, "TIER2_STATUS"] = "ERROR"
-                        if df_result.loc[idx, "ENRICHMENT_STATUS"] not in ["RATE_LIMITED", "ERROR"]:
-                            df_result.loc[idx, "ENRICHMENT_STATUS"] = "ERROR"
-                        notes = f"tavily error: {tier2_errors[:50]}"
-                        if df_result.loc[idx, "ENRICHMENT_NOTES"]:
-                            df_result.loc[idx, "ENRICHMENT_NOTES"] += f" | {notes}"
-                        else:
-                            df_result.loc[idx, "ENRICHMENT_NOTES"] = notes
-                    else:
-                        df_result.loc[idx, "TIER2_STATUS"] = "ERROR"
-                else:
-                    email = str(df_result.loc[idx, "EMAIL_SPECIFIC"] or "").strip()
-                    if email and email not in ["", "NO_EMAIL_FOUND", "NOT_FOUND"]:
-                        df_result.loc[idx, "TIER2_STATUS"] = "OK"
-                    else:
-                        df_result.loc[idx, "TIER2_STATUS"] = "NOT_FOUND"
-                
-                # Ensure EMAIL_SPECIFIC is not blank if Tier2 ran
-                if pd.isna(df_result.loc[idx, "EMAIL_SPECIFIC"]) or str(df_result.loc[idx, "EMAIL_SPECIFIC"]).strip() == "":
-                    df_result.loc[idx, "EMAIL_SPECIFIC"] = "NO_EMAIL_FOUND"
-                
-                # Check for contact without email
-                contact_name = str(df_result.loc[idx, "CONTACT_NAME"] or "").strip()
-                if contact_name and contact_name not in ["", "NOT_FOUND", "NO_CONTACT_FOUND"]:
-                    email_val = str(df_result.loc[idx, "EMAIL_SPECIFIC"] or "").strip()
-                    if email_val in ["", "NO_EMAIL_FOUND", "NOT_FOUND"]:
-                        if df_result.loc[idx, "ENRICHMENT_NOTES"]:
-                            df_result.loc[idx, "ENRICHMENT_NOTES"] += " | contact found, no email"
-                        else:
-                            df_result.loc[idx, "ENRICHMENT_NOTES"] = "contact found, no email"
-        else:
-            for idx in df_processed.index:
-                df_result.loc[idx, "TIER2_STATUS"] = "SKIPPED"
+            tier2_errors = _str_array(df_result.loc[processed_index, "TIER2_ERRORS"])
+            tier2_errors_lower = np.char.lower(tier2_errors)
+            has_tier2_error = tier2_errors != ""
+            is_api_error = has_tier2_error & (
+                (np.char.find(tier2_errors_lower, "tavily") >= 0)
+                | (np.char.find(tier2_errors_lower, "openai") >= 0)
+            )
+            email_missing = ~_has_value(df_result.loc[processed_index, "EMAIL_SPECIFIC"], _SENTINELS["EMAIL"])
+
+            df_result.loc[processed_index, "TIER2_STATUS"] = np.where(
+                has_tier2_error, "ERROR", np.where(email_missing, "NOT_FOUND", "OK")
+            )
+
+            current_status = df_result.loc[processed_index, "ENRICHMENT_STATUS"]
+            escalate = is_api_error & ~current_status.isin(["RATE_LIMITED", "ERROR"]).to_numpy()
+            df_result.loc[processed_index[escalate], "ENRICHMENT_STATUS"] = "ERROR"
+
+            # Check for contact without email
+            contact_found = _has_value(df_result.loc[processed_index, "CONTACT_NAME"], _SENTINELS["CONTACT"])
+            contact_without_email = contact_found & email_missing
+
+            # API error and contact notes are combined so ENRICHMENT_NOTES is written once
+            api_notes = np.char.add("tavily error: ", tier2_errors.astype("<U50")).astype(object)
+            tier2_notes = np.where(
+                is_api_error,
+                np.where(contact_without_email, api_notes + " | contact found, no email", api_notes),
+                "contact found, no email",
+            )
+            needs_note = is_api_error | contact_without_email
+            _append_enrichment_notes(df_result, processed_index[needs_note], tier2_notes[needs_note])
+
+            # Ensure EMAIL_SPECIFIC is not blank if Tier2 ran
+            _fill_blank(df_result, processed_index, "EMAIL_SPECIFIC", "NO_EMAIL_FOUND")
         
         # Tier3 status
         if 3 in tiers:
-            for idx in df_processed.index:
-                # Ensure WEBSITE and CNAE are not blank if Tier3 ran
-                if pd.isna(df_result.loc[idx, "WEBSITE"]) or str(df_result.loc[idx, "WEBSITE"]).strip() == "":
-                    df_result.loc[idx, "WEBSITE"] = "NOT_FOUND"
-                if pd.isna(df_result.loc[idx, "CNAE"]) or str(df_result.loc[idx, "CNAE"]).strip() == "":
-                    df_result.loc[idx, "CNAE"] = "NOT_FOUND"
-                
-                website = str(df_result.loc[idx, "WEBSITE"] or "").strip()
-                cnae = str(df_result.loc[idx, "CNAE"] or "").strip()
-                
-                if website == "NOT_FOUND" and cnae == "NOT_FOUND":
-                    df_result.loc[idx, "TIER3_STATUS"] = "NOT_FOUND"
-                elif website == "NOT_FOUND" or cnae == "NOT_FOUND":
-                    df_result.loc[idx, "TIER3_STATUS"] = "OK"  # Partial success
-                else:
-                    df_result.loc[idx, "TIER3_STATUS"] = "OK"
-        else:
-            for idx in df_processed.index:
-                df_result.loc[idx, "TIER3_STATUS"] = "SKIPPED"
+            # Ensure WEBSITE and CNAE are not blank if Tier3 ran
+            _fill_blank(df_result, processed_index, "WEBSITE", "NOT_FOUND")
+            _fill_blank(df_result, processed_index, "CNAE", "NOT_FOUND")
+
+            # Partial success (only one of them found) still counts as OK
+            website = _str_array(df_result.loc[processed_index, "WEBSITE"])
+            cnae = _str_array(df_result.loc[processed_index, "CNAE"])
+            df_result.loc[processed_index, "TIER3_STATUS"] = np.where(
+                (website == "NOT_FOUND") & (cnae == "NOT_FOUND"), "NOT_FOUND", "OK"
+            )
 
         # Ensure PHONE_SOURCE is properly set (should never be "web_scraper" now)
         if "PHONE_SOURCE" in df_result.columns:
-            mask_missing_source = df_result["PHONE_SOURCE"].isna() | (df_result["PHONE_SOURCE"] == "")
-            mask_no_phone = df_result["PHONE"].isna() | (df_result["PHONE"] == "")
-            mask_needs_fix = mask_missing_source & mask_no_phone
-            if mask_needs_fix.any():
-                df_result.loc[mask_needs_fix, "PHONE_SOURCE"] = "NOT_FOUND"
-                logger.info(f"Set {mask_needs_fix.sum()} rows with missing PHONE_SOURCE to 'NOT_FOUND'")
+            phone_source = df_result["PHONE_SOURCE"]
+            phone = df_result["PHONE"]
+            needs_fix = (phone_source.isna() | phone_source.eq("")) & (phone.isna() | phone.eq(""))
+            fix_count = int(needs_fix.sum())
+            if fix_count:
+                df_result.loc[needs_fix, "PHONE_SOURCE"] = "NOT_FOUND"
+                logger.info("Set %d rows with missing PHONE_SOURCE to 'NOT_FOUND'", fix_count)
+
+        # Status/source labels are final from here on
+        _to_categorical(df_result, _CATEGORICAL_COLUMNS)
 
         # Write output Excel
         logger.info(f"Writing output to: {output_path}")
-        write_excel(df_result, metadata, output_path, preserve_format=True, force_tier2=force_tier2)
-
-        # Add errors sheet if there are any errors
-        if errors_list:
-            logger.info(f"Writing {len(errors_list)} errors to Excel sheet...")
-            try:
-                from openpyxl import load_workbook
-                wb = load_workbook(output_path)
-                df_errors = pd.DataFrame(errors_list)
-                with pd.ExcelWriter(output_path, mode='a', engine='openpyxl', if_sheet_exists='replace') as writer:
-                    writer.book = wb
-                    df_errors.to_excel(writer, sheet_name='Errores', index=False)
-                wb.save(output_path)
-                wb.close()
-            except Exception as e:
-                logger.error(f"Error writing errors sheet: {e}")
+        write_excel(
+            df_result,
+            metadata,
+            output_path,
+            preserve_format=True,
+            force_tier2=force_tier2,
+            errors=errors_list if errors_sink == "excel" else None,
+        )
+        if errors_sink == "json" and errors_list:
+            errors_path = Path(output_path).with_suffix(".errors.json")
+            errors_path.write_text(json.dumps(errors_list, ensure_ascii=False, default=str), encoding="utf-8")
+            logger.info(f"Wrote {len(errors_list)} errors to: {errors_path}")
 
         # Calculate metrics
         total_rows = len(df_result)
-        high_quality = (df_result["DATA_QUALITY"] == "High").sum() if "DATA_QUALITY" in df_result.columns else 0
+        high_quality = int(df_result["DATA_QUALITY"].eq("High").sum()) if "DATA_QUALITY" in df_result.columns else 0
         
         # Count valid emails: EMAIL_SPECIFIC or EMAIL_FOUND that are not empty/NO_EMAIL_FOUND/NOT_FOUND
-        emails_valid = 0
-        if "EMAIL_SPECIFIC" in df_result.columns:
-            emails_valid += df_result.apply(
-                lambda row: 1 if (
-                    pd.notna(row.get("EMAIL_SPECIFIC")) and 
-                    str(row.get("EMAIL_SPECIFIC", "")).strip() not in ["", "NO_EMAIL_FOUND", "NOT_FOUND"]
-                ) else 0,
-                axis=1
-            ).sum()
-        if "EMAIL_FOUND" in df_result.columns:
-            # Count EMAIL_FOUND that are valid (not already counted in EMAIL_SPECIFIC)
-            emails_valid += df_result.apply(
-                lambda row: 1 if (
-                    pd.notna(row.get("EMAIL_FOUND")) and 
-                    str(row.get("EMAIL_FOUND", "")).strip() not in ["", "NO_EMAIL_FOUND", "NOT_FOUND"] and
-                    (pd.isna(row.get("EMAIL_SPECIFIC")) or str(row.get("EMAIL_SPECIFIC", "")).strip() in ["", "NO_EMAIL_FOUND", "NOT_FOUND"])
-                ) else 0,
-                axis=1
-            ).sum()
+        no_rows = np.zeros(total_rows, dtype=bool)
+        has_email_specific = (
+            _has_value(df_result["EMAIL_SPECIFIC"], _SENTINELS["EMAIL"])
+            if "EMAIL_SPECIFIC" in df_result.columns
+            else no_rows
+        )
+        has_email_found = (
+            _has_value(df_result["EMAIL_FOUND"], _SENTINELS["EMAIL"])
+            if "EMAIL_FOUND" in df_result.columns
+            else no_rows
+        )
+        # EMAIL_FOUND only counts when not already counted in EMAIL_SPECIFIC
+        emails_valid = int(has_email_specific.sum()) + int((has_email_found & ~has_email_specific).sum())
         
         # Also count from EMAIL_VALID if exists (for backward compatibility)
         if "EMAIL_VALID" in df_result.columns:
-            emails_valid_from_valid = df_result["EMAIL_VALID"].sum()
+            # Count explicit True flags (an object-dtype .sum() would add mixed values)
+            emails_valid_from_valid = int(df_result["EMAIL_VALID"].eq(True).sum())
             # Use the higher count (should be similar but EMAIL_FOUND/EMAIL_SPECIFIC is more accurate)
             if emails_valid_from_valid > emails_valid:
                 emails_valid = emails_valid_from_valid
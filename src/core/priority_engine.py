@@ -1,7 +1,9 @@
 """Priority calculation engine based on YAML rules."""
 
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
 import pandas as pd
 
 from src.utils.config_loader import load_priority_rules
@@ -15,6 +17,24 @@ class PriorityEngine:
     def __init__(self) -> None:
         """Initialize priority engine and load rules."""
         self.rules = load_priority_rules()
+
+        # Resolve rule thresholds once instead of on every row
+        rule_4 = self.rules.get("priority_4", {}).get("conditions", {})
+        self._p4_consumo_min: float = rule_4.get("consumo_min", float("inf"))
+        self._p4_services: Tuple[str, ...] = tuple(rule_4.get("requires_services", []))
+
+        rule_3 = self.rules.get("priority_3", {}).get("conditions", [])
+        if not isinstance(rule_3, list):
+            rule_3 = [rule_3]
+        self._p3_conditions: List[Tuple[float, Tuple[str, ...]]] = [
+            (condition.get("consumo_min", float("inf")), tuple(condition.get("requires_services", [])))
+            for condition in rule_3
+        ]
+
+        rule_2 = self.rules.get("priority_2", {}).get("conditions", {})
+        self._p2_min: float = rule_2.get("consumo_min", 70)
+        self._p2_max: float = rule_2.get("consumo_max", 99)
+
         logger.info("Priority engine initialized")
 
     def _get_consumo(self, row: pd.Series) -> Optional[float]:
@@ -28,11 +48,12 @@ class PriorityEngine:
         Returns:
             Consumption value as float, or None if missing/invalid.
         """
+        # ``raw != raw`` is the NaN check (cheaper than isinstance + pd.isna per row)
         raw = row.get("CONSUMO_MWH")
-        if raw is None or (isinstance(raw, float) and pd.isna(raw)) or raw == "":
+        if raw is None or raw == "" or raw != raw:
             raw = row.get("CONSUMO")
 
-        if raw is None or raw == "" or (isinstance(raw, float) and pd.isna(raw)):
+        if raw is None or raw == "" or raw != raw:
             return None
 
         try:
@@ -75,12 +96,12 @@ class PriorityEngine:
 
         return False
 
-    def _check_services(self, row: pd.Series, required_services: list) -> bool:
+    def _check_services(self, row: pd.Series, required_services: Tuple[str, ...]) -> bool:
         """Check if row has all required services.
 
         Args:
             row: DataFrame row.
-            required_services: List of required service names (e.g., ["LUZ", "GAS"]).
+            required_services: Required service names (e.g., ("LUZ", "GAS")).
 
         Returns:
             True if all required services are present and truthy.
@@ -99,18 +120,14 @@ class PriorityEngine:
         Returns:
             True if matches Priority 4.
         """
-        rule = self.rules.get("priority_4", {}).get("conditions", {})
-        consumo_min = rule.get("consumo_min", float("inf"))
-        required_services = rule.get("requires_services", [])
-
         consumo_float = self._get_consumo(row)
         if consumo_float is None:
             return False
 
-        if consumo_float < consumo_min:
+        if consumo_float < self._p4_consumo_min:
             return False
 
-        if required_services and not self._check_services(row, required_services):
+        if self._p4_services and not self._check_services(row, self._p4_services):
             return False
 
         return True
@@ -124,18 +141,11 @@ class PriorityEngine:
         Returns:
             True if matches Priority 3.
         """
-        rule = self.rules.get("priority_3", {}).get("conditions", [])
-        if not isinstance(rule, list):
-            rule = [rule]
-
         consumo_float = self._get_consumo(row)
         if consumo_float is None:
             return False
 
-        for condition in rule:
-            consumo_min = condition.get("consumo_min", float("inf"))
-            required_services = condition.get("requires_services", [])
-
+        for consumo_min, required_services in self._p3_conditions:
             if consumo_float < consumo_min:
                 continue
 
@@ -156,15 +166,11 @@ class PriorityEngine:
         Returns:
             True if matches Priority 2.
         """
-        rule = self.rules.get("priority_2", {}).get("conditions", {})
-        consumo_min = rule.get("consumo_min", 70)
-        consumo_max = rule.get("consumo_max", 99)
-
         consumo_float = self._get_consumo(row)
         if consumo_float is None:
             return False
 
-        return consumo_min <= consumo_float <= consumo_max
+        return self._p2_min <= consumo_float <= self._p2_max
 
     def calculate_priority(self, row: pd.Series) -> int:
         """Calculate priority for a single row.
@@ -185,9 +191,103 @@ class PriorityEngine:
         # Default to Priority 1
         return 1
 
+    def _consumo_series(self, df: pd.DataFrame) -> pd.Series:
+        """Vectorized counterpart of ``_get_consumo`` for a whole DataFrame.
+
+        Args:
+            df: DataFrame with lead data.
+
+        Returns:
+            Float Series with consumption values (NaN when missing/invalid).
+        """
+        missing = pd.Series(np.nan, index=df.index, dtype=float)
+        consumo = (
+            pd.to_numeric(df["CONSUMO"], errors="coerce") if "CONSUMO" in df.columns else missing
+        )
+        if "CONSUMO_MWH" in df.columns:
+            raw = df["CONSUMO_MWH"]
+            raw_missing = raw.isna() | (raw == "")
+            # CONSUMO is only a fallback when CONSUMO_MWH is empty, not when it is invalid
+            consumo = pd.to_numeric(raw, errors="coerce").where(~raw_missing, consumo)
+        return consumo.astype(float)
+
+    @staticmethod
+    def _lv_upper(df: pd.DataFrame) -> Optional[pd.Series]:
+        """Return the combined 'L/V' column upper-cased once ("" when missing).
+
+        Args:
+            df: DataFrame with lead data.
+
+        Returns:
+            Normalized Series, or None if there is no 'L/V' column.
+        """
+        if "L/V" not in df.columns:
+            return None
+        return df["L/V"].fillna("").astype(str).str.upper()
+
+    def _service_mask(
+        self, df: pd.DataFrame, service: str, lv_upper: Optional[pd.Series] = None
+    ) -> pd.Series:
+        """Vectorized counterpart of ``_get_service_value`` for a whole DataFrame.
+
+        Args:
+            df: DataFrame with lead data.
+            service: Service name (e.g., "LUZ", "GAS").
+            lv_upper: Pre-normalized 'L/V' column (see ``_lv_upper``); computed
+                here when not given.
+
+        Returns:
+            Boolean Series, True where the service appears to be present.
+        """
+        service = service.upper()
+
+        # 1) Direct column (LUZ / GAS)
+        if service in df.columns:
+            values = df[service]
+            # Identity as in the scalar ``val is False``: isin([False]) would also match 0
+            is_false = values.map(lambda value: value is False).astype(bool)
+            return ~(values.isna() | (values == "") | is_false)
+
+        # 2) Fallback: combined 'L/V' column from Alejandro's Excel
+        if lv_upper is None:
+            lv_upper = self._lv_upper(df)
+        if lv_upper is not None:
+            if service == "LUZ":
+                return lv_upper.str.contains("L", regex=False)
+            if service == "GAS":
+                return lv_upper.str.contains("[GV]", regex=True)
+
+        return pd.Series(False, index=df.index)
+
+    def _services_mask(
+        self,
+        df: pd.DataFrame,
+        required_services: Tuple[str, ...],
+        lv_upper: Optional[pd.Series] = None,
+    ) -> pd.Series:
+        """Return True where all required services are present.
+
+        Args:
+            df: DataFrame with lead data.
+            required_services: Required service names.
+            lv_upper: Pre-normalized 'L/V' column (see ``_lv_upper``).
+
+        Returns:
+            Boolean Series.
+        """
+        if lv_upper is None:
+            lv_upper = self._lv_upper(df)
+        mask = pd.Series(True, index=df.index)
+        for service in required_services:
+            mask &= self._service_mask(df, service, lv_upper)
+        return mask
+
     def calculate_priorities(self, df: pd.DataFrame) -> pd.Series:
         """Calculate priorities for entire DataFrame.
 
+        Evaluates the same rules as ``calculate_priority`` with column-level
+        boolean masks instead of a per-row ``apply``.
+
         Args:
             df: DataFrame with lead data.
 
@@ -195,7 +295,62 @@ class PriorityEngine:
             Series with priority values.
         """
         logger.info(f"Calculating priorities for {len(df)} rows")
-        priorities = df.apply(self.calculate_priority, axis=1)
+        consumo = self._consumo_series(df).to_numpy()
+
+        # Service masks are computed once per distinct service set (P4 and P3 share LUZ+GAS),
+        # all from one upper-cased copy of the 'L/V' column
+        lv_upper = self._lv_upper(df)
+        service_masks: Dict[Tuple[str, ...], np.ndarray] = {}
+
+        def services(required_services: Tuple[str, ...]) -> np.ndarray:
+            if required_services not in service_masks:
+                service_masks[required_services] = self._services_mask(
+                    df, required_services, lv_upper
+                ).to_numpy()
+            return service_masks[required_services]
+
+        priorities = pd.Series(
+            _priority_kernel(
+                consumo,
+                self._p4_consumo_min,
+                services(self._p4_services),
+                [(consumo_min, services(required)) for consumo_min, required in self._p3_conditions],
+                self._p2_min,
+                self._p2_max,
+            ),
+            index=df.index,
+        )
         logger.info(f"Priority distribution: {priorities.value_counts().to_dict()}")
         return priorities
 
+
+def _priority_kernel(
+    consumo: np.ndarray,
+    p4_consumo_min: float,
+    p4_services: np.ndarray,
+    p3_conditions: List[Tuple[float, np.ndarray]],
+    p2_min: float,
+    p2_max: float,
+) -> np.ndarray:
+    """Compute priorities (1-4) from plain NumPy arrays.
+
+    Args:
+        consumo: Consumption per row (NaN when missing/invalid, never matches).
+        p4_consumo_min: Minimum consumption for Priority 4.
+        p4_services: True where the Priority 4 services are present.
+        p3_conditions: (minimum consumption, services mask) pairs for Priority 3.
+        p2_min: Minimum consumption for Priority 2.
+        p2_max: Maximum consumption for Priority 2.
+
+    Returns:
+        Integer array with one priority per row.
+    """
+    p4 = (consumo >= p4_consumo_min) & p4_services
+
+    p3 = np.zeros(consumo.shape, dtype=bool)
+    for consumo_min, services_mask in p3_conditions:
+        p3 |= (consumo >= consumo_min) & services_mask
+
+    p2 = (consumo >= p2_min) & (consumo <= p2_max)
+
+    return np.select([p4, p3, p2], [4, 3, 2], default=1)
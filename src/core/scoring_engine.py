@@ -9,6 +9,7 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from ..utils.logger import setup_logger
@@ -16,6 +17,16 @@ from ..utils.config_loader import load_yaml_config
 
 logger = setup_logger()
 
+# Column order of the source matrices built in ``ScoringEngine._confidence_series``
+_CONFIDENCE_SOURCE_ORDER = (
+    "email_mx",
+    "email_syntax_only",
+    "phone_normalized",
+    "website_validated",
+    "cnae_official_register",
+    "cnae_inferred",
+)
+
 
 @dataclass
 class ScoringConfig:
@@ -312,11 +323,13 @@ class ScoringEngine:
 
         return "; ".join(sources) if sources else ""
 
-    def annotate_row(self, row: pd.Series) -> pd.Series:
+    def annotate_row(self, row: pd.Series, timestamp: str | None = None) -> pd.Series:
         """Calcula y añade columnas de scoring a una fila.
 
         Args:
             row: Row Series.
+            timestamp: LAST_UPDATED value. Callers annotating many rows should
+                pass one batch timestamp; defaults to the current UTC time.
 
         Returns:
             Row Series with scoring columns added.
@@ -331,33 +344,295 @@ class ScoringEngine:
         result["COMPLETITUD_SCORE"] = completeness
         result["CONFIDENCE_SCORE"] = confidence
         result["DATA_QUALITY"] = quality
-        result["LAST_UPDATED"] = datetime.now(timezone.utc).isoformat()
+        result["LAST_UPDATED"] = timestamp or _utc_timestamp()
         result["DATA_SOURCES"] = sources
         return result
 
+    def _completeness_series(self, df: pd.DataFrame) -> pd.Series:
+        """Vectorized ``calculate_completeness`` over a whole DataFrame.
+
+        Args:
+            df: Input DataFrame.
+
+        Returns:
+            Completeness score (0-100) per row.
+        """
+        total_weight = 0.0
+        filled_weight = pd.Series(0.0, index=df.index)
+
+        for field, weight in self._config.completeness_fields.items():
+            total_weight += weight
+            if field not in df.columns:
+                continue
+            valid = ~_empty_mask(df[field])
+            validation_flag = f"{field}_VALID"
+            if validation_flag in df.columns:
+                valid &= _flag_valid_mask(df[validation_flag])
+            filled_weight += valid * weight
+
+        if total_weight == 0:
+            return pd.Series(0.0, index=df.index)
+
+        return (filled_weight / total_weight * 100.0).round(2)
+
+    def _confidence_series(self, df: pd.DataFrame) -> pd.Series:
+        """Vectorized ``calculate_confidence`` over a whole DataFrame.
+
+        Args:
+            df: Input DataFrame.
+
+        Returns:
+            Confidence score (0-100) per row.
+        """
+        sources = self._config.confidence_sources
+        weights = np.array(
+            [sources.get(name, 0) for name in _CONFIDENCE_SOURCE_ORDER], dtype=float
+        )
+
+        # Email confidence (penalize invalid emails)
+        has_email = _present_mask(df, "EMAIL")
+        email_invalid = has_email & _is_false_mask(df, "EMAIL_VALID")
+        has_email &= _truthy_mask(df, "EMAIL_VALID")
+        if "EMAIL_VALIDATION_LEVEL" in df.columns:
+            email_mx = has_email & (df["EMAIL_VALIDATION_LEVEL"] == "mx")
+        else:
+            email_mx = pd.Series(False, index=df.index)
+        email_syntax = has_email & ~email_mx
+
+        # Phone and website confidence
+        phone_ok = _present_mask(df, "TELEFONO") & _truthy_mask(df, "PHONE_VALID")
+        website_ok = _present_mask(df, "WEBSITE") & _truthy_mask(df, "WEBSITE_SOURCE")
+
+        # CNAE confidence
+        has_cnae = _present_mask(df, "CNAE")
+        if "CNAE_SOURCE" in df.columns:
+            cnae_source = df["CNAE_SOURCE"]
+            official = (cnae_source == "official_register") | cnae_source.astype(str).str.lower().str.contains(
+                "chamber", regex=False
+            )
+        else:
+            official = pd.Series(False, index=df.index)
+
+        # One (rows x sources) 0/1 matrix per side; both sums are a single matrix product.
+        # An invalid email only counts towards the total, never towards the confidence.
+        valid = np.column_stack([
+            email_mx, email_syntax, phone_ok, website_ok, has_cnae & official, has_cnae & ~official,
+        ]).astype(float)
+        present = valid.copy()
+        present[:, 1] += email_invalid.to_numpy(dtype=float)
+
+        total_weight = pd.Series(present @ weights, index=df.index)
+        confidence_weight = pd.Series(valid @ weights, index=df.index)
+
+        score = (confidence_weight / total_weight.where(total_weight != 0) * 100.0).round(2)
+        return score.fillna(0.0)
+
+    def _data_quality_series(self, df: pd.DataFrame) -> pd.Series:
+        """Vectorized ``assign_data_quality`` over a whole DataFrame.
+
+        Args:
+            df: Input DataFrame.
+
+        Returns:
+            Quality level ("High", "Medium" or "Low") per row.
+        """
+        has_real_email = _real_value_mask(df, "EMAIL_SPECIFIC", ("NO_EMAIL_FOUND", "NOT_FOUND"))
+        has_real_website = _real_value_mask(df, "WEBSITE", ("NOT_FOUND", "NO_WEBSITE_FOUND"))
+        has_real_cnae = _real_value_mask(df, "CNAE", ("NOT_FOUND",))
+        has_razon_social = _real_value_mask(df, "RAZON_SOCIAL", ("NOT_FOUND",))
+        phone_valid = _truthy_mask(df, "PHONE_VALID")
+
+        # High criteria: tiene EMAIL_SPECIFIC real OR (WEBSITE real y CNAE real) OR (PHONE_VALID True y RAZON_SOCIAL no vacío)
+        high = has_real_email | (has_real_website & has_real_cnae) | (phone_valid & has_razon_social)
+
+        # Medium: cumple al menos 2 de CIF_FORMAT_OK, PHONE_VALID, EMAIL con "@", RAZON_SOCIAL
+        email_original = _text_series(df, "EMAIL")
+        criteria_count = (
+            _truthy_mask(df, "CIF_FORMAT_OK").astype(int)
+            + phone_valid.astype(int)
+            + email_original.str.contains("@", regex=False).astype(int)
+            + has_razon_social.astype(int)
+        )
+
+        return pd.Series(
+            np.select([high.to_numpy(), (criteria_count >= 2).to_numpy()], ["High", "Medium"], default="Low"),
+            index=df.index,
+        )
+
+    def _sources_summary_series(self, df: pd.DataFrame) -> pd.Series:
+        """Vectorized ``_build_sources_summary`` over a whole DataFrame.
+
+        Args:
+            df: Input DataFrame.
+
+        Returns:
+            Sources summary string per row.
+        """
+        empty = np.full(len(df), "", dtype=object)
+        parts = []
+
+        # Email source
+        if "EMAIL_VALIDATION_LEVEL" in df.columns:
+            show = _present_mask(df, "EMAIL") & _truthy_mask(df, "EMAIL_VALIDATION_LEVEL")
+            labels = "email:" + df["EMAIL_VALIDATION_LEVEL"].astype(str).to_numpy(dtype=object)
+            parts.append(np.where(show, labels, empty))
+
+        # Phone source
+        show = _present_mask(df, "TELEFONO") & _truthy_mask(df, "PHONE_VALID")
+        parts.append(np.where(show, "phone:normalized", empty))
+
+        # Website / CNAE sources
+        for column, prefix in (("WEBSITE_SOURCE", "website:"), ("CNAE_SOURCE", "cnae:")):
+            if column in df.columns:
+                labels = prefix + df[column].astype(str).to_numpy(dtype=object)
+                parts.append(np.where(_truthy_mask(df, column), labels, empty))
+
+        summary = empty
+        for part in parts:
+            separator = np.where((summary != "") & (part != ""), "; ", "")
+            summary = summary + separator + part
+        return pd.Series(summary, index=df.index, dtype=object)
+
+    def score_columns(self, df: pd.DataFrame) -> dict[str, Any]:
+        """Compute the scoring columns for a whole DataFrame without copying it.
+
+        Computes the same scores as ``annotate_row`` with column-level
+        operations instead of a per-row loop.
+
+        Args:
+            df: Input DataFrame.
+
+        Returns:
+            Mapping of scoring column name to its values (Series or scalar).
+        """
+        return {
+            "COMPLETITUD_SCORE": self._completeness_series(df),
+            "CONFIDENCE_SCORE": self._confidence_series(df),
+            "DATA_QUALITY": self._data_quality_series(df),
+            "LAST_UPDATED": _utc_timestamp(),  # one timestamp for the whole batch
+            "DATA_SOURCES": self._sources_summary_series(df),
+        }
+
     def annotate_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Aplica annotate_row a todo el DataFrame.
+        """Añade las columnas de scoring a todo el DataFrame.
 
         Args:
             df: Input DataFrame.
 
         Returns:
-            DataFrame with scoring columns added.
+            New DataFrame with scoring columns added (see ``score_columns``).
         """
-        # Apply scoring to each row
-        df_result = df.copy()
-
-        # Initialize scoring columns
-        df_result["COMPLETITUD_SCORE"] = 0.0
-        df_result["CONFIDENCE_SCORE"] = 0.0
-        df_result["DATA_QUALITY"] = "Low"
-        df_result["LAST_UPDATED"] = ""
-        df_result["DATA_SOURCES"] = ""
-
-        # Apply scoring row by row
-        for idx in df_result.index:
-            row = df_result.loc[idx]
-            annotated_row = self.annotate_row(row)
-            df_result.loc[idx] = annotated_row
-
-        return df_result
+        return df.assign(**self.score_columns(df))
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time as an ISO-8601 string."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _text_series(df: pd.DataFrame, column: str) -> pd.Series:
+    """Return ``column`` as stripped strings ("" for missing column/values).
+
+    Args:
+        df: Input DataFrame.
+        column: Column name.
+
+    Returns:
+        Series of stripped strings.
+    """
+    if column not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    return df[column].fillna("").astype(str).str.strip()
+
+
+def _empty_mask(values: pd.Series) -> pd.Series:
+    """Vectorized ``ScoringEngine._is_empty`` (None, NaN or blank string).
+
+    Args:
+        values: Series to check.
+
+    Returns:
+        Boolean Series, True where the value is empty.
+    """
+    return values.isna() | (values.astype(str).str.strip() == "")
+
+
+def _present_mask(df: pd.DataFrame, column: str) -> pd.Series:
+    """Return True where ``column`` exists and is not empty.
+
+    Args:
+        df: Input DataFrame.
+        column: Column name.
+
+    Returns:
+        Boolean Series.
+    """
+    if column not in df.columns:
+        return pd.Series(False, index=df.index)
+    return ~_empty_mask(df[column])
+
+
+def _truthy_mask(df: pd.DataFrame, column: str) -> pd.Series:
+    """Return the truthiness of ``column`` (False when missing or NA).
+
+    Args:
+        df: Input DataFrame.
+        column: Column name.
+
+    Returns:
+        Boolean Series.
+    """
+    if column not in df.columns:
+        return pd.Series(False, index=df.index)
+    values = df[column]
+    return values.map(bool, na_action="ignore").eq(True)
+
+
+def _is_false_mask(df: pd.DataFrame, column: str) -> pd.Series:
+    """Return True where ``column`` holds the boolean ``False``.
+
+    Args:
+        df: Input DataFrame.
+        column: Column name.
+
+    Returns:
+        Boolean Series.
+    """
+    if column not in df.columns:
+        return pd.Series(False, index=df.index)
+    values = df[column]
+    return values.map(type).isin([bool, np.bool_]) & ~values.astype(bool)
+
+
+def _flag_valid_mask(flags: pd.Series) -> pd.Series:
+    """Vectorized interpretation of a ``*_VALID`` flag (see ``ScoringEngine._is_valid``).
+
+    Booleans are used as-is, strings are valid when "true"/"1"/"yes" and
+    anything else (including missing flags) counts as valid.
+
+    Args:
+        flags: Flag column.
+
+    Returns:
+        Boolean Series.
+    """
+    kinds = flags.map(type)
+    is_bool = kinds.isin([bool, np.bool_])
+    is_str = kinds == str
+    text_valid = flags.where(is_str, "").astype(str).str.lower().isin(["true", "1", "yes"])
+    return (is_bool & flags.where(is_bool, False).astype(bool)) | (is_str & text_valid) | ~(is_bool | is_str)
+
+
+def _real_value_mask(df: pd.DataFrame, column: str, placeholders: tuple[str, ...]) -> pd.Series:
+    """Return True where ``column`` has a non-blank value that is not a placeholder.
+
+    Args:
+        df: Input DataFrame.
+        column: Column name.
+        placeholders: Values meaning "not found".
+
+    Returns:
+        Boolean Series.
+    """
+    text = _text_series(df, column)
+    return (text != "") & ~text.isin(placeholders)
@@ -1,19 +1,253 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Any, List, Optional
+from dataclasses import asdict, dataclass, field, replace
+from functools import cached_property
+from collections import Counter
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urlparse
 
+import asyncio
+import multiprocessing
 import os
-from ..scrapers.web_scraper import ContactPageScraper
-from ..ai.openai_parser import OpenAIParser
-from ..ai.email_researcher import EmailResearcher, load_email_researcher_from_config
+import re
+import threading
+import unicodedata
+
+import pandas as pd
+from bs4 import BeautifulSoup
+
+from ..scrapers.web_scraper import ContactPageScraper, ScrapedPage, build_session
+from ..ai.openai_parser import ContactInfo, OpenAIParser, ParsedContactData
+from ..ai.email_researcher import (
+    CompanyEnrichment,
+    EmailResearcher,
+    EmailResearchResult,
+    load_email_researcher_from_config,
+)
 from ..validators.email_validator import EmailValidator
-from ..scrapers.linkedin_scraper import LinkedInScraper
+from ..validators.mx_cache import MxCache
+from ..scrapers.linkedin_scraper import LinkedInResult, LinkedInScraper
 from ..api_manager.utils.logger import get_logger, log_event
+from ..api_manager.utils.rate_limiter import TokenBucket
 from ..utils.config_loader import load_yaml_config
+from ..utils.circuit_breaker import CircuitBreaker
+from ..utils.disk_cache import DiskCache, hash_key
+
+
+# Columns written back for each lead processed by Tier2Enricher
+TIER2_OUTPUT_COLUMNS = (
+    "EMAIL_SPECIFIC",
+    "EMAIL_VALID",
+    "CONTACT_NAME",
+    "CONTACT_TITLE",
+    "LINKEDIN_COMPANY",
+    "EMAIL_RESEARCHED",
+    "EMAIL_SOURCE",
+    "EMAIL_CONFIDENCE",
+    "RESEARCH_NOTES",
+    "TIER2_ERRORS",
+)
+
+# Columns holding the company name, in order of preference
+COMPANY_NAME_COLUMNS = (
+    "RAZON_SOCIAL",
+    "NOMBRE CLIENTE",  # Excel de Alejandro
+    "NOMBRE_CLIENTE",  # Sin espacio
+    "NOMBRE_EMPRESA",
+    "company_name",
+    "NOMBRE",
+)
+
+# Lead key holding the company name already resolved by enrich_dataframe
+_COMPANY_KEY = "_TIER2_COMPANY"
+
+# Trailing legal forms ignored when matching branches of the same company
+_LEGAL_FORMS = frozenset({"sa", "sau", "sl", "slu", "sll", "slp", "scoop", "cb", "sc", "sad", "srl", "ltd", "inc"})
+_NON_ALNUM_RE = re.compile(r"[^0-9a-z]+")
+
+
+# Text that contains an email address. Only the characters around the "@" are
+# needed to detect one, and a fixed-width pattern scans in linear time (a
+# "[\w.+-]+@" prefix backtracks quadratically over long runs without "@")
+_EMAIL_TEXT_RE = re.compile(r"[\w.+-]@[\w-]")
+
+
+def _has_email_text(text: str) -> bool:
+    return "@" in text and _EMAIL_TEXT_RE.search(text) is not None
+
+
+# Elements that usually hold contact names, titles and addresses
+_CONTACT_TAGS = ("h1", "h2", "h3", "h4", "footer", "address")
+
+
+# Characters of page text sent to OpenAI per contact page
+MAX_PAGE_CHARS = 12000
+
+
+def _prefilter_html(html: str, max_chars: int = MAX_PAGE_CHARS) -> str:
+    """Reduce a contact page to the regions that can hold contact data.
+
+    Keeps headings, ``<footer>``/``<address>`` blocks, ``mailto:`` links, JSON-LD
+    blocks and elements whose text contains an email, as plain text lines
+    (scripts, styles and layout markup are dropped). Pages without any of those
+    fall back to their visible text.
+
+    Args:
+        html: Raw page HTML.
+        max_chars: Maximum length of the result.
+
+    Returns:
+        One line per relevant region (or visible text line), or "" for a page without text.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    lines: List[str] = []
+    # Structured data (schema.org Organization/Person) often lists the emails
+    for script in soup.find_all("script", type="application/ld+json"):
+        text = script.get_text(" ", strip=True)
+        if _has_email_text(text):
+            lines.append(text)
+    for tag in soup(["script", "style", "noscript", "svg", "template"]):
+        tag.decompose()
+
+    for tag in soup.find_all(_CONTACT_TAGS):
+        lines.append(tag.get_text(" ", strip=True))
+    for link in soup.select('a[href^="mailto:" i]'):
+        lines.append(f"{link.get_text(' ', strip=True)} <{link['href']}>")
+    for text in soup.find_all(string=_has_email_text):
+        if text.parent is not None:
+            lines.append(text.parent.get_text(" ", strip=True))
+
+    if not any(lines):
+        lines = [" ".join(text.split()) for text in (soup.body or soup).stripped_strings]
+
+    # Drop empty lines and repeats (a footer email is also an email text), keeping order
+    return "\n".join(dict.fromkeys(line for line in lines if line))[:max_chars]
+
+
+def _chunks(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield successive lists of ``size`` items (the last one may be shorter)."""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _scraped_page_from_dict(data: Dict[str, Any]) -> ScrapedPage:
+    return ScrapedPage(**data)
+
+
+def _linkedin_result_from_dict(data: Dict[str, Any]) -> LinkedInResult:
+    return LinkedInResult(**data)
+
+
+def _parsed_contacts_from_dict(data: Dict[str, Any]) -> ParsedContactData:
+    contacts = [ContactInfo(**contact) for contact in data.pop("contacts")]
+    return ParsedContactData(contacts=contacts, **data)
+
+
+def _token_bucket(per_minute: Optional[float]) -> Optional[TokenBucket]:
+    """Per-minute TokenBucket from a config value (None when unset or 0)."""
+    return TokenBucket(float(per_minute)) if per_minute else None
+
+
+def _cell_text(value: Any) -> str:
+    """Stripped text of a lead cell ("" for None and for empty Excel cells, which arrive as NaN)."""
+    if value is None or value != value:
+        return ""
+    return str(value).strip()
+
+
+def _website_domain(website: str) -> Optional[str]:
+    """Lowercase host of a website URL without "www." (the scheme is optional)."""
+    try:
+        host = urlparse(website if "//" in website else f"//{website}").hostname
+    except ValueError:
+        return None
+    return host.removeprefix("www.") if host else None
+
+
+def _website_page_key(website: str) -> Optional[str]:
+    """Key of the page a website URL leads to, shared by the leads that point there.
+
+    Root URLs ("https://www.empresa.es/") map to their domain; deep links keep
+    their path and query ("facebook.com/empresa"), since the scraper returns
+    that page when it loads.
+    """
+    domain = _website_domain(website)
+    if domain is None:
+        return None
+    parsed = urlparse(website if "//" in website else f"//{website}")
+    path = parsed.path.rstrip("/")
+    if parsed.query:
+        path = f"{path}?{parsed.query}"
+    return f"{domain}{path}" if path else domain
+
+
+def _lead_priority(value: Any) -> Optional[int]:
+    """PRIORITY of a lead as an int (None when missing or not numeric)."""
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
 
+def _lead_domains(lead: Dict[str, Any]) -> Set[str]:
+    """Domains a lead's emails are likely to use: its website host and any known email."""
+    domains: Set[str] = set()
+    website = _cell_text(lead.get("WEBSITE"))
+    domain = _website_domain(website) if website else None
+    if domain:
+        domains.add(domain)
+    email = _cell_text(lead.get("EMAIL"))
+    if "@" in email:
+        domains.add(email.rsplit("@", 1)[1].lower())
+    return domains
 
-@dataclass
+
+def _company_key(company_name: str) -> str:
+    """Normalize a company name to share lookups between its branches.
+
+    "MERCADONA, S.A.", "Mercadona SA" and "mercadona" all map to "mercadona"
+    (accents, punctuation, case and trailing legal forms are dropped).
+    """
+    text = unicodedata.normalize("NFKD", company_name).encode("ascii", "ignore").decode("ascii")
+    tokens = _NON_ALNUM_RE.sub(" ", text.casefold().replace(".", "")).split()
+    while len(tokens) > 1 and tokens[-1] in _LEGAL_FORMS:
+        tokens.pop()
+    return " ".join(tokens) or company_name.casefold()
+
+
+def _company_names(df: pd.DataFrame) -> pd.Series:
+    """Resolve the company name of every row at once (see ``Tier2Enricher._company_name``).
+
+    Args:
+        df: Leads.
+
+    Returns:
+        Series of stripped company names ("" when none of ``COMPANY_NAME_COLUMNS`` is filled).
+    """
+    names = pd.Series("", index=df.index, dtype=object)
+    # Fill from the least to the most preferred column so preferred values win
+    for column in reversed([col for col in COMPANY_NAME_COLUMNS if col in df.columns]):
+        values = df[column]
+        text = values.astype(str).str.strip()
+        names = names.mask(values.notna() & text.ne(""), text)
+    return names
+
+
+def _research_from_dict(data: Dict[str, Any]) -> EmailResearchResult:
+    company = data.pop("company_enrichment")
+    return EmailResearchResult(
+        company_enrichment=CompanyEnrichment(**company) if company is not None else None,
+        **data,
+    )
+
+
+@dataclass(slots=True)
 class Tier2EnrichmentResult:
     """Result of Tier2 enrichment for a single lead."""
 
@@ -30,7 +264,31 @@ class Tier2EnrichmentResult:
     openai_tokens_used: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
+class _PageContacts:
+    """Contact data read from a lead's contact page (Steps 1-2)."""
+
+    email: Optional[str] = None
+    contact_name: Optional[str] = None
+    contact_title: Optional[str] = None
+    tokens_used: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _ResearchOutcome:
+    """Outcome of the Tavily+OpenAI email research of a lead (Step 4)."""
+
+    result: Optional[EmailResearchResult] = None
+    fresh: bool = False  # False when reused from the cache or another lead
+    error: Optional[str] = None
+
+    @property
+    def email(self) -> Optional[str]:
+        return self.result.email if self.result is not None else None
+
+
+@dataclass(slots=True)
 class Tier2BatchReport:
     """Aggregated statistics for Tier2 batch enrichment."""
 
@@ -43,6 +301,62 @@ class Tier2BatchReport:
     errors: List[str]
 
 
+class _ParseBatcher:
+    """Groups ``parse_html`` calls made by concurrent workers into ``parse_html_batch`` calls.
+
+    A group is sent once it holds ``batch_size`` pages, or ``max_wait`` seconds
+    after its first page arrived; each caller blocks until its own result is ready.
+    """
+
+    def __init__(self, parser: OpenAIParser, batch_size: int, max_wait: float) -> None:
+        self.parser = parser
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[str, Future]] = []
+        self._timer: Optional[threading.Timer] = None
+
+    def parse(self, html_content: str) -> ParsedContactData:
+        future: Future = Future()
+        with self._lock:
+            self._pending.append((html_content, future))
+            if len(self._pending) >= self.batch_size:
+                batch = self._take()
+            else:
+                batch = None
+                if self._timer is None:
+                    self._timer = threading.Timer(self.max_wait, self._flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+        if batch:
+            self._send(batch)
+        return future.result()
+
+    def _take(self) -> List[Tuple[str, Future]]:
+        """Detach the pending group (caller holds the lock)."""
+        batch, self._pending = self._pending, []
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return batch
+
+    def _flush(self) -> None:
+        with self._lock:
+            batch = self._take()
+        if batch:
+            self._send(batch)
+
+    def _send(self, batch: List[Tuple[str, Future]]) -> None:
+        try:
+            results = self.parser.parse_html_batch([html_content for html_content, _ in batch])
+        except Exception as exc:
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+
+
 class Tier2Enricher:
     """Tier2 enricher for priority>=2 leads.
 
@@ -71,10 +385,23 @@ class Tier2Enricher:
 
         tier2_config = self.config.get("tier2", {})
 
-        # Initialize components
+        # Leads enriched at the same time by enrich_batch/enrich_dataframe
+        self.max_concurrency = max(1, int(tier2_config.get("max_concurrency", 8)))
+        # Leads read and enriched per round (bounds memory for streamed batches)
+        self.chunk_size = max(self.max_concurrency, int(tier2_config.get("chunk_size", 500)))
+
+        # Initialize components; one keep-alive session sized for the concurrent workers
+        path_concurrency = int(tier2_config.get("scraper", {}).get("path_concurrency", 4))
+        self._http = build_session(
+            pool_size=max(10, self.max_concurrency, path_concurrency + 1),
+            max_redirects=5,
+            pool_hosts=max(100, self.max_concurrency * path_concurrency),
+        )
         self.scraper = ContactPageScraper(
             timeout=tier2_config.get("timeout", 10),
             max_redirects=5,
+            session=self._http,
+            path_concurrency=path_concurrency,
         )
 
         # Load OpenAI parser
@@ -84,26 +411,206 @@ class Tier2Enricher:
         if not self.openai_parser:
             self.logger.warning("OpenAI parser not available (missing API key)")
 
-        self.email_validator = EmailValidator(dns_timeout=5.0)
-        self.linkedin_scraper = LinkedInScraper(timeout=15)
-
-        # Load email researcher (for priority>=3)
-        self.email_researcher = load_email_researcher_from_config()
-        if not self.email_researcher:
-            self.logger.warning("Email researcher not available (missing API keys)")
-        
-        # Log API key status
-        openai_key = os.getenv('OPENAI_API_KEY')
-        tavily_key = os.getenv('TAVILY_API_KEY')
-        self.logger.info(f"API Keys Status - OpenAI: {bool(openai_key)}, Tavily: {bool(tavily_key)}")
-        self.logger.info(f"Email researcher loaded: {self.email_researcher is not None}")
-
-        # Track OpenAI usage
+        # MX lookups are shared across leads: batches repeat the same domains
+        email_config = tier2_config.get("email", {})
+        mx_cache_config = email_config.get("mx_cache", {})
+        self._mx_cache = MxCache(
+            ttl=float(mx_cache_config.get("ttl", 3600)),
+            maxsize=int(mx_cache_config.get("maxsize", 50_000)),
+        )
+        self.email_validator = EmailValidator(
+            dns_timeout=float(email_config.get("dns_timeout", 5.0)), mx_cache=self._mx_cache
+        )
+        # MX queries in flight when pre-resolving each chunk's domains (0 disables)
+        self._mx_prefetch_concurrency = int(email_config.get("mx_prefetch_concurrency", 50))
+        linkedin_config = tier2_config.get("linkedin", {})
+        # The LinkedIn scraper and the email researcher are built on first use (see the
+        # properties below): runs without research never load Tavily or the tokenizer
+        self._linkedin_config = linkedin_config
+        self._lazy_lock = threading.Lock()
+
+        # LinkedIn is optional: stop paying its timeout while it keeps failing
+        breaker_config = linkedin_config.get("circuit_breaker", {})
+        self._linkedin_breaker = CircuitBreaker(
+            threshold=float(breaker_config.get("threshold", 0.5)),
+            window=int(breaker_config.get("window", 20)),
+            cooldown=float(breaker_config.get("cooldown", 60)),
+        )
+
+        # Keys come from config/api_keys.yaml
+        self.logger.info("Tier2 clients - OpenAI parser: %s", self.openai_parser is not None)
+
+        # Per-minute budgets shared by every worker (OpenAI limits are per account)
+        limits_config = tier2_config.get("rate_limits", {})
+        self._openai_rpm = _token_bucket(limits_config.get("openai_rpm"))
+        self._openai_tpm = _token_bucket(limits_config.get("openai_tpm"))
+        self._tavily_rpm = _token_bucket(limits_config.get("tavily_rpm"))
+        if self.openai_parser:
+            self.openai_parser.request_limiter = self._openai_rpm
+            self.openai_parser.token_limiter = self._openai_tpm
+
+        # Scrapes, OpenAI parses, email research and LinkedIn lookups are reused across runs;
+        # "nothing found" answers are kept for a shorter time and errors are not stored
+        cache_config = tier2_config.get("cache", {})
+        self._linkedin_ttl = float(cache_config.get("linkedin_ttl_days", 30)) * 86400
+        self._negative_ttl = float(cache_config.get("negative_ttl_hours", 24)) * 3600
+        self._disk_cache: Optional[DiskCache] = None
+        if cache_config.get("enabled", True):
+            try:
+                self._disk_cache = DiskCache(
+                    cache_config.get("path", ".cache/tier2/cache.sqlite3"),
+                    ttl=float(cache_config.get("ttl_days", 7)) * 86400,
+                )
+            except Exception as exc:
+                self.logger.warning(f"Tier2 disk cache disabled: {exc}")
+
+        # Track OpenAI usage (updated from worker threads)
         self.total_tokens = 0
+        self._tokens_lock = threading.Lock()
+
+        # Per-batch lookups shared by every lead with the same company key (set by
+        # _enrich_concurrently): chains/franchises repeat the same name
+        self._linkedin_lookups: Optional[Dict[str, asyncio.Future]] = None
+        # Contact page outcome per website page (root URLs per domain): branches share one site
+        self._page_lookups: Optional[Dict[str, asyncio.Future]] = None
+        self._page_requests = 0
+        self._research_lookups: Optional[Dict[Tuple[str, Optional[str], Optional[str]], Future]] = None
+        self._research_lock = threading.Lock()
+        # Research calls in flight at once (the other leads keep scraping meanwhile)
+        research_concurrency = int(tier2_config.get("research_concurrency", 4))
+        self._research_slots = threading.BoundedSemaphore(max(1, min(research_concurrency, self.max_concurrency)))
+        self._linkedin_requests = 0
+        self._research_requests = 0
+        # Research failures per exception type during a batch (summarized once at the end)
+        self._research_errors: Optional[Counter] = None
+
+        # Contact pages parsed together in one OpenAI call during batches (1 disables grouping)
+        openai_config = tier2_config.get("openai", {})
+        self._parse_batch_size = max(1, int(openai_config.get("batch_size", 8)))
+        self._parse_batch_wait = float(openai_config.get("batch_wait", 0.2))
+        self._max_page_chars = int(openai_config.get("max_page_chars", MAX_PAGE_CHARS))
+        self._parse_batcher: Optional[_ParseBatcher] = None
+
+        # Set by enrich_batch_offline: website -> (prefiltered page, errors) and
+        # hash of a page -> its Batch API answer
+        self._page_texts: Optional[Dict[Optional[str], Tuple[Optional[str], List[str]]]] = None
+        self._offline_parses: Optional[Dict[str, ParsedContactData]] = None
+
+        # Processes for the HTML prefilter (bs4 holds the GIL; <= 1 runs it inline), started on
+        # the first page and kept until close() so the spawn cost is paid once per enricher
+        self._html_workers = int(tier2_config.get("html_workers") or os.cpu_count() or 1)
+        self._html_pool: Optional[ProcessPoolExecutor] = None
+
+    @cached_property
+    def linkedin_scraper(self) -> LinkedInScraper:
+        """LinkedIn scraper, built on the first lookup."""
+        with self._lazy_lock:
+            if "linkedin_scraper" in self.__dict__:
+                return self.__dict__["linkedin_scraper"]
+            # Browsers stay open across lookups; more than one per worker would sit idle
+            cdp_port = self._linkedin_config.get("cdp_port")
+            return LinkedInScraper(
+                timeout=int(self._linkedin_config.get("timeout", 15)),
+                browsers=min(int(self._linkedin_config.get("browsers", 2)), self.max_concurrency),
+                cdp_port=int(cdp_port) if cdp_port else None,
+                batch_size=int(self._linkedin_config.get("batch_size", 1)),
+                match_threshold=float(self._linkedin_config.get("match_threshold", 0.9)),
+            )
+
+    @cached_property
+    def email_researcher(self) -> Optional[EmailResearcher]:
+        """Email researcher (for priority>=3), built the first time research is requested.
+
+        None when the Tavily/OpenAI keys are missing.
+        """
+        with self._lazy_lock:
+            if "email_researcher" in self.__dict__:
+                return self.__dict__["email_researcher"]
+            researcher = load_email_researcher_from_config(pool_size=max(10, self.max_concurrency))
+            if not researcher:
+                self.logger.warning("Email researcher not available (missing API keys)")
+                return None
+            researcher.openai_request_limiter = self._openai_rpm
+            researcher.openai_token_limiter = self._openai_tpm
+            researcher.tavily_limiter = self._tavily_rpm
+            return researcher
+
+    def close(self) -> None:
+        """Release the HTTP connection pools, the LinkedIn browsers and the disk cache."""
+        self._http.close()
+        # Only the clients that were actually built
+        for client in (self.__dict__.get("linkedin_scraper"), self.__dict__.get("email_researcher")):
+            if client is not None:
+                client.close()
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+            self._disk_cache = None
+        if self._html_pool is not None:
+            self._html_pool.shutdown(cancel_futures=True)
+            self._html_pool = None
+
+    def _cached(
+        self,
+        namespace: str,
+        key: str,
+        compute: Callable[[], Any],
+        from_dict: Callable[[Dict[str, Any]], Any],
+        should_store: Callable[[Any], bool],
+        ttl: Optional[Callable[[Any], Optional[float]]] = None,
+    ) -> Tuple[Any, bool]:
+        """Return a result from the disk cache, or compute and store it.
+
+        Args:
+            namespace: Cache namespace ("scrape", "parse", "research", "linkedin").
+            key: Hash of the inputs (see ``hash_key``).
+            compute: Produces the result dataclass on a miss.
+            from_dict: Rebuilds the result dataclass from its cached dict.
+            should_store: Whether a computed result may be cached (failures are retried).
+            ttl: Seconds a computed result stays cached (None = the cache's TTL).
+
+        Returns:
+            Tuple of (result, True if it was computed rather than read from the cache).
+        """
+        cache = self._disk_cache
+        if cache is None:
+            return compute(), True
+
+        try:
+            cached = cache.get(namespace, key)
+        except Exception as exc:
+            self.logger.warning(f"Tier2 cache read failed ({namespace}): {exc}")
+            cached = None
+        if cached is not None:
+            return from_dict(cached), False
+
+        result = compute()
+        if should_store(result):
+            try:
+                cache.set(namespace, key, asdict(result), ttl=ttl(result) if ttl else None)
+            except Exception as exc:
+                self.logger.warning(f"Tier2 cache write failed ({namespace}): {exc}")
+        return result, True
+
+    def _add_tokens(self, tokens: int) -> None:
+        """Add estimated OpenAI tokens to the running total (thread-safe)."""
+        with self._tokens_lock:
+            self.total_tokens += tokens
+
+    @staticmethod
+    def _company_name(lead: Dict[str, Any]) -> str:
+        """Extract company name from multiple possible column names (first non-blank one)."""
+        resolved = lead.get(_COMPANY_KEY)
+        if resolved is not None:
+            return resolved
+        return next(filter(None, (_cell_text(lead.get(column)) for column in COMPANY_NAME_COLUMNS)), "")
 
     def enrich_lead(self, lead: Dict[str, Any], enable_email_research: bool = False) -> Tier2EnrichmentResult:
         """Enrich a single lead with Tier2 data.
 
+        Thin wrapper over ``enrich_lead_async`` (the LinkedIn lookup overlaps the
+        other steps). Called from a thread with a running event loop, the steps
+        run sequentially instead.
+
         Args:
             lead: Lead dictionary with at least: WEBSITE, NOMBRE_EMPRESA, RAZON_SOCIAL, PRIORITY.
             enable_email_research: If True, use Tavily+OpenAI email research for priority>=3.
@@ -111,226 +618,314 @@ class Tier2Enricher:
         Returns:
             Tier2EnrichmentResult with enriched data.
         """
-        website = str(lead.get("WEBSITE", "")).strip() or None
-        
-        # Extract company name from multiple possible column names
-        company_name = (
-            str(lead.get('RAZON_SOCIAL', '') or '') or 
-            str(lead.get('NOMBRE CLIENTE', '') or '') or  # Excel de Alejandro
-            str(lead.get('NOMBRE_CLIENTE', '') or '') or  # Sin espacio
-            str(lead.get('NOMBRE_EMPRESA', '') or '') or
-            str(lead.get('company_name', '') or '') or
-            str(lead.get('NOMBRE', '') or '') or
-            ''
-        ).strip()
-        
-        city = str(lead.get("CIUDAD", "")).strip() or None
-        priority = lead.get("PRIORITY")
-        if priority is not None:
-            try:
-                priority = int(priority)
-            except (ValueError, TypeError):
-                priority = None
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.enrich_lead_async(lead, enable_email_research))
+        result = self._enrich_lead_sync(lead, enable_email_research)
+        result.linkedin_company = self._find_linkedin(self._company_name(lead))
+        return result
 
-        errors: List[str] = []
-        email_specific: Optional[str] = None
-        email_valid = False
-        contact_name: Optional[str] = None
-        contact_title: Optional[str] = None
-        linkedin_company: Optional[str] = None
-        email_researched: Optional[str] = None
-        email_source: Optional[str] = None
-        email_confidence = 0.0
-        research_notes: Optional[str] = None
-        tokens_used = 0
+    def _enrich_lead_sync(self, lead: Dict[str, Any], enable_email_research: bool) -> Tier2EnrichmentResult:
+        """Run the blocking enrichment steps one after another (everything but LinkedIn).
 
-        # Step 1: Scrape contact page
-        html_content: Optional[str] = None
-        if website:
-            try:
-                page = self.scraper.scrape_contact_page(website)
-                if page.success and page.html:
-                    html_content = page.html
-                else:
-                    errors.append(f"SCRAPE_FAILED:{page.error or 'UNKNOWN'}")
-            except Exception as exc:
-                errors.append(f"SCRAPE_ERROR:{str(exc)}")
+        Args:
+            lead: Lead dictionary (see ``enrich_lead``).
+            enable_email_research: If True, use Tavily+OpenAI email research for priority>=3.
+
+        Returns:
+            Tier2EnrichmentResult without ``linkedin_company``.
+        """
+        page = self._scrape_and_parse(self._website(lead))
+        page_validation = self._validate_email(page.email) if page.email else None
+        research = self._research_step(lead, enable_email_research)
+        research_validation = None
+        if not page.email and research.email:
+            research_validation = self._validate_email(research.email)
+        return self._assemble_result(page, page_validation, research, research_validation)
+
+    @staticmethod
+    def _website(lead: Dict[str, Any]) -> Optional[str]:
+        return _cell_text(lead.get("WEBSITE")) or None
+
+    def _scrape_and_parse(self, website: Optional[str]) -> _PageContacts:
+        """Steps 1-2: scrape the contact page and parse it with OpenAI.
+
+        Args:
+            website: Lead website, if any.
+
+        Returns:
+            _PageContacts with the first specific email and contact found.
+        """
+        page_texts = self._page_texts
+        if page_texts is not None and website in page_texts:
+            # Already scraped by enrich_batch_offline
+            parser_input, page_errors = page_texts[website]
         else:
-            errors.append("NO_WEBSITE")
+            parser_input, page_errors = self._contact_page_text(website)
+        page_contacts = _PageContacts(errors=list(page_errors))
+        errors = page_contacts.errors
 
         # Step 2: Parse HTML with OpenAI (if we have content and parser)
-        contacts_data = None
-        if html_content and self.openai_parser:
+        if parser_input and self.openai_parser:
             try:
-                contacts_data = self.openai_parser.parse_html(html_content)
+                contacts_data, parsed_now = self._cached(
+                    "parse",
+                    hash_key(parser_input),
+                    lambda: self._parse_html(parser_input),
+                    _parsed_contacts_from_dict,
+                    lambda parsed: not parsed.error,
+                )
                 if contacts_data.error:
                     errors.append(f"OPENAI_PARSE:{contacts_data.error}")
                 else:
-                    # Estimate tokens (rough: 1 token ≈ 4 chars)
-                    tokens_used = len(html_content) // 4
-                    self.total_tokens += tokens_used
+                    # Prompt tokens as counted by the parser (cached parses cost nothing)
+                    if parsed_now:
+                        page_contacts.tokens_used = contacts_data.tokens_used
+                        self._add_tokens(contacts_data.tokens_used)
 
                     # Get first specific email
                     if contacts_data.emails:
-                        email_specific = contacts_data.emails[0]
+                        page_contacts.email = contacts_data.emails[0]
 
                     # Get first contact with name
                     if contacts_data.contacts:
                         first_contact = contacts_data.contacts[0]
-                        contact_name = first_contact.name
-                        contact_title = first_contact.title
+                        page_contacts.contact_name = first_contact.name
+                        page_contacts.contact_title = first_contact.title
                         # Prefer contact's email if available
                         if first_contact.email:
-                            email_specific = first_contact.email
+                            page_contacts.email = first_contact.email
 
             except Exception as exc:
                 errors.append(f"OPENAI_ERROR:{str(exc)}")
 
-        # Step 3: Validate email (if we found one)
-        if email_specific:
-            try:
-                validation = self.email_validator.validate(email_specific)
-                email_valid = validation.valid and validation.deliverable and not validation.generic
-                if not email_valid:
-                    if validation.generic:
-                        errors.append("EMAIL_GENERIC")
-                    elif not validation.deliverable:
-                        errors.append(f"EMAIL_NO_MX:{validation.error or 'UNKNOWN'}")
-            except Exception as exc:
-                errors.append(f"EMAIL_VALIDATION_ERROR:{str(exc)}")
+        return page_contacts
 
-        # Step 4: Email research with Tavily+OpenAI (for priority>=3, if enabled)
-        self.logger.debug(
-            f"Email research check - enable_email_research={enable_email_research}, "
-            f"priority={priority}, email_researcher={self.email_researcher is not None}"
-        )
-        
-        if enable_email_research:
-            self.logger.debug(f"ENTRANDO en bloque de email research para: {company_name}")
-            if priority is None:
-                self.logger.debug(f"  → Saltando: priority es None")
-            elif priority < 3:
-                self.logger.debug(f"  → Saltando: priority={priority} < 3")
-            elif not self.email_researcher:
-                self.logger.warning(f"  → Saltando: email_researcher no disponible")
-            else:
-                self.logger.info(f"  → EJECUTANDO email research para: {company_name} (priority={priority})")
-        
-        if enable_email_research and priority is not None and priority >= 3 and self.email_researcher:
-            # Skip if company name is empty
-            if not company_name:
-                self.logger.debug(f"Skipping email research: empty company name (CIF: {lead.get('CIF/NIF', 'N/A')})")
-            else:
-                try:
-                    self.logger.info(f"🔍 Researching email for: '{company_name}' (priority={priority})")
-                    self.logger.info(f"Llamando email_researcher.research_email() para: {company_name}")
-                    research_result = self.email_researcher.research_email(
-                        company=company_name,
-                        city=city,
-                        website=website,
-                    )
-                    self.logger.info(f"Email research completado para: {company_name}, resultado: email={research_result.email is not None}")
-
-                    # Extract company enrichment data (Phase 1)
-                    company_enrichment = research_result.company_enrichment
-                    if company_enrichment:
-                        # Add company validation info to research_notes
-                        # Initialize research_notes as empty string to avoid None concatenation
-                        if research_notes is None:
-                            research_notes = ""
-                        
-                        if company_enrichment.razon_social_oficial:
-                            if research_notes:
-                                research_notes += " | "
-                            research_notes += f"Razón social: {company_enrichment.razon_social_oficial}"
-                            if company_enrichment.nombre_comercial:
-                                research_notes += f" | Nombre comercial: {company_enrichment.nombre_comercial}"
-                        if company_enrichment.confidence_score < 0.5:
-                            if research_notes:
-                                research_notes += " | "
-                            research_notes += f"⚠️ Baja confianza ({company_enrichment.confidence_score:.2f}) - revisar manualmente"
-
-                    if research_result.email:
-                        email_researched = research_result.email
-                        email_source = research_result.source_url
-                        email_confidence = research_result.confidence
-                        if research_result.notes:
-                            # If we already have research_notes, append to it; otherwise use notes directly
-                            if research_notes:
-                                research_notes += f" | {research_result.notes}"
-                            else:
-                                research_notes = research_result.notes
-
-                        # If we didn't find email from scraping, use researched email
-                        if not email_specific:
-                            email_specific = email_researched
-                            # Validate researched email
-                            try:
-                                validation = self.email_validator.validate(email_researched)
-                                email_valid = validation.valid and validation.deliverable and not validation.generic
-                            except Exception:
-                                pass  # Keep email_valid as False
-
-                        # Use contact info from research if available
-                        if research_result.contact_name and not contact_name:
-                            contact_name = research_result.contact_name
-                        if research_result.contact_position and not contact_title:
-                            contact_title = research_result.contact_position
-
-                        # Estimate tokens (rough: ~500 tokens per research call)
-                        tokens_used += 500
-                        self.total_tokens += 500
-
-                    elif research_result.error:
-                        errors.append(f"EMAIL_RESEARCH:{research_result.error}")
-
-                except Exception as exc:
-                    import traceback
-                    self.logger.error(
-                        f"Email research failed para {company_name}: {str(exc)}",
-                        exc_info=True
-                    )
-                    self.logger.error(f"Traceback completo:\n{traceback.format_exc()}")
-                    log_event(
-                        self.logger,
-                        level=30,
-                        message="Email research failed (non-blocking)",
-                        extra={"company": company_name, "error": str(exc)},
-                    )
-                    errors.append(f"EMAIL_RESEARCH_ERROR:{str(exc)}")
-        else:
-            if enable_email_research:
-                self.logger.debug(f"SALTANDO email research para {company_name} - condiciones no cumplidas")
+    def _contact_page_text(self, website: Optional[str]) -> Tuple[Optional[str], List[str]]:
+        """Step 1: scrape the contact page and keep the text worth sending to OpenAI.
 
-        # Step 5: Find LinkedIn (if we have company name) - optional, don't block on errors
-        if company_name:
-            try:
-                linkedin_result = self.linkedin_scraper.find_company(company_name)
-                if linkedin_result.success and linkedin_result.company_url:
-                    linkedin_company = linkedin_result.company_url
-                elif linkedin_result.error:
-                    # Log but don't add to errors (LinkedIn is optional)
-                    log_event(
-                        self.logger,
-                        level=20,
-                        message="LinkedIn not found (optional)",
-                        extra={"company": company_name, "error": linkedin_result.error},
-                    )
-            except Exception as exc:
-                # Log but don't block processing
-                log_event(
-                    self.logger,
-                    level=30,
-                    message="LinkedIn scraper error (non-blocking)",
-                    extra={"company": company_name, "error": str(exc)},
+        Args:
+            website: Lead website, if any.
+
+        Returns:
+            Tuple of (prefiltered page, or the raw page if nothing matched; errors).
+        """
+        if not website:
+            return None, ["NO_WEBSITE"]
+        try:
+            # One entry per page (see _website_page_key); unscrapable sites are retried after negative_ttl
+            page, _ = self._cached(
+                "scrape",
+                hash_key(_website_page_key(website) or website),
+                lambda: self.scraper.scrape_contact_page(website),
+                _scraped_page_from_dict,
+                lambda page: (page.success and bool(page.html)) or page.error == "ALL_PATHS_FAILED",
+                lambda page: None if page.success else self._negative_ttl,
+            )
+        except Exception as exc:
+            return None, [f"SCRAPE_ERROR:{str(exc)}"]
+        if not (page.success and page.html):
+            return None, [f"SCRAPE_FAILED:{page.error or 'UNKNOWN'}"]
+        if not self.openai_parser:
+            return page.html, []
+        try:
+            # Only contact-relevant text goes to OpenAI (falls back to the start of the raw page)
+            return self._prefilter(page.html) or page.html[: self._max_page_chars], []
+        except Exception as exc:
+            return None, [f"OPENAI_ERROR:{str(exc)}"]
+
+    @staticmethod
+    def _validation_outcome(validation: Any) -> Tuple[bool, Optional[str]]:
+        """Map an EmailValidationResult to (email_valid, error code)."""
+        if validation.valid and validation.deliverable and not validation.generic:
+            return True, None
+        if validation.generic:
+            return False, "EMAIL_GENERIC"
+        if not validation.deliverable:
+            return False, f"EMAIL_NO_MX:{validation.error or 'UNKNOWN'}"
+        return False, None
+
+    def _validate_email(self, email: str) -> Tuple[bool, Optional[str]]:
+        """Step 3: validate an email (syntax, generic mailbox, MX).
+
+        Args:
+            email: Email address found for the lead.
+
+        Returns:
+            Tuple of (email_valid, error code or None).
+        """
+        try:
+            return self._validation_outcome(self.email_validator.validate(email))
+        except Exception as exc:
+            return False, f"EMAIL_VALIDATION_ERROR:{str(exc)}"
+
+    async def _validate_email_async(self, email: str) -> Tuple[bool, Optional[str]]:
+        """Async variant of ``_validate_email`` (MX lookup on the event loop)."""
+        try:
+            return self._validation_outcome(await self.email_validator.validate_async(email))
+        except Exception as exc:
+            return False, f"EMAIL_VALIDATION_ERROR:{str(exc)}"
+
+    def _needs_research(self, lead: Dict[str, Any], enable_email_research: bool) -> bool:
+        """Whether step 4 applies to a lead (research enabled and available, priority>=3)."""
+        if not (enable_email_research and self.email_researcher):
+            return False
+        priority = _lead_priority(lead.get("PRIORITY"))
+        return priority is not None and priority >= 3
+
+    def _research_step(self, lead: Dict[str, Any], enable_email_research: bool) -> _ResearchOutcome:
+        """Step 4: email research with Tavily+OpenAI (for priority>=3, if enabled).
+
+        Args:
+            lead: Lead dictionary (see ``enrich_lead``).
+            enable_email_research: If True, research leads with priority>=3.
+
+        Returns:
+            _ResearchOutcome (empty when research does not apply).
+        """
+        company_name = self._company_name(lead)
+        city = _cell_text(lead.get("CIUDAD")) or None
+        priority = _lead_priority(lead.get("PRIORITY"))
+
+        # Arguments are formatted only when the level is enabled (this runs for every lead)
+        if not self._needs_research(lead, enable_email_research):
+            if enable_email_research:
+                self.logger.debug(
+                    "Saltando email research para %s (priority=%s, email_researcher=%s)",
+                    company_name,
+                    priority,
+                    self.email_researcher is not None,
                 )
+            return _ResearchOutcome()
+
+        # Skip if company name is empty
+        if not company_name:
+            self.logger.debug("Skipping email research: empty company name (CIF: %s)", lead.get("CIF/NIF", "N/A"))
+            return _ResearchOutcome()
 
+        try:
+            self.logger.info("Researching email for: '%s' (priority=%s)", company_name, priority)
+            research_result, fresh_research = self._research_email(company_name, city, self._website(lead))
+            self.logger.debug(
+                "Email research completado para: %s, resultado: email=%s",
+                company_name,
+                research_result.email is not None,
+            )
+            return _ResearchOutcome(result=research_result, fresh=fresh_research)
+        except Exception as exc:
+            # Non-blocking; a systematic failure (e.g. a revoked key) logs one traceback per batch
+            if self._first_research_error(exc):
+                self.logger.exception("Email research failed for %s", company_name)
+            else:
+                self.logger.debug("Email research failed for %s: %r", company_name, exc)
+            return _ResearchOutcome(error=f"EMAIL_RESEARCH_ERROR:{str(exc)}")
+
+    def _first_research_error(self, exc: Exception) -> bool:
+        """Count a research failure; True if it is the first of its type in this batch."""
+        with self._research_lock:
+            errors = self._research_errors
+            if errors is None:
+                return True
+            errors[type(exc).__name__] += 1
+            return errors[type(exc).__name__] == 1
+
+    def _assemble_result(
+        self,
+        page: _PageContacts,
+        page_validation: Optional[Tuple[bool, Optional[str]]],
+        research: _ResearchOutcome,
+        research_validation: Optional[Tuple[bool, Optional[str]]],
+    ) -> Tier2EnrichmentResult:
+        """Combine the contact page, validation and research outcomes of one lead.
+
+        The contact-page email wins; the researched email is used (and its
+        validation) only when the page gave none.
+
+        Args:
+            page: Steps 1-2 outcome.
+            page_validation: Step 3 outcome for ``page.email`` (None if no email).
+            research: Step 4 outcome.
+            research_validation: Validation of the researched email (None if unused).
+
+        Returns:
+            Tier2EnrichmentResult without ``linkedin_company``.
+        """
+        errors = list(page.errors)
+        email_specific = page.email
+        email_valid = False
+        contact_name = page.contact_name
+        contact_title = page.contact_title
+        tokens_used = page.tokens_used
+        email_researched: Optional[str] = None
+        email_source: Optional[str] = None
+        email_confidence = 0.0
+        research_notes: Optional[str] = None
+
+        if page_validation is not None:
+            email_valid, validation_error = page_validation
+            if validation_error:
+                errors.append(validation_error)
+
+        research_result = research.result
+        if research_result is not None:
+            # Extract company enrichment data (Phase 1)
+            company_enrichment = research_result.company_enrichment
+            if company_enrichment:
+                # Add company validation info to research_notes
+                # Initialize research_notes as empty string to avoid None concatenation
+                research_notes = ""
+                
+                if company_enrichment.razon_social_oficial:
+                    research_notes += f"Razón social: {company_enrichment.razon_social_oficial}"
+                    if company_enrichment.nombre_comercial:
+                        research_notes += f" | Nombre comercial: {company_enrichment.nombre_comercial}"
+                if company_enrichment.confidence_score < 0.5:
+                    if research_notes:
+                        research_notes += " | "
+                    research_notes += f"⚠️ Baja confianza ({company_enrichment.confidence_score:.2f}) - revisar manualmente"
+
+            if research_result.email:
+                email_researched = research_result.email
+                email_source = research_result.source_url
+                email_confidence = research_result.confidence
+                if research_result.notes:
+                    # If we already have research_notes, append to it; otherwise use notes directly
+                    if research_notes:
+                        research_notes += f" | {research_result.notes}"
+                    else:
+                        research_notes = research_result.notes
+
+                # If we didn't find email from scraping, use researched email
+                if not email_specific:
+                    email_specific = email_researched
+                    if research_validation is not None:
+                        email_valid = research_validation[0]
+
+                # Use contact info from research if available
+                if research_result.contact_name and not contact_name:
+                    contact_name = research_result.contact_name
+                if research_result.contact_position and not contact_title:
+                    contact_title = research_result.contact_position
+
+            elif research_result.error:
+                errors.append(f"EMAIL_RESEARCH:{research_result.error}")
+
+            # Prompt tokens reported by the researcher (reused results are free)
+            if research.fresh:
+                tokens_used += research_result.tokens_used
+                self._add_tokens(research_result.tokens_used)
+
+        if research.error:
+            errors.append(research.error)
+
+        # Step 5 (LinkedIn) runs alongside these steps in enrich_lead_async
         return Tier2EnrichmentResult(
             email_specific=email_specific,
             email_valid=email_valid,
             contact_name=contact_name,
             contact_title=contact_title,
-            linkedin_company=linkedin_company,
+            linkedin_company=None,
             email_researched=email_researched,
             email_source=email_source,
             email_confidence=email_confidence,
@@ -339,71 +934,598 @@ class Tier2Enricher:
             openai_tokens_used=tokens_used,
         )
 
+    def _find_linkedin(self, company_name: str) -> Optional[str]:
+        """Find the LinkedIn company URL (optional, errors are only logged).
+
+        Skipped while the LinkedIn circuit breaker is open.
+
+        Args:
+            company_name: Company name to search for.
+
+        Returns:
+            LinkedIn company URL, or None if not found or skipped.
+        """
+        if not company_name:
+            return None
+
+        def lookup() -> LinkedInResult:
+            if not self._linkedin_breaker.allow():
+                return LinkedInResult(company_url=None, success=False, error="CIRCUIT_OPEN")
+            result = self.linkedin_scraper.find_company(company_name)
+            # NOT_FOUND is a healthy answer; timeouts and scraper errors count as failures
+            error = result.error or ""
+            self._record_linkedin_outcome(
+                success=not (error == "TIMEOUT" or error.startswith("SCRAPER_ERROR")),
+                company_name=company_name,
+            )
+            return result
+
+        try:
+            # Cached answers are served even while the circuit is open
+            linkedin_result, _ = self._cached(
+                "linkedin",
+                hash_key(_company_key(company_name)),
+                lookup,
+                _linkedin_result_from_dict,
+                lambda result: result.success or result.error == "NOT_FOUND",
+                lambda result: self._linkedin_ttl if result.success else self._negative_ttl,
+            )
+            if linkedin_result.error == "CIRCUIT_OPEN":
+                return None
+            if linkedin_result.success and linkedin_result.company_url:
+                return linkedin_result.company_url
+            if linkedin_result.error:
+                # Log but don't add to errors (LinkedIn is optional)
+                log_event(
+                    self.logger,
+                    level=20,
+                    message="LinkedIn not found (optional)",
+                    extra={"company": company_name, "error": linkedin_result.error},
+                )
+        except Exception as exc:
+            self._record_linkedin_outcome(success=False, company_name=company_name)
+            # Log but don't block processing
+            log_event(
+                self.logger,
+                level=30,
+                message="LinkedIn scraper error (non-blocking)",
+                extra={"company": company_name, "error": str(exc)},
+            )
+        return None
+
+    def _record_linkedin_outcome(self, success: bool, company_name: str) -> None:
+        """Feed a LinkedIn call outcome to the circuit breaker and log when it opens.
+
+        Args:
+            success: False if the lookup timed out or errored.
+            company_name: Company looked up (for the log).
+        """
+        if self._linkedin_breaker.record(success):
+            log_event(
+                self.logger,
+                level=30,
+                message="LinkedIn lookups paused (circuit open)",
+                extra={"company": company_name, "cooldown": self._linkedin_breaker.cooldown},
+            )
+
+    def _research_email(
+        self, company_name: str, city: Optional[str], website: Optional[str]
+    ) -> Tuple[Any, bool]:
+        """Research an email, reusing an identical lookup from this batch or the disk cache.
+
+        Args:
+            company_name: Company name.
+            city: Company city.
+            website: Company website.
+
+        Returns:
+            Tuple of (research result, True if this call ran the research itself).
+        """
+        def run_research() -> EmailResearchResult:
+            # Fewer slots than leads in flight: Tavily's budget is much smaller than OpenAI's
+            with self._research_slots:
+                return self.email_researcher.research_email(company=company_name, city=city, website=website)
+
+        def research() -> Tuple[Any, bool]:
+            return self._cached(
+                "research",
+                hash_key(_company_key(company_name), city, website),
+                run_research,
+                _research_from_dict,
+                lambda result: not result.error,
+            )
+
+        lookups = self._research_lookups
+        if lookups is None:
+            return research()
+
+        key = (_company_key(company_name), city, website)
+        with self._research_lock:
+            self._research_requests += 1
+            future = lookups.get(key)
+            fresh = future is None
+            if fresh:
+                future = lookups[key] = Future()
+
+        if fresh:
+            try:
+                future.set_result(research())
+            except Exception as exc:
+                future.set_exception(exc)
+        result, researched_now = future.result()
+        return result, fresh and researched_now
+
+    def _parse_html(self, html_content: str) -> ParsedContactData:
+        """Parse a contact page, grouped with other workers' pages during a batch."""
+        offline_parses = self._offline_parses
+        if offline_parses is not None:
+            # Answered by the Batch API job of enrich_batch_offline (missing pages are parsed live)
+            parsed = offline_parses.get(hash_key(html_content))
+            if parsed is not None:
+                return parsed
+        batcher = self._parse_batcher
+        if batcher is None:
+            return self.openai_parser.parse_html(html_content)
+        return batcher.parse(html_content)
+
+    def _prefilter_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Process pool for the HTML prefilter, started on first use (None = run inline)."""
+        if self._html_workers <= 1:
+            return None
+        with self._lazy_lock:
+            if self._html_pool is None:
+                # Spawned (not forked) workers: this process already runs executor threads
+                self._html_pool = ProcessPoolExecutor(
+                    max_workers=min(self._html_workers, self.max_concurrency),
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._html_pool
+
+    def _prefilter(self, html: str) -> str:
+        """Run ``_prefilter_html`` in the enricher's process pool, or inline without one.
+
+        Args:
+            html: Raw page HTML.
+
+        Returns:
+            Prefiltered text (see ``_prefilter_html``).
+        """
+        pool = self._prefilter_pool()
+        if pool is not None:
+            try:
+                return pool.submit(_prefilter_html, html, self._max_page_chars).result()
+            except (BrokenProcessPool, OSError) as exc:
+                self.logger.warning(f"HTML prefilter pool unavailable, parsing inline from now on: {exc}")
+                self._html_workers = 1
+        return _prefilter_html(html, self._max_page_chars)
+
+    async def _prefetch_mx(self, leads: List[Dict[str, Any]]) -> None:
+        """Resolve the MX records of the leads' website and email domains in one burst.
+
+        Args:
+            leads: Leads about to be enriched.
+        """
+        if self._mx_prefetch_concurrency <= 0:
+            return
+        domains = set().union(*map(_lead_domains, leads))
+        try:
+            queried = await self.email_validator.prefetch_mx(domains, concurrency=self._mx_prefetch_concurrency)
+        except Exception as exc:
+            self.logger.warning(f"MX prefetch failed: {exc}")
+            return
+        self.logger.debug("MX prefetch: %d of %d domains queried", queried, len(domains))
+
+    def _linkedin_lookup(self, company_name: str) -> asyncio.Future:
+        """Start (or join) the batch-wide LinkedIn lookup for a company name.
+
+        Args:
+            company_name: Company name to search for.
+
+        Returns:
+            Future resolving to the LinkedIn company URL (or None).
+        """
+        loop = asyncio.get_running_loop()
+        lookups = self._linkedin_lookups
+        if lookups is None:
+            return loop.run_in_executor(None, self._find_linkedin, company_name)
+
+        self._linkedin_requests += 1
+        key = _company_key(company_name)
+        if key not in lookups:
+            lookups[key] = loop.run_in_executor(None, self._find_linkedin, company_name)
+        return lookups[key]
+
+    async def _contact_page(
+        self, website: Optional[str]
+    ) -> Tuple[_PageContacts, Optional[Tuple[bool, Optional[str]]]]:
+        """Steps 1-3 for one website: scrape and parse in the executor, then validate the email."""
+        page = await asyncio.get_running_loop().run_in_executor(None, self._scrape_and_parse, website)
+        # Validated as soon as the page is parsed, while research may still be running
+        validation = await self._validate_email_async(page.email) if page.email else None
+        return page, validation
+
+    async def _contact_page_lookup(
+        self, website: Optional[str]
+    ) -> Tuple[_PageContacts, Optional[Tuple[bool, Optional[str]]]]:
+        """Run (or join) the batch-wide contact page steps for the website's page.
+
+        Args:
+            website: Lead website, if any.
+
+        Returns:
+            Tuple of (_PageContacts, validation of its email or None).
+        """
+        lookups = self._page_lookups
+        page_key = _website_page_key(website) if website else None
+        if lookups is None or page_key is None:
+            return await self._contact_page(website)
+
+        self._page_requests += 1
+        lookup = lookups.get(page_key)
+        if lookup is None:
+            lookup = lookups[page_key] = asyncio.ensure_future(self._contact_page(website))
+            return await lookup
+        page, validation = await lookup
+        # The OpenAI tokens are reported on the lead that paid for the parse
+        return replace(page, tokens_used=0), validation
+
+    async def enrich_lead_async(
+        self, lead: Dict[str, Any], enable_email_research: bool = False
+    ) -> Tier2EnrichmentResult:
+        """Enrich a single lead without blocking the event loop.
+
+        The contact page (scrape, parse, validation), the email research and
+        the LinkedIn lookup are independent and run concurrently, so a lead takes
+        about as long as its slowest branch. The scrapers and API clients are
+        synchronous and run in the loop's default executor; MX checks run on the
+        loop. Within a batch, LinkedIn and research are resolved once per company
+        and the contact page once per website page (see ``_website_page_key``).
+
+        Args:
+            lead: Lead dictionary (see ``enrich_lead``).
+            enable_email_research: If True, use Tavily+OpenAI email research for priority>=3.
+
+        Returns:
+            Tier2EnrichmentResult with enriched data.
+        """
+        loop = asyncio.get_running_loop()
+        if self._needs_research(lead, enable_email_research):
+            research_step = loop.run_in_executor(None, self._research_step, lead, enable_email_research)
+        else:
+            # Decided here, without an executor round trip, for the leads that are not researched
+            research_step = loop.create_future()
+            research_step.set_result(_ResearchOutcome())
+        (page, page_validation), research, linkedin_company = await asyncio.gather(
+            self._contact_page_lookup(self._website(lead)),
+            research_step,
+            self._linkedin_lookup(self._company_name(lead)),
+        )
+        research_validation = None
+        if not page.email and research.email:
+            research_validation = await self._validate_email_async(research.email)
+
+        result = self._assemble_result(page, page_validation, research, research_validation)
+        result.linkedin_company = linkedin_company
+        return result
+
     def enrich_batch(self, leads: List[Dict[str, Any]], enable_email_research: bool = False) -> Tier2BatchReport:
         """Enrich a batch of leads (should be filtered to priority>=2).
 
         Args:
-            leads: List of lead dictionaries.
+            leads: List of lead dictionaries (updated in place).
             enable_email_research: If True, use Tavily+OpenAI email research for priority>=3.
 
         Returns:
             Tier2BatchReport with aggregate statistics.
         """
-        self.logger.info(f"enrich_batch called with enable_email_research={enable_email_research}, total leads={len(leads)}")
-        
-        # Verify API keys
-        openai_key = os.getenv('OPENAI_API_KEY')
-        tavily_key = os.getenv('TAVILY_API_KEY')
-        self.logger.info(f"API Keys Status - OpenAI configured: {bool(openai_key)}, Tavily configured: {bool(tavily_key)}")
-        self.logger.info(f"Email researcher available: {self.email_researcher is not None}")
-        
-        if enable_email_research:
-            self.logger.info("ENTRANDO en bloque de email research")
-            priority_3_count = sum(1 for lead in leads if lead.get("PRIORITY") is not None and int(lead.get("PRIORITY", 0)) >= 3)
-            self.logger.info(f"Starting email research for {priority_3_count} priority>=3 leads (out of {len(leads)} total)")
-            
-            # Log sample priorities for debugging
-            sample_priorities = [lead.get("PRIORITY") for lead in leads[:5]]
-            self.logger.debug(f"Sample priorities (first 5): {sample_priorities}")
-        else:
-            self.logger.info("SALTANDO email research (enable_email_research=False)")
-        
+
+        def store(lead: Dict[str, Any], values: Dict[str, Any]) -> None:
+            lead.update(values)
+
+        priorities = [lead.get("PRIORITY") for lead in leads]
+        return self._enrich_all(leads, priorities, enable_email_research, store)
+
+    def enrich_dataframe(
+        self, df: pd.DataFrame, enable_email_research: bool = False
+    ) -> Tuple[Dict[str, List[Any]], Tier2BatchReport]:
+        """Enrich every row of a DataFrame and return only the Tier2 output columns.
+
+        Rows are fed to ``enrich_lead`` straight from ``itertuples`` and results are
+        collected per column, avoiding a ``to_dict(orient="records")`` ->
+        ``pd.DataFrame(records)`` round-trip.
+
+        Args:
+            df: Leads to enrich (should be filtered to priority>=2).
+            enable_email_research: If True, use Tavily+OpenAI email research for priority>=3.
+
+        Returns:
+            Tuple of (output column -> values in row order, Tier2BatchReport).
+        """
+        columns: Dict[str, List[Any]] = {col: [] for col in TIER2_OUTPUT_COLUMNS}
+
+        def store(lead: Dict[str, Any], values: Dict[str, Any]) -> None:
+            for col, column_values in columns.items():
+                column_values.append(values[col])
+
+        names = list(df.columns) + [_COMPANY_KEY]
+        rows = zip(df.itertuples(index=False, name=None), _company_names(df).tolist())
+        leads = (dict(zip(names, (*row, company))) for row, company in rows)
+        priorities = df["PRIORITY"].tolist() if "PRIORITY" in df.columns else [None] * len(df)
+        report = self._enrich_all(leads, priorities, enable_email_research, store)
+        return columns, report
+
+    def enrich_batch_stream(
+        self,
+        leads: Iterable[Dict[str, Any]],
+        sink: Callable[[Dict[str, Any]], None],
+        enable_email_research: bool = False,
+    ) -> Tier2BatchReport:
+        """Enrich leads from any iterable, handing each enriched lead to ``sink`` in order.
+
+        Leads are read and enriched ``chunk_size`` at a time, so memory is bounded by
+        the chunk size rather than the number of leads. Per-lead errors are only kept
+        in each lead's TIER2_ERRORS value (the report's ``errors`` stays empty).
+
+        Args:
+            leads: Lead dictionaries (e.g. a generator over a file).
+            sink: Called once per lead, with the lead updated with the Tier2 columns.
+            enable_email_research: If True, use Tavily+OpenAI email research for priority>=3.
+
+        Returns:
+            Tier2BatchReport with aggregate statistics.
+        """
+
+        def store(lead: Dict[str, Any], values: Dict[str, Any]) -> None:
+            lead.update(values)
+            sink(lead)
+
+        return self._enrich_all(leads, None, enable_email_research, store, collect_errors=False)
+
+    def enrich_batch_offline(
+        self,
+        leads: List[Dict[str, Any]],
+        enable_email_research: bool = False,
+        poll_interval: float = 60.0,
+        timeout: float = 24 * 3600.0,
+    ) -> Tier2BatchReport:
+        """Enrich leads like ``enrich_batch``, parsing contact pages through the OpenAI Batch API.
+
+        For non-interactive runs: every contact page is scraped first, the pages
+        not already in the disk cache are sent as one Batch API job (about half
+        the token price, no rate limits, results within 24h) and, once it is done,
+        the leads are enriched as usual with those answers. Pages the job did not
+        answer (or all of them if it fails or times out) are parsed live. Email
+        research still calls OpenAI directly.
+
+        Args:
+            leads: List of lead dictionaries (updated in place, as in ``enrich_batch``).
+            enable_email_research: If True, use Tavily+OpenAI email research for priority>=3.
+            poll_interval: Seconds between Batch API status checks.
+            timeout: Seconds to wait for the Batch API job.
+
+        Returns:
+            Tier2BatchReport with aggregate statistics.
+        """
+        if not self.openai_parser:
+            return self.enrich_batch(leads, enable_email_research)
+
+        websites = {self._website(lead) for lead in leads}
+        page_texts = asyncio.run(self._collect_page_texts(websites))
+
+        pending: Dict[str, str] = {}
+        for parser_input, _ in page_texts.values():
+            if not parser_input:
+                continue
+            key = hash_key(parser_input)
+            if self._disk_cache is None or self._disk_cache.get("parse", key) is None:
+                pending[key] = parser_input
+
+        offline_parses: Dict[str, ParsedContactData] = {}
+        if pending:
+            self.logger.info(f"Parsing {len(pending)} contact pages through the OpenAI Batch API")
+            try:
+                batch_id = self.openai_parser.submit_offline_batch(pending)
+                offline_parses = self.openai_parser.collect_offline_batch(batch_id, poll_interval, timeout)
+            except Exception as exc:
+                self.logger.warning(f"OpenAI batch failed, parsing pages live: {exc}")
+
+        self._page_texts = page_texts
+        self._offline_parses = offline_parses
+        try:
+            return self.enrich_batch(leads, enable_email_research)
+        finally:
+            self._page_texts = None
+            self._offline_parses = None
+
+    async def _collect_page_texts(
+        self, websites: Iterable[Optional[str]]
+    ) -> Dict[Optional[str], Tuple[Optional[str], List[str]]]:
+        """Run ``_contact_page_text`` for every website, ``max_concurrency`` at a time.
+
+        Websites are gathered ``chunk_size`` at a time so that no more than one
+        chunk of pending tasks exists at once.
+        """
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=self.max_concurrency))
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(website: Optional[str]) -> Tuple[Optional[str], Tuple[Optional[str], List[str]]]:
+            async with semaphore:
+                return website, await loop.run_in_executor(None, self._contact_page_text, website)
+
+        page_texts: Dict[Optional[str], Tuple[Optional[str], List[str]]] = {}
+        for chunk in _chunks(websites, self.chunk_size):
+            page_texts.update(await asyncio.gather(*(fetch(website) for website in chunk)))
+        return page_texts
+
+    async def _enrich_concurrently(
+        self,
+        leads: Iterable[Dict[str, Any]],
+        enable_email_research: bool,
+        on_result: Callable[[Dict[str, Any], Tier2EnrichmentResult], None],
+        total: Optional[int],
+    ) -> int:
+        """Run ``enrich_lead_async`` for every lead, at most ``max_concurrency`` at a time.
+
+        Leads are consumed ``chunk_size`` at a time; each chunk's results are handed
+        to ``on_result`` in lead order before the next chunk is read. The progress
+        bar advances as leads complete. If a lead raises (or the run is cancelled,
+        e.g. Ctrl-C) the chunk's remaining leads are cancelled rather than left running.
+
+        Args:
+            leads: Lead dictionaries, in order.
+            enable_email_research: If True, use Tavily+OpenAI email research for priority>=3.
+            on_result: Callback receiving each lead and its Tier2EnrichmentResult.
+            total: Number of leads if known (for progress display).
+
+        Returns:
+            Number of leads enriched.
+        """
+        # Each lead keeps up to three blocking calls in flight (contact page, research, LinkedIn)
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=3 * self.max_concurrency))
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
         try:
             from tqdm import tqdm
 
-            iterator = tqdm(leads, desc="Tier2 enrichment")
+            progress = tqdm(desc="Tier2 enrichment", total=total)
         except Exception:
-            iterator = leads
+            progress = None
+
+        async def bounded(idx: int, lead: Dict[str, Any]) -> Tier2EnrichmentResult:
+            async with semaphore:
+                if enable_email_research and idx < 3:  # Log first 3 leads for debugging
+                    self.logger.debug(
+                        "Processing lead %d: company=%s, priority=%s",
+                        idx + 1,
+                        self._company_name(lead),
+                        lead.get("PRIORITY"),
+                    )
+                return await self.enrich_lead_async(lead, enable_email_research=enable_email_research)
+
+        self.logger.info(
+            f"Enriching {total if total is not None else 'streamed'} leads "
+            f"(max {self.max_concurrency} concurrent, chunks of {self.chunk_size})"
+        )
+        self._linkedin_lookups = {}
+        self._research_lookups = {}
+        self._page_lookups = {}
+        self._linkedin_requests = 0
+        self._research_requests = 0
+        self._page_requests = 0
+        self._research_errors = Counter()
+        if self.openai_parser and self._parse_batch_size > 1:
+            self._parse_batcher = _ParseBatcher(
+                self.openai_parser, min(self._parse_batch_size, self.max_concurrency), self._parse_batch_wait
+            )
+        done = 0
+        tasks: List[asyncio.Future] = []
+        try:
+            for chunk in _chunks(leads, self.chunk_size):
+                # Validations of these domains then hit the cache (or join the query in flight)
+                tasks = [asyncio.ensure_future(self._prefetch_mx(chunk))]
+                tasks += [asyncio.ensure_future(bounded(done + i, lead)) for i, lead in enumerate(chunk)]
+                for finished in asyncio.as_completed(tasks[1:]):
+                    await finished
+                    if progress is not None:
+                        progress.update(1)
+                await tasks[0]
+                for lead, task in zip(chunk, tasks[1:]):
+                    on_result(lead, task.result())
+                done += len(chunk)
+                # Release this chunk's leads and results before the next one is read
+                del chunk
+                tasks = []
+            return done
+        finally:
+            for task in tasks:
+                task.cancel()
+            self.logger.info(
+                f"Company lookups: LinkedIn {len(self._linkedin_lookups)} distinct / "
+                f"{self._linkedin_requests} requested, email research {len(self._research_lookups)} "
+                f"distinct / {self._research_requests} requested, contact pages "
+                f"{len(self._page_lookups)} distinct / {self._page_requests} requested"
+            )
+            if self._research_errors:
+                self.logger.warning(
+                    "Email research failures: %s",
+                    ", ".join(f"{name} x{count}" for name, count in self._research_errors.most_common()),
+                )
+            self._linkedin_lookups = None
+            self._research_lookups = None
+            self._page_lookups = None
+            self._research_errors = None
+            self._parse_batcher = None
+            if progress is not None:
+                progress.close()
+
+    def _enrich_all(
+        self,
+        leads: Iterable[Dict[str, Any]],
+        priorities: Optional[List[Any]],
+        enable_email_research: bool,
+        store: Callable[[Dict[str, Any], Dict[str, Any]], None],
+        collect_errors: bool = True,
+    ) -> Tier2BatchReport:
+        """Enrich leads concurrently, handing each lead's output columns to ``store`` in order.
+
+        Args:
+            leads: Lead dictionaries, in order.
+            priorities: PRIORITY value of each lead (same order as ``leads``), or None
+                when the leads are streamed.
+            enable_email_research: If True, use Tavily+OpenAI email research for priority>=3.
+            store: Callback receiving the lead and its Tier2 output column values.
+            collect_errors: If False, per-lead errors are not gathered in the report.
+
+        Returns:
+            Tier2BatchReport with aggregate statistics.
+        """
+        total = len(priorities) if priorities is not None else None
+        self.logger.info(
+            "enrich_batch called with enable_email_research=%s, total leads=%s",
+            enable_email_research,
+            total,
+        )
+        if enable_email_research:
+            self.logger.info("Email researcher available: %s", self.email_researcher is not None)
+            if priorities is not None:
+                priority_3_count = sum(1 for priority in map(_lead_priority, priorities) if priority is not None and priority >= 3)
+                self.logger.info(f"Starting email research for {priority_3_count} priority>=3 leads (out of {total} total)")
+            
+                # Log sample priorities for debugging
+                self.logger.debug(f"Sample priorities (first 5): {priorities[:5]}")
+        else:
+            self.logger.info("SALTANDO email research (enable_email_research=False)")
 
-        total = len(leads)
         emails_found = 0
         emails_researched = 0
         linkedin_found = 0
         contacts_found = 0
         errors: List[str] = []
+        position = 0
 
-        for idx, lead in enumerate(iterator):
-            if enable_email_research and idx < 3:  # Log first 3 leads for debugging
-                self.logger.debug(
-                    f"Processing lead {idx+1}: company={lead.get('NOMBRE_EMPRESA') or lead.get('RAZON_SOCIAL')}, "
-                    f"priority={lead.get('PRIORITY')}"
-                )
-            result = self.enrich_lead(lead, enable_email_research=enable_email_research)
-            
+        def on_result(lead: Dict[str, Any], result: Tier2EnrichmentResult) -> None:
+            nonlocal emails_found, emails_researched, linkedin_found, contacts_found, position
+            position += 1
             if enable_email_research and result.email_researched:
-                self.logger.info(f"Email encontrado via research: {result.email_researched} para lead {idx+1}")
-
-            # Update lead dict in place
-            lead["EMAIL_SPECIFIC"] = result.email_specific
-            lead["EMAIL_VALID"] = result.email_valid
-            lead["CONTACT_NAME"] = result.contact_name
-            lead["CONTACT_TITLE"] = result.contact_title
-            lead["LINKEDIN_COMPANY"] = result.linkedin_company
-            lead["EMAIL_RESEARCHED"] = result.email_researched
-            lead["EMAIL_SOURCE"] = result.email_source
-            lead["EMAIL_CONFIDENCE"] = result.email_confidence
-            lead["RESEARCH_NOTES"] = result.research_notes
-            lead["TIER2_ERRORS"] = ",".join(result.errors) if result.errors else ""
+                self.logger.info("Email encontrado via research: %s para lead %d", result.email_researched, position)
+
+            store(
+                lead,
+                {
+                    "EMAIL_SPECIFIC": result.email_specific,
+                    "EMAIL_VALID": result.email_valid,
+                    "CONTACT_NAME": result.contact_name,
+                    "CONTACT_TITLE": result.contact_title,
+                    "LINKEDIN_COMPANY": result.linkedin_company,
+                    "EMAIL_RESEARCHED": result.email_researched,
+                    "EMAIL_SOURCE": result.email_source,
+                    "EMAIL_CONFIDENCE": result.email_confidence,
+                    "RESEARCH_NOTES": result.research_notes,
+                    "TIER2_ERRORS": ",".join(result.errors) if result.errors else "",
+                },
+            )
 
             # Count successes
             if result.email_specific:
@@ -414,9 +1536,11 @@ class Tier2Enricher:
                 linkedin_found += 1
             if result.contact_name:
                 contacts_found += 1
-            if result.errors:
+            if collect_errors and result.errors:
                 errors.extend(result.errors)
 
+        total = asyncio.run(self._enrich_concurrently(leads, enable_email_research, on_result, total))
+
         # Log email research completion and costs
         if enable_email_research:
             self.logger.info(f"Email research complete: {emails_researched}/{total} leads")
@@ -427,6 +1551,11 @@ class Tier2Enricher:
             total_cost = input_cost + output_cost
             self.logger.info(f"OpenAI tokens used: {self.total_tokens:,}, estimated cost: ${total_cost:.4f}")
 
+        mx_cache = self._mx_cache
+        self.logger.info(
+            f"MX cache: {mx_cache.hits} hits, {mx_cache.misses} misses, {mx_cache.evictions} evictions"
+        )
+
         return Tier2BatchReport(
             total=total,
             emails_found=emails_found,
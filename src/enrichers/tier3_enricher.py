@@ -5,18 +5,174 @@ Only fills empty fields based on enrichment_rules.yaml.
 
 from __future__ import annotations
 
-from typing import Protocol, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from string import Formatter
+from typing import Any, Callable, Protocol
 from urllib.parse import urlparse
 import re
 
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 
 from ..utils.logger import setup_logger
 from ..utils.config_loader import load_yaml_config
 
 logger = setup_logger()
 
+# Valid CNAE code (basic: numeric, 4-5 digits)
+CNAE_PATTERN = re.compile(r"\d{4,5}")
+
+# WEBSITE_SOURCE/CNAE_SOURCE label of values found by Tier3
+SEARCH_SOURCE = "search"
+
+# Upper bound for a URL check, whatever http_timeout says (seconds)
+MAX_HTTP_TIMEOUT = 5.0
+
+# Host of a URL with or without scheme (userinfo and port excluded)
+_HOST_RE = r"^(?:[A-Za-z][A-Za-z0-9+.-]*://)?(?:[^@/?#]*@)?([^:/?#]*)"
+
+# query_template placeholders and the columns they are filled from
+QUERY_TEMPLATE_FIELDS = {"razon_social": "RAZON_SOCIAL", "cif": "CIF"}
+
+
+@lru_cache(maxsize=32)
+def _compile_query_template(template: str) -> tuple[str | tuple[str, str | None], ...]:
+    """Split ``query_template`` into literal strings and ``(column, format)`` fields.
+
+    Parsed once per template (not once per call or row). Empty literals are
+    dropped and adjacent ones merged, so filling the template costs one
+    concatenation per remaining part. ``format`` is None for plain fields.
+
+    Raises:
+        KeyError: If the template uses an unknown placeholder.
+        ValueError: If the template is malformed.
+    """
+    parts: list[str | tuple[str, str | None]] = []
+    for literal, field_name, format_spec, conversion in Formatter().parse(template):
+        if literal:
+            if parts and isinstance(parts[-1], str):
+                parts[-1] += literal
+            else:
+                parts.append(literal)
+        if field_name is None:
+            continue
+        spec = None
+        if format_spec or conversion:
+            spec = "{0" + (f"!{conversion}" if conversion else "") + (f":{format_spec}" if format_spec else "") + "}"
+        parts.append((QUERY_TEMPLATE_FIELDS[field_name], spec))
+    return tuple(parts)
+
+
+def _format_queries(template: str, df: pd.DataFrame) -> pd.Series:
+    """Build the search query of every row at once from ``query_template``.
+
+    The template is compiled once (see ``_compile_query_template``) and each
+    placeholder is filled with a whole column (missing values and missing
+    columns become ""). Runs of whitespace left by empty fields are collapsed,
+    and rows where every placeholder is empty get an empty query (nothing to
+    search for) instead of the template's bare literals.
+
+    Args:
+        template: Template such as ``"{razon_social} {cif} CNAE"``.
+        df: Rows to build queries for.
+
+    Returns:
+        Series of stripped queries, aligned with ``df``.
+
+    Raises:
+        KeyError: If the template uses an unknown placeholder.
+        ValueError: If the template is malformed.
+    """
+    parts = _compile_query_template(template)
+    queries: pd.Series | None = None
+    # Rows with at least one non-blank field (only tracked when the template has fields)
+    has_field = None if all(isinstance(part, str) for part in parts) else pd.Series(False, index=df.index)
+    for part in parts:
+        if isinstance(part, str):
+            values = part
+        else:
+            column, spec = part
+            if column not in df.columns:
+                continue
+            values = df[column].astype(object)
+            values = values.where(values.notna(), "")
+            values = values.map(spec.format) if spec else values.astype(str)
+            has_field |= values.str.strip().ne("")
+        if queries is None:
+            queries = values if isinstance(values, pd.Series) else pd.Series(values, index=df.index, dtype=object)
+        else:
+            queries = queries + values
+    if queries is None:
+        return pd.Series("", index=df.index, dtype=object)
+    queries = queries.str.replace(r"\s+", " ", regex=True).str.strip()
+    return queries if has_field is None else queries.where(has_field, "")
+
+
+def _empty_mask(series: pd.Series) -> pd.Series:
+    """Boolean mask of empty cells (None, NaN or blank strings), computed without a per-row call.
+
+    Same rule as ``Tier3Enricher._is_empty``.
+    """
+    mask = series.isna()
+    # Only text columns can hold blank strings (numeric columns have no .str accessor)
+    if series.dtype == object or pd.api.types.is_string_dtype(series.dtype):
+        blank = series.str.strip().eq("")
+        mask |= blank.where(blank.notna(), False).astype(bool)
+    return mask
+
+
+def _copy_columns(df: pd.DataFrame, columns: tuple[str, ...]) -> pd.DataFrame:
+    """Shallow copy of ``df`` with its own copy of the ``columns`` that will be written.
+
+    The other columns keep sharing memory with ``df``, so enriching a wide frame
+    does not duplicate it.
+    """
+    df_result = df.copy(deep=False)
+    for column in columns:
+        if column in df_result.columns:
+            df_result[column] = df[column].copy()
+    return df_result
+
+
+def _empty_source(df: pd.DataFrame) -> pd.Series:
+    """All-missing source column stored as a categorical (one small code per row, not a string)."""
+    return pd.Series(pd.Categorical([None] * len(df), categories=[SEARCH_SOURCE]), index=df.index)
+
+
+@lru_cache(maxsize=8192)
+def _normalize_url(url: str) -> str:
+    """Strip ``url`` and add https:// if it has no scheme (memoized: candidates repeat)."""
+    url = url.strip()
+    if not url or url.startswith(("http://", "https://")):
+        return url
+    return f"https://{url}"
+
+
+def _row_positions(mask: pd.Series) -> np.ndarray:
+    """Positions of the rows selected by a boolean mask.
+
+    Rows are tracked by position rather than label so that frames with a
+    repeated index (e.g. concatenated sheets) are written row by row.
+    """
+    return np.flatnonzero(mask.to_numpy(dtype=bool))
+
+
+def _fill_found(df: pd.DataFrame, column: str, source_column: str, positions: list[int], values: list[str]) -> None:
+    """Write the values found for the rows at ``positions`` (and their source) in one assignment each."""
+    if not positions:
+        return
+    # Columns read from Excel may be all-NaN floats: make room for strings
+    if df[column].dtype != object:
+        df[column] = df[column].astype(object)
+    df.iloc[positions, df.columns.get_loc(column)] = values
+    source = df[source_column]
+    if isinstance(source.dtype, pd.CategoricalDtype) and SEARCH_SOURCE not in source.cat.categories:
+        df[source_column] = source.cat.add_categories([SEARCH_SOURCE])
+    df.iloc[positions, df.columns.get_loc(source_column)] = SEARCH_SOURCE
+
 
 class SearchClient(Protocol):
     """Protocol for search clients that can find company websites and CNAE codes."""
@@ -44,6 +200,37 @@ class SearchClient(Protocol):
         ...
 
 
+class BatchSearchClient(SearchClient, Protocol):
+    """Search client that can also answer many queries in one call.
+
+    Optional: Tier3Enricher uses the ``*_batch`` methods when the client's
+    class implements them and otherwise calls the single-query methods from
+    its own thread pool.
+    """
+
+    def search_company_website_batch(self, queries: list[str]) -> list[str | None]:
+        """Search for the websites of several companies in one call.
+
+        Args:
+            queries: Search query strings.
+
+        Returns:
+            One URL string (or None) per query, in order.
+        """
+        ...
+
+    def search_company_cnae_batch(self, queries: list[str]) -> list[str | None]:
+        """Search for the CNAE codes of several companies in one call.
+
+        Args:
+            queries: Search query strings.
+
+        Returns:
+            One CNAE code string (or None) per query, in order.
+        """
+        ...
+
+
 class HttpClient(Protocol):
     """Protocol for HTTP clients that can check URL validity."""
 
@@ -67,13 +254,52 @@ class SimpleSearchClient:
     a proper search API (Google Custom Search, Bing, etc.).
     """
 
-    def __init__(self, max_results: int = 3) -> None:
+    def __init__(self, max_results: int = 3, max_workers: int = 16) -> None:
         """Initialize search client.
 
         Args:
             max_results: Maximum number of search results to consider.
+            max_workers: Queries searched at once by the ``*_batch`` methods.
         """
         self.max_results = max_results
+        self.max_workers = max(1, max_workers)
+
+    def _search_batch(self, search: Callable[[str], str | None], queries: list[str]) -> list[str | None]:
+        """Run ``search`` for every query, ``max_workers`` at a time (failed queries give None)."""
+
+        def search_one(query: str) -> str | None:
+            try:
+                return search(query)
+            except Exception as e:
+                logger.warning(f"Search failed for query {query!r}: {e}")
+                return None
+
+        if self.max_workers <= 1 or len(queries) <= 1:
+            return [search_one(query) for query in queries]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(queries))) as pool:
+            return list(pool.map(search_one, queries))
+
+    def search_company_website_batch(self, queries: list[str]) -> list[str | None]:
+        """Search for several company websites concurrently.
+
+        Args:
+            queries: Search query strings.
+
+        Returns:
+            One URL string (or None) per query, in order.
+        """
+        return self._search_batch(self.search_company_website, queries)
+
+    def search_company_cnae_batch(self, queries: list[str]) -> list[str | None]:
+        """Search for several company CNAE codes concurrently.
+
+        Args:
+            queries: Search query strings.
+
+        Returns:
+            One CNAE code string (or None) per query, in order.
+        """
+        return self._search_batch(self.search_company_cnae, queries)
 
     def search_company_website(self, query: str) -> str | None:
         """Search for company website using simple web scraping.
@@ -107,16 +333,39 @@ class SimpleSearchClient:
 
 
 class SimpleHttpClient:
-    """Simple HTTP client using requests library."""
+    """Simple HTTP client using requests library.
+
+    Keeps one pooled ``requests.Session`` so checks against the same host reuse
+    the connection (no new TCP/TLS handshake per URL). Use as a context manager
+    or call ``close()`` to release it.
+    """
 
-    def __init__(self, accepted_status_codes: list[int] | None = None) -> None:
+    def __init__(self, accepted_status_codes: list[int] | None = None, pool_maxsize: int = 64) -> None:
         """Initialize HTTP client.
 
         Args:
             accepted_status_codes: List of accepted HTTP status codes.
                 Defaults to [200, 301, 302, 307, 308].
+            pool_maxsize: Keep-alive connections kept per host.
         """
         self.accepted_status_codes = accepted_status_codes or [200, 301, 302, 307, 308]
+        self._accepted = frozenset(self.accepted_status_codes)
+        self._session = requests.Session()
+        self._session.headers["User-Agent"] = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+        # A dead URL is an answer, not something to retry
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=pool_maxsize, max_retries=0)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> SimpleHttpClient:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def is_url_alive(self, url: str, timeout: float) -> bool:
         """Check if URL is alive (returns acceptable status code).
@@ -133,18 +382,12 @@ class SimpleHttpClient:
             if not url.startswith(("http://", "https://")):
                 url = f"https://{url}"
 
-            # Ensure timeout is maximum 5 seconds
-            timeout = min(float(timeout), 5.0)
-
-            response = requests.head(
-                url,
-                timeout=timeout,
-                allow_redirects=True,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                },
-            )
-            return response.status_code in self.accepted_status_codes
+            # Ensure timeout is maximum 5 seconds (Tier3Enricher passes it already clamped)
+            if timeout > MAX_HTTP_TIMEOUT:
+                timeout = MAX_HTTP_TIMEOUT
+
+            response = self._session.head(url, timeout=timeout, allow_redirects=True)
+            return response.status_code in self._accepted
         except Exception as e:
             logger.debug(f"URL check failed for {url}: {e}")
             return False
@@ -177,13 +420,101 @@ class Tier3Enricher:
             rules = config.get("tier3", {})
 
         self._rules = rules
+        # Rows searched/checked in parallel (1 = one after another)
+        self._concurrency = max(1, int(rules.get("concurrency", 16)))
         self._search_client = search_client or SimpleSearchClient(
-            max_results=rules.get("website", {}).get("max_results", 3)
+            max_results=rules.get("website", {}).get("max_results", 3),
+            max_workers=self._concurrency,
         )
         website_config = rules.get("website", {})
         self._http_client = http_client or SimpleHttpClient(
             accepted_status_codes=website_config.get("accepted_status_codes", [200, 301, 302, 307, 308])
         )
+        # Blacklist entries with a dot are domains (matched with their subdomains through a set);
+        # bare words ("facebook") match anywhere in the host through one compiled alternation
+        entries = [str(entry).strip().lower().removeprefix("www.") for entry in website_config.get("domains_blacklist", [])]
+        self._blacklist = frozenset(entry for entry in entries if "." in entry)
+        keywords = sorted({entry for entry in entries if entry and "." not in entry})
+        self._blacklist_keywords = re.compile("|".join(map(re.escape, keywords))) if keywords else None
+        # URL checks (alive and dead) and blacklist verdicts are memoized for the
+        # enricher's lifetime: search results repeat the same sites across rows and calls
+        self._is_url_alive = lru_cache(maxsize=10_000)(self._http_client.is_url_alive)
+        self._is_blacklisted_host = lru_cache(maxsize=10_000)(self._is_blacklisted_host)
+
+        # Settings read by every enrich_* call, resolved once here
+        cnae_config = rules.get("cnae", {})
+        self._website_enabled = bool(website_config.get("enabled", True))
+        self._website_query_template = website_config.get("query_template", "{razon_social} {cif}")
+        self._http_timeout = min(float(website_config.get("http_timeout", 3.0)), MAX_HTTP_TIMEOUT)
+        self._cnae_enabled = bool(cnae_config.get("enabled", True))
+        self._cnae_query_template = cnae_config.get("query_template", "{razon_social} {cif} CNAE")
+
+    def _map_rows(self, lookup: Callable[[Any, str], str | None], queries: pd.Series) -> list[str | None]:
+        """Run ``lookup(idx, query)`` for every row, ``concurrency`` rows at a time.
+
+        Searches and URL checks are network-bound, so rows overlap their waits
+        instead of running one after another. Rows repeating a query (same
+        company listed twice) share one call. Results keep the row order.
+        """
+        distinct = queries.drop_duplicates()
+        if len(distinct) < len(queries):
+            found = dict(zip(distinct.tolist(), self._map_rows(lookup, distinct)))
+            return [found[query] for query in queries.tolist()]
+        if self._concurrency <= 1 or len(queries) <= 1:
+            return [lookup(idx, query) for idx, query in queries.items()]
+        with ThreadPoolExecutor(max_workers=min(self._concurrency, len(queries))) as pool:
+            return list(pool.map(lookup, queries.index, queries.tolist()))
+
+    def _search_rows(self, kind: str, queries: pd.Series) -> pd.Series:
+        """Search every distinct non-empty query with ``search_company_<kind>``.
+
+        Clients whose class implements ``search_company_<kind>_batch`` (see
+        ``BatchSearchClient``) get all queries in one call; others are called
+        per query through ``_map_rows``.
+
+        Args:
+            kind: "website" or "cnae".
+            queries: Query of each row.
+
+        Returns:
+            Series aligned with ``queries`` holding each result (None when
+            nothing was found, the query was empty or the search failed).
+        """
+        distinct = queries[queries.ne("")].drop_duplicates()
+        if distinct.empty:
+            return pd.Series(None, index=queries.index, dtype=object)
+
+        name = f"search_company_{kind}"
+        batch = getattr(type(self._search_client), f"{name}_batch", None)
+        # Subclasses of the protocols inherit its stubs, which are not implementations
+        if batch is not None and batch is not getattr(BatchSearchClient, f"{name}_batch"):
+            try:
+                results = list(getattr(self._search_client, f"{name}_batch")(distinct.tolist()))
+                if len(results) != len(distinct):
+                    raise ValueError(f"expected {len(distinct)} results, got {len(results)}")
+            except Exception as e:
+                logger.warning(f"Error enriching {kind.upper()} for {len(distinct)} queries: {e}")
+                results = [None] * len(distinct)
+        else:
+            search = getattr(self._search_client, name)
+
+            def lookup(idx: Any, query: str) -> str | None:
+                try:
+                    return search(query)
+                except Exception as e:
+                    logger.warning(f"Error enriching {kind.upper()} for row {idx}: {e}")
+                return None
+
+            results = self._map_rows(lookup, distinct)
+
+        found = dict(zip(distinct.tolist(), results))
+        return pd.Series([found.get(query) for query in queries.tolist()], index=queries.index, dtype=object)
+
+    def close(self) -> None:
+        """Release the HTTP client's connections (if it holds any)."""
+        close = getattr(self._http_client, "close", None)
+        if callable(close):
+            close()
 
     def _is_empty(self, value: Any) -> bool:
         """Check if value is empty (None, NaN, empty string).
@@ -211,12 +542,7 @@ class Tier3Enricher:
         Returns:
             Normalized URL.
         """
-        url = url.strip()
-        if not url:
-            return url
-        if url.startswith(("http://", "https://")):
-            return url
-        return f"https://{url}"
+        return _normalize_url(url)
 
     def _is_blacklisted_domain(self, url: str) -> bool:
         """Check if URL domain is in blacklist.
@@ -227,144 +553,147 @@ class Tier3Enricher:
         Returns:
             True if domain is blacklisted, False otherwise.
         """
-        blacklist = self._rules.get("website", {}).get("domains_blacklist", [])
-        if not blacklist:
+        if not self._blacklist and self._blacklist_keywords is None:
             return False
 
         try:
-            parsed = urlparse(self._normalize_url(url))
-            domain = parsed.netloc.lower()
-            for blacklisted in blacklist:
-                if blacklisted.lower() in domain:
-                    return True
-        except Exception:
-            pass
-        return False
+            domain = urlparse(self._normalize_url(url)).hostname or ""
+        except ValueError:
+            return False
+        return self._is_blacklisted_host(domain)
 
-    def enrich_website(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _is_blacklisted_host(self, host: str) -> bool:
+        """Check a lowercase hostname against the blacklist (see ``_is_blacklisted_domain``)."""
+        if self._blacklist_keywords is not None and self._blacklist_keywords.search(host):
+            return True
+        # The domain itself or any parent domain (m.facebook.com -> facebook.com), one set
+        # lookup per label; a plain substring test would also block e.g. "netflix.com" for "x.com"
+        labels = host.split(".")
+        return any(".".join(labels[i:]) in self._blacklist for i in range(len(labels)))
+
+    def enrich_website(self, df: pd.DataFrame, *, inplace: bool = False) -> pd.DataFrame:
         """Intenta completar WEBSITE para filas con WEBSITE vacío.
 
         Entrada:
             df: DataFrame con al menos columnas RAZON_SOCIAL, CIF, WEBSITE.
+            inplace: Si es True, escribe directamente en ``df``.
 
         Salida:
-            Nuevo DataFrame con WEBSITE rellenado cuando se encuentra
-            un dominio válido (status HTTP 200-399).
+            DataFrame con WEBSITE rellenado cuando se encuentra un dominio
+            válido (status HTTP 200-399). Salvo ``inplace``, ``df`` no se
+            modifica: sólo se copian WEBSITE y WEBSITE_SOURCE.
         """
-        df_result = df.copy()
+        df_result = df if inplace else _copy_columns(df, ("WEBSITE", "WEBSITE_SOURCE"))
 
         # Initialize WEBSITE_SOURCE column if not exists
         if "WEBSITE_SOURCE" not in df_result.columns:
-            df_result["WEBSITE_SOURCE"] = None
+            df_result["WEBSITE_SOURCE"] = _empty_source(df_result)
 
-        website_config = self._rules.get("website", {})
-        if not website_config.get("enabled", True):
+        if not self._website_enabled:
             logger.info("Website enrichment is disabled in config")
             return df_result
 
         # Filter rows where WEBSITE is empty
-        mask_empty = df_result["WEBSITE"].apply(self._is_empty)
-        df_empty = df_result[mask_empty].copy()
+        mask_empty = _empty_mask(df_result["WEBSITE"])
+        n_empty = int(mask_empty.sum())
 
-        if len(df_empty) == 0:
+        if n_empty == 0:
             logger.info("No rows with empty WEBSITE to enrich")
             return df_result
 
-        logger.info(f"Enriching WEBSITE for {len(df_empty)} rows")
+        logger.info(f"Enriching WEBSITE for {n_empty} rows")
+
+        query_template = self._website_query_template
+        timeout = self._http_timeout
+
+        try:
+            queries = _format_queries(query_template, df_result.loc[mask_empty])
+            queries.index = _row_positions(mask_empty)
+        except (KeyError, ValueError) as e:
+            logger.warning(f"Invalid WEBSITE query_template {query_template!r}: {e}")
+            return df_result
+
+        # Only the searches and URL checks run per query; the steps in between work on
+        # whole columns and results are written in one assignment
+        candidates = self._search_rows("website", queries)
+        urls = candidates[candidates.astype(bool)].astype(str).str.strip()
+        urls = urls[urls.ne("")]
+        if urls.empty:
+            return df_result
+
+        # Check if blacklisted: hosts extracted for all candidates at once, each host checked once
+        if self._blacklist or self._blacklist_keywords is not None:
+            hosts = urls.str.extract(_HOST_RE, expand=False).fillna("").str.lower()
+            blocked = hosts.map({host: self._is_blacklisted_host(host) for host in hosts.unique()})
+            if blocked.any():
+                logger.debug(f"Skipping {int(blocked.sum())} blacklisted domains: {urls[blocked].unique().tolist()}")
+            urls = urls[~blocked]
 
-        query_template = website_config.get("query_template", "{razon_social} {cif}")
-        timeout = min(website_config.get("http_timeout", 3.0), 5.0)  # Maximum 5 seconds
+        # Validate URL is alive (once per distinct URL)
+        normalized = urls.where(urls.str.startswith(("http://", "https://")), "https://" + urls)
+        distinct = pd.Series(normalized.unique(), dtype=object)
+        distinct.index = distinct.tolist()
 
-        for idx, row in df_empty.iterrows():
+        def check_alive(url: str, _: str) -> bool:
             try:
-                # Build search query
-                query = query_template.format(
-                    razon_social=row.get("RAZON_SOCIAL", ""),
-                    cif=row.get("CIF", ""),
-                ).strip()
-
-                if not query:
-                    continue
-
-                # Search for website
-                website_url = self._search_client.search_company_website(query)
-
-                if not website_url:
-                    continue
-
-                # Check if blacklisted
-                if self._is_blacklisted_domain(website_url):
-                    logger.debug(f"Skipping blacklisted domain: {website_url}")
-                    continue
-
-                # Validate URL is alive
-                if self._http_client.is_url_alive(website_url, timeout):
-                    df_result.loc[idx, "WEBSITE"] = self._normalize_url(website_url)
-                    df_result.loc[idx, "WEBSITE_SOURCE"] = "search"
-                    logger.debug(f"Enriched WEBSITE for row {idx}: {website_url}")
+                return self._is_url_alive(url, timeout)
             except Exception as e:
-                logger.warning(f"Error enriching WEBSITE for row {idx}: {e}")
+                logger.warning(f"Error checking WEBSITE {url}: {e}")
+                return False
 
+        alive = normalized.map(dict(zip(distinct.index, self._map_rows(check_alive, distinct)))).astype(bool)
+        _fill_found(df_result, "WEBSITE", "WEBSITE_SOURCE", normalized.index[alive].tolist(), normalized[alive].tolist())
         return df_result
 
-    def enrich_cnae(self, df: pd.DataFrame) -> pd.DataFrame:
+    def enrich_cnae(self, df: pd.DataFrame, *, inplace: bool = False) -> pd.DataFrame:
         """Intenta completar CNAE para filas con CNAE vacío.
 
         Entrada:
             df: DataFrame con al menos columnas RAZON_SOCIAL, CIF, CNAE.
+            inplace: Si es True, escribe directamente en ``df``.
 
         Salida:
-            Nuevo DataFrame con CNAE rellenado cuando se encuentra
-            un código válido desde la fuente configurada.
+            DataFrame con CNAE rellenado cuando se encuentra un código
+            válido desde la fuente configurada. Salvo ``inplace``, ``df``
+            no se modifica: sólo se copian CNAE y CNAE_SOURCE.
         """
-        df_result = df.copy()
+        df_result = df if inplace else _copy_columns(df, ("CNAE", "CNAE_SOURCE"))
 
         # Initialize CNAE_SOURCE column if not exists
         if "CNAE_SOURCE" not in df_result.columns:
-            df_result["CNAE_SOURCE"] = None
+            df_result["CNAE_SOURCE"] = _empty_source(df_result)
 
-        cnae_config = self._rules.get("cnae", {})
-        if not cnae_config.get("enabled", True):
+        if not self._cnae_enabled:
             logger.info("CNAE enrichment is disabled in config")
             return df_result
 
         # Filter rows where CNAE is empty
-        mask_empty = df_result["CNAE"].apply(self._is_empty)
-        df_empty = df_result[mask_empty].copy()
+        mask_empty = _empty_mask(df_result["CNAE"])
+        n_empty = int(mask_empty.sum())
 
-        if len(df_empty) == 0:
+        if n_empty == 0:
             logger.info("No rows with empty CNAE to enrich")
             return df_result
 
-        logger.info(f"Enriching CNAE for {len(df_empty)} rows")
+        logger.info(f"Enriching CNAE for {n_empty} rows")
 
-        query_template = cnae_config.get("query_template", "{razon_social} {cif} CNAE")
+        query_template = self._cnae_query_template
 
-        for idx, row in df_empty.iterrows():
-            try:
-                # Build search query
-                query = query_template.format(
-                    razon_social=row.get("RAZON_SOCIAL", ""),
-                    cif=row.get("CIF", ""),
-                ).strip()
-
-                if not query:
-                    continue
-
-                # Search for CNAE
-                cnae_code = self._search_client.search_company_cnae(query)
-
-                if not cnae_code:
-                    continue
-
-                # Validate CNAE format (basic: should be numeric, 4-5 digits)
-                if re.match(r"^\d{4,5}$", str(cnae_code).strip()):
-                    df_result.loc[idx, "CNAE"] = str(cnae_code).strip()
-                    df_result.loc[idx, "CNAE_SOURCE"] = "search"
-                    logger.debug(f"Enriched CNAE for row {idx}: {cnae_code}")
-            except Exception as e:
-                logger.warning(f"Error enriching CNAE for row {idx}: {e}")
+        try:
+            queries = _format_queries(query_template, df_result.loc[mask_empty])
+            queries.index = _row_positions(mask_empty)
+        except (KeyError, ValueError) as e:
+            logger.warning(f"Invalid CNAE query_template {query_template!r}: {e}")
+            return df_result
 
+        # Search for CNAE
+        codes = self._search_rows("cnae", queries)
+        found = codes.astype(bool)
+        codes[found] = codes[found].astype(str).str.strip()
+        # Validate all CNAE formats at once
+        valid = codes.str.fullmatch(CNAE_PATTERN.pattern).eq(True)
+        logger.debug(f"Enriched CNAE for {int(valid.sum())} of {n_empty} rows")
+        _fill_found(df_result, "CNAE", "CNAE_SOURCE", codes.index[valid].tolist(), codes[valid].tolist())
         return df_result
 
     def process_missing_only(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -386,16 +715,30 @@ class Tier3Enricher:
             DataFrame actualizado con WEBSITE/CNAE rellenados sólo cuando
             estaban vacíos, preservando el resto de datos.
         """
+        # Shallow copy: only whole columns are added or replaced below
+        df = df.copy(deep=False)
+
         # Ensure WEBSITE and CNAE columns exist
         if "WEBSITE" not in df.columns:
             df["WEBSITE"] = None
         if "CNAE" not in df.columns:
             df["CNAE"] = None
 
-        # Enrich website
-        df = self.enrich_website(df)
-
-        # Enrich CNAE
-        df = self.enrich_cnae(df)
+        # Both steps mostly wait on the network and write disjoint columns, so they
+        # run side by side, each on its own copy of the columns it writes
+        steps = [
+            (self.enrich_website, ("WEBSITE", "WEBSITE_SOURCE")),
+            (self.enrich_cnae, ("CNAE", "CNAE_SOURCE")),
+        ]
+        with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+            futures = [
+                (executor.submit(enrich, _copy_columns(df, columns), inplace=True), columns)
+                for enrich, columns in steps
+            ]
+            enriched = [(future.result(), columns) for future, columns in futures]
+
+        for df_step, columns in enriched:
+            for column in columns:
+                df[column] = df_step[column]
 
         return df
@@ -1,17 +1,103 @@
 from __future__ import annotations
 
+from concurrent.futures import Future, TimeoutError as FutureTimeout
 from dataclasses import dataclass
-from typing import Optional
-from urllib.parse import unquote, urlparse, parse_qs
+from difflib import SequenceMatcher
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+from urllib.parse import quote_plus, unquote, urlparse, parse_qs
+import atexit
+import queue
 import re
+import threading
 import time
+import unicodedata
 
-from playwright.sync_api import sync_playwright, Browser, Page, TimeoutError as PlaywrightTimeout
+from playwright.sync_api import sync_playwright, Browser, Page, Playwright, TimeoutError as PlaywrightTimeout
 
 from ..api_manager.utils.logger import get_logger, log_event
 
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+)
 
-@dataclass
+COMPANY_URL_RE = re.compile(r"https?://(?:[a-z]{2,3}\.)?linkedin\.com/company/[a-zA-Z0-9-]+")
+
+# A caller waits this many page-load timeouts for its result (launch, search page, results
+# wait and a job queued ahead); a hung browser thread then reads as a TIMEOUT
+RESULT_WAIT_FACTOR = 4
+
+# Legal-form tokens ignored when comparing company names ("Acme S.L." ~ "acme")
+_LEGAL_FORM_TOKENS = frozenset({"s", "l", "a", "u", "sl", "sa", "slu", "sau", "sll", "sociedad", "limitada", "anonima"})
+
+
+def _name_tokens(text: str) -> FrozenSet[str]:
+    """Lowercase, accent-free word tokens of a company name or result title."""
+    ascii_text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii").lower()
+    tokens = re.findall(r"[a-z0-9]+", ascii_text)
+    return frozenset(token for token in tokens if token not in _LEGAL_FORM_TOKENS) or frozenset(tokens)
+
+
+def _token_set_ratio(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Similarity (0-1) of two token sets, 1.0 when one set contains the other.
+
+    Same definition as rapidfuzz's ``token_set_ratio``: the shared tokens are
+    compared with each side's full token list and the best ratio wins.
+    """
+    shared = " ".join(sorted(a & b))
+    full_a = " ".join(filter(None, (shared, " ".join(sorted(a - b)))))
+    full_b = " ".join(filter(None, (shared, " ".join(sorted(b - a)))))
+    if shared and (full_a == shared or full_b == shared):
+        return 1.0
+    ratios = [SequenceMatcher(None, full_a, full_b).ratio()]
+    if shared:
+        ratios += [SequenceMatcher(None, shared, full_a).ratio(), SequenceMatcher(None, shared, full_b).ratio()]
+    return max(ratios)
+
+
+def _company_url(href: str) -> Optional[str]:
+    """LinkedIn company URL in a result link (Google may wrap it in /url?q=)."""
+    if href.startswith("/url?"):
+        href = unquote(parse_qs(urlparse(href).query).get("q", [""])[0])
+    match = COMPANY_URL_RE.search(href)
+    return match.group(0) if match else None
+
+
+def _match_companies(
+    names: Sequence[str], candidates: Sequence[Tuple[str, str]], threshold: float
+) -> Dict[str, str]:
+    """Assign result links to company names, best match first, one link per name.
+
+    Args:
+        names: Company names searched together.
+        candidates: ``(company_url, result_text)`` pairs from the results page.
+        threshold: Minimum similarity (0-1) for a match.
+
+    Returns:
+        Company URL per matched name.
+    """
+    scored = []
+    for j, (url, text) in enumerate(candidates):
+        slug = url.rsplit("/", 1)[-1].replace("-", " ")
+        candidate_tokens = _name_tokens(f"{text} {slug}")
+        for i, name in enumerate(names):
+            name_tokens = _name_tokens(name)
+            score = _token_set_ratio(name_tokens, candidate_tokens)
+            if score >= threshold:
+                # Ties (e.g. "Acme" and "Acme Iberia" both inside "Acme Iberia") go to the closer name
+                closeness = SequenceMatcher(None, " ".join(sorted(name_tokens)), " ".join(sorted(candidate_tokens))).ratio()
+                scored.append((score, closeness, i, j))
+
+    matches: Dict[str, str] = {}
+    used = set()
+    for _, _, i, j in sorted(scored, reverse=True):
+        if names[i] not in matches and j not in used:
+            matches[names[i]] = candidates[j][0]
+            used.add(j)
+    return matches
+
+
+@dataclass(slots=True)
 class LinkedInResult:
     """Result of LinkedIn company search."""
 
@@ -25,16 +111,52 @@ class LinkedInScraper:
 
     Uses Google search with site:linkedin.com/company to find company LinkedIn page.
     No individual profile scraping (too complex for free version).
+
+    Browsers are launched on first use and kept until ``close()`` (also run
+    when used as a context manager, and at interpreter exit as a fallback).
+    With ``cdp_port`` set, a single Chromium is launched and every search
+    thread connects to it over the DevTools protocol, so parallel searches
+    run as contexts of one browser instead of one browser each.
+
+    With ``batch_size`` > 1, a thread takes up to that many queued names and
+    searches them in one Google query (``"A" OR "B" ...``); result links are
+    assigned to names by fuzzy matching and unmatched names are searched alone.
     """
 
-    def __init__(self, timeout: int = 15) -> None:
+    def __init__(
+        self,
+        timeout: int = 15,
+        browsers: int = 2,
+        cdp_port: Optional[int] = None,
+        batch_size: int = 1,
+        match_threshold: float = 0.9,
+    ) -> None:
         """Initialize LinkedIn scraper.
 
         Args:
             timeout: Page load timeout in seconds (default: 15).
+            browsers: Search threads (searches run in parallel, one per thread).
+            cdp_port: DevTools port of a Chromium shared by all threads
+                (None = each thread launches its own browser).
+            batch_size: Queued names searched together in one query (1 = one query per name).
+            match_threshold: Minimum name/result similarity (0-1) to accept a batched match.
         """
         self.timeout = timeout * 1000  # Playwright uses milliseconds
+        self._result_timeout = timeout * RESULT_WAIT_FACTOR
+        self.browsers = max(1, browsers)
+        self.cdp_port = cdp_port
+        self.batch_size = max(1, batch_size)
+        self.match_threshold = match_threshold
         self.logger = get_logger("tier2.linkedin_scraper")
+        # Searches queued for the browser threads (started on first use, stopped by close())
+        self._jobs: queue.Queue = queue.Queue()
+        self._workers: List[threading.Thread] = []
+        self._workers_lock = threading.Lock()
+        # Thread owning the shared Chromium when cdp_port is set
+        self._host: Optional[threading.Thread] = None
+        self._host_ready = threading.Event()
+        self._host_stop = threading.Event()
+        self._host_error: Optional[Exception] = None
 
     def _extract_linkedin_url(self, page: Page) -> Optional[str]:
         """Extract LinkedIn company URL from Google search results.
@@ -92,65 +214,268 @@ class LinkedInScraper:
     def find_company(self, company_name: str) -> LinkedInResult:
         """Find LinkedIn company page using Google Dorking.
 
+        The search runs on one of the scraper's browser threads, whose browser is
+        reused across searches (each search gets a fresh browser context).
+
         Args:
             company_name: Company name to search for.
 
         Returns:
-            LinkedInResult with company URL or error.
+            LinkedInResult with company URL or error (TIMEOUT if no browser thread
+            answers within ``RESULT_WAIT_FACTOR`` page-load timeouts).
+        """
+        return self._result(company_name, self._submit(company_name))
+
+    def find_companies(self, company_names: Sequence[str]) -> Dict[str, LinkedInResult]:
+        """Find the LinkedIn pages of several companies.
+
+        All names are queued at once, so with ``batch_size`` > 1 they are
+        searched a batch per query.
+
+        Args:
+            company_names: Company names to search for (repeats are searched once).
+
+        Returns:
+            LinkedInResult per company name.
         """
+        futures = {name: self._submit(name, start=False) for name in dict.fromkeys(company_names)}
+        self._start_workers()
+        return {name: self._result(name, future) for name, future in futures.items()}
+
+    def _result(self, company_name: str, future: Future) -> LinkedInResult:
+        """Wait for a queued search, giving up after ``_result_timeout`` seconds."""
+        try:
+            return future.result(timeout=self._result_timeout)
+        except FutureTimeout:
+            # The browser thread may be hung (crash, CDP host gone); its late answer is dropped
+            log_event(
+                self.logger,
+                level=30,
+                message="LinkedIn search result not received in time",
+                extra={"company": company_name, "wait_seconds": self._result_timeout},
+            )
+            return LinkedInResult(company_url=None, success=False, error="TIMEOUT")
+
+    def _submit(self, company_name: str, start: bool = True) -> Future:
+        """Queue one search for the browser threads (started here unless ``start`` is False)."""
+        future: Future = Future()
         if not company_name or not company_name.strip():
-            return LinkedInResult(
+            future.set_result(LinkedInResult(
                 company_url=None,
                 success=False,
                 error="EMPTY_COMPANY_NAME",
+            ))
+            return future
+        self._jobs.put((company_name, future))
+        if start:
+            self._start_workers()
+        return future
+
+    def close(self) -> None:
+        """Stop the browser threads and close their browsers."""
+        with self._workers_lock:
+            if not self._workers:
+                return
+            for _ in self._workers:
+                self._jobs.put(None)
+            for worker in self._workers:
+                worker.join()
+            self._workers = []
+            # The shared browser goes last, once no thread is connected to it
+            if self._host is not None:
+                self._host_stop.set()
+                self._host.join()
+                self._host = None
+            atexit.unregister(self.close)
+
+    def __enter__(self) -> LinkedInScraper:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _start_workers(self) -> None:
+        with self._workers_lock:
+            if not self._workers:
+                if self.cdp_port is not None:
+                    self._host_ready = threading.Event()
+                    self._host_stop = threading.Event()
+                    self._host_error = None
+                    self._host = threading.Thread(target=self._host_browser, name="linkedin-cdp-host", daemon=True)
+                    self._host.start()
+                self._workers = [
+                    threading.Thread(target=self._worker, name=f"linkedin-browser-{i}", daemon=True)
+                    for i in range(self.browsers)
+                ]
+                for worker in self._workers:
+                    worker.start()
+                # Daemon threads die with the interpreter: make sure Chromium is not left behind
+                atexit.register(self.close)
+
+    def _host_browser(self) -> None:
+        """Keep the Chromium shared over ``cdp_port`` open until ``close()``."""
+        playwright = None
+        browser: Optional[Browser] = None
+        try:
+            playwright = sync_playwright().start()
+            browser = playwright.chromium.launch(
+                headless=True,
+                args=[f"--user-agent={USER_AGENT}", f"--remote-debugging-port={self.cdp_port}"],
             )
+        except Exception as exc:
+            self._host_error = exc
+        finally:
+            self._host_ready.set()
+        try:
+            if browser is not None:
+                self._host_stop.wait()
+        finally:
+            if browser is not None:
+                browser.close()
+            if playwright is not None:
+                playwright.stop()
+
+    def _launch(self, playwright: Playwright) -> Browser:
+        """Browser for one search thread: its own, or a connection to the shared one."""
+        if self.cdp_port is None:
+            # Launch browser (headless mode) with explicit user agent
+            return playwright.chromium.launch(headless=True, args=[f"--user-agent={USER_AGENT}"])
+        self._host_ready.wait()
+        if self._host_error is not None:
+            raise RuntimeError(f"Shared browser failed to start: {self._host_error}")
+        return playwright.chromium.connect_over_cdp(f"http://127.0.0.1:{self.cdp_port}")
+
+    def _worker(self) -> None:
+        """Serve searches with a browser owned by this thread (Playwright objects are thread-bound)."""
+        playwright = None
+        browser: Optional[Browser] = None
+        stopping = False
+        try:
+            while not stopping:
+                job = self._jobs.get()
+                if job is None:
+                    return
+                jobs = [job]
+                # Names already waiting join this query (a sentinel ends the thread after it)
+                while len(jobs) < self.batch_size:
+                    try:
+                        job = self._jobs.get_nowait()
+                    except queue.Empty:
+                        break
+                    if job is None:
+                        stopping = True
+                        break
+                    jobs.append(job)
+                try:
+                    if browser is None or not browser.is_connected():
+                        if playwright is None:
+                            playwright = sync_playwright().start()
+                        browser = self._launch(playwright)
+                    self._run_jobs(browser, jobs)
+                except Exception as exc:
+                    for company_name, future in jobs:
+                        if not future.done():
+                            future.set_result(self._scraper_error(company_name, exc))
+        finally:
+            # For a browser connected over CDP this only disconnects
+            if browser is not None:
+                browser.close()
+            if playwright is not None:
+                playwright.stop()
+
+    def _run_jobs(self, browser: Browser, jobs: List[Tuple[str, Future]]) -> None:
+        """Answer queued searches, batching them into one query when there are several."""
+        matches: Dict[str, str] = {}
+        if len(jobs) > 1:
+            try:
+                matches = self._search_batch(browser, list(dict.fromkeys(name for name, _ in jobs)))
+            except Exception as exc:
+                # Names are searched one by one below
+                log_event(
+                    self.logger,
+                    level=30,
+                    message="Batched LinkedIn search failed",
+                    extra={"companies": len(jobs), "error": str(exc)},
+                )
+        for company_name, future in jobs:
+            url = matches.get(company_name)
+            if url:
+                future.set_result(LinkedInResult(company_url=url, success=True))
+            else:
+                future.set_result(self._search(browser, company_name))
 
+    def _search_batch(self, browser: Browser, company_names: List[str]) -> Dict[str, str]:
+        """Search several companies in one Google query and match result links to names.
+
+        Returns:
+            Company URL per name that matched a result.
+        """
+        terms = " OR ".join(f'"{name}"' for name in company_names)
+        google_url = f"https://www.google.com/search?q={quote_plus(f'site:linkedin.com/company ({terms})')}"
+
+        context = browser.new_context(user_agent=USER_AGENT)
+        try:
+            page = context.new_page()
+            page.goto(google_url, wait_until="domcontentloaded", timeout=self.timeout)
+            time.sleep(2)
+            page.wait_for_selector("div#search", timeout=15000)
+            candidates = []
+            for link in page.query_selector_all('a[href*="linkedin.com/company"]'):
+                url = _company_url(link.get_attribute("href") or "")
+                if url:
+                    candidates.append((url, link.inner_text()))
+        finally:
+            context.close()
+
+        matches = _match_companies(company_names, candidates, self.match_threshold)
+        log_event(
+            self.logger,
+            level=20,
+            message="Batched LinkedIn search",
+            extra={"companies": len(company_names), "matched": len(matches)},
+        )
+        return matches
+
+    def _search(self, browser: Browser, company_name: str) -> LinkedInResult:
+        """Run one Google search for the company in a fresh browser context."""
         # Build Google search query
         query = f'site:linkedin.com/company "{company_name}"'
         google_url = f"https://www.google.com/search?q={query.replace(' ', '+')}"
 
         try:
-            with sync_playwright() as p:
-                # Launch browser (headless mode) with explicit user agent
-                browser = p.chromium.launch(
-                    headless=True,
-                    args=["--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"]
-                )
-                context = browser.new_context(
-                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-                )
+            context = browser.new_context(user_agent=USER_AGENT)
+            try:
                 page = context.new_page()
 
-                try:
-                    # Navigate to Google search
-                    page.goto(google_url, wait_until="domcontentloaded", timeout=self.timeout)
-                    
-                    # Add 2 second delay to let page fully load
-                    time.sleep(2)
-
-                    # Extract LinkedIn URL
-                    linkedin_url = self._extract_linkedin_url(page)
-
-                    if linkedin_url:
-                        log_event(
-                            self.logger,
-                            level=20,
-                            message="LinkedIn company URL found",
-                            extra={"company": company_name, "url": linkedin_url},
-                        )
-                        return LinkedInResult(
-                            company_url=linkedin_url,
-                            success=True,
-                        )
-                    else:
-                        return LinkedInResult(
-                            company_url=None,
-                            success=False,
-                            error="NOT_FOUND",
-                        )
-
-                finally:
-                    browser.close()
+                # Navigate to Google search
+                page.goto(google_url, wait_until="domcontentloaded", timeout=self.timeout)
+                
+                # Add 2 second delay to let page fully load
+                time.sleep(2)
+
+                # Extract LinkedIn URL
+                linkedin_url = self._extract_linkedin_url(page)
+
+                if linkedin_url:
+                    log_event(
+                        self.logger,
+                        level=20,
+                        message="LinkedIn company URL found",
+                        extra={"company": company_name, "url": linkedin_url},
+                    )
+                    return LinkedInResult(
+                        company_url=linkedin_url,
+                        success=True,
+                    )
+                else:
+                    return LinkedInResult(
+                        company_url=None,
+                        success=False,
+                        error="NOT_FOUND",
+                    )
+
+            finally:
+                context.close()
 
         except PlaywrightTimeout:
             log_event(
@@ -166,19 +491,24 @@ class LinkedInScraper:
             )
 
         except Exception as exc:
-            log_event(
-                self.logger,
-                level=40,
-                message="LinkedIn scraper failed",
-                extra={"company": company_name, "error": str(exc)},
-            )
-            return LinkedInResult(
-                company_url=None,
-                success=False,
-                error=f"SCRAPER_ERROR: {str(exc)}",
-            )
-
-
-def load_linkedin_scraper_from_config() -> LinkedInScraper:
+            return self._scraper_error(company_name, exc)
+
+    def _scraper_error(self, company_name: str, exc: Exception) -> LinkedInResult:
+        log_event(
+            self.logger,
+            level=40,
+            message="LinkedIn scraper failed",
+            extra={"company": company_name, "error": str(exc)},
+        )
+        return LinkedInResult(
+            company_url=None,
+            success=False,
+            error=f"SCRAPER_ERROR: {str(exc)}",
+        )
+
+
+def load_linkedin_scraper_from_config(
+    browsers: int = 2, cdp_port: Optional[int] = None, batch_size: int = 1
+) -> LinkedInScraper:
     """Helper to create LinkedInScraper with default settings."""
-    return LinkedInScraper(timeout=15)
+    return LinkedInScraper(timeout=15, browsers=browsers, cdp_port=cdp_port, batch_size=batch_size)
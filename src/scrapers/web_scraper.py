@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Dict, Optional, List
 from urllib.parse import urljoin, urlparse
+import re
+import unicodedata
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -15,7 +18,7 @@ from ..api_manager.utils.logger import get_logger, log_event
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapedPage:
     """Result of scraping a web page."""
 
@@ -39,6 +42,45 @@ CONTACT_PATHS = [
 ]
 
 
+# Contact-related words in link paths/texts, most relevant first
+CONTACT_LINK_KEYWORDS = ("contacto", "contact", "quienes", "about", "equipo", "team")
+
+# Homepage links tried before the fixed CONTACT_PATHS
+MAX_CONTACT_LINKS = 3
+
+_ANCHOR_RE = re.compile(r"""<a\s[^>]*?href\s*=\s*["']([^"'#]+)[^"']*["'][^>]*>(.*?)</a>""", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+_CONTACT_LINK_RE = re.compile("|".join(CONTACT_LINK_KEYWORDS), re.IGNORECASE)
+
+
+def find_contact_links(html: str, page_url: str) -> List[str]:
+    """Same-site links of a page that look like contact/about/team pages.
+
+    Args:
+        html: Page HTML.
+        page_url: URL the page was served from (relative links resolve against it).
+
+    Returns:
+        Absolute URLs, most relevant keyword first (page order for ties).
+    """
+    site = urlparse(page_url).netloc.lower().removeprefix("www.")
+    ranks: Dict[str, int] = {}
+    for href, text in _ANCHOR_RE.findall(html):
+        # Accents dropped so "Contáctanos" matches "contact"
+        label = unicodedata.normalize("NFKD", f"{href} {_TAG_RE.sub(' ', text)}")
+        label = label.encode("ascii", "ignore").decode("ascii")
+        keywords = {keyword.lower() for keyword in _CONTACT_LINK_RE.findall(label)}
+        if not keywords:
+            continue
+        url = urljoin(page_url, href.strip())
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https") or parsed.netloc.lower().removeprefix("www.") != site:
+            continue
+        rank = min(CONTACT_LINK_KEYWORDS.index(keyword) for keyword in keywords)
+        ranks[url] = min(rank, ranks.get(url, rank))
+    return sorted(ranks, key=ranks.__getitem__)
+
+
 def _normalize_url(url: str) -> str:
     """Normalize URL by adding https:// scheme if missing.
 
@@ -58,37 +100,79 @@ def _normalize_url(url: str) -> str:
     return f"https://{url}"
 
 
+# Sent with every request (set once on the session, not per call)
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "es-ES,es;q=0.9,en;q=0.8",
+    "Connection": "keep-alive",
+}
+
+
+def build_session(pool_size: int = 10, max_redirects: int = 5, pool_hosts: int = 100) -> requests.Session:
+    """Create a keep-alive HTTP session with retries, shareable between threads.
+
+    Connections are pooled per host, so repeated requests to a site (base URL,
+    then each contact path) reuse the same TCP/TLS connection.
+
+    Args:
+        pool_size: Connections kept per host; size it to the requests that can
+            hit one site at once (default: 10).
+        max_redirects: Maximum number of redirects to follow (default: 5).
+        pool_hosts: Hosts whose connections are kept; size it to the sites
+            scraped concurrently (default: 100).
+
+    Returns:
+        Configured requests.Session.
+    """
+    session = requests.Session()
+    retry_strategy = Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+    )
+    adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=pool_hosts, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.max_redirects = max_redirects
+    session.headers.update(DEFAULT_HEADERS)
+
+    # Accept invalid certificates (for self-signed or expired)
+    session.verify = False
+    return session
+
+
 class ContactPageScraper:
     """Web scraper for fetching contact page HTML.
 
-    Auto-detects contact pages by trying common paths.
+    Auto-detects contact pages by trying common paths (several at a time).
     Handles redirects, timeouts, SSL issues, and 404s.
     """
 
-    def __init__(self, timeout: int = 5, max_redirects: int = 5) -> None:
+    def __init__(
+        self,
+        timeout: int = 5,
+        max_redirects: int = 5,
+        session: Optional[requests.Session] = None,
+        path_concurrency: int = 4,
+    ) -> None:
         """Initialize scraper.
 
         Args:
             timeout: Request timeout in seconds (default: 5).
             max_redirects: Maximum number of redirects to follow (default: 5).
+            session: Shared session (see ``build_session``); a private one is
+                created when not given.
+            path_concurrency: Contact paths of one site fetched at the same
+                time (1 = one after another).
         """
         self.timeout = timeout
         self.max_redirects = max_redirects
+        self.path_concurrency = max(1, path_concurrency)
+        # Contact page URL that worked, per site (netloc)
+        self._contact_urls: Dict[str, str] = {}
         self.logger = get_logger("tier2.web_scraper")
-
-        # Configure session with retry strategy
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=2,
-            backoff_factor=0.3,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-
-        # Accept invalid certificates (for self-signed or expired)
-        self.session.verify = False
+        self.session = session if session is not None else build_session(max_redirects=max_redirects)
 
     def _fetch_url(self, url: str) -> ScrapedPage:
         """Fetch HTML content from a URL.
@@ -100,16 +184,7 @@ class ContactPageScraper:
             ScrapedPage with HTML content and final URL.
         """
         try:
-            response = self.session.get(
-                url,
-                timeout=self.timeout,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                    "Accept-Language": "es-ES,es;q=0.9,en;q=0.8",
-                },
-                allow_redirects=True,
-            )
+            response = self.session.get(url, timeout=self.timeout, allow_redirects=True)
 
             response.raise_for_status()
 
@@ -168,6 +243,31 @@ class ContactPageScraper:
                 error=f"REQUEST_ERROR: {str(exc)}",
             )
 
+    def _fetch_if_found(self, url: str) -> ScrapedPage:
+        """Fetch ``url`` unless a HEAD request says it does not exist (no body download for 404s).
+
+        Only 404/410 are trusted: servers that reject or fail HEAD (405, WAFs
+        answering 403, errors) get a plain GET.
+
+        Args:
+            url: URL to fetch.
+
+        Returns:
+            ScrapedPage with HTML content and final URL.
+        """
+        try:
+            response = self.session.head(url, timeout=self.timeout, allow_redirects=True)
+        except requests.exceptions.Timeout:
+            return ScrapedPage(html=None, url=url, success=False, error="TIMEOUT")
+        except requests.exceptions.RequestException:
+            return self._fetch_url(url)
+        if response.status_code in (404, 410):
+            return ScrapedPage(html=None, url=url, success=False, error=f"HTTP_{response.status_code}")
+        if response.status_code >= 400:
+            return self._fetch_url(url)
+        # GET the final URL the redirects led to
+        return self._fetch_url(response.url or url)
+
     def scrape_contact_page(self, base_url: str) -> ScrapedPage:
         """Scrape contact page by trying common paths.
 
@@ -192,27 +292,31 @@ class ContactPageScraper:
             )
             return result
 
-        # Try common contact page paths
-        for path in CONTACT_PATHS:
-            contact_url = urljoin(base_domain, path)
-            result = self._fetch_url(contact_url)
-
-            if result.success:
-                log_event(
-                    self.logger,
-                    level=20,
-                    message="Successfully scraped contact page",
-                    extra={"url": result.url, "path": path},
-                )
-                return result
-
-            # Log failure but continue trying
-            log_event(
-                self.logger,
-                level=10,
-                message="Contact path failed, trying next",
-                extra={"url": contact_url, "error": result.error},
-            )
+        candidates: List[str] = []
+        # Contact page found earlier for this site
+        known = self._contact_urls.get(parsed.netloc)
+        if known:
+            candidates.append(known)
+
+        # A deep link failed: the homepage usually links to the contact page,
+        # which saves probing the fixed paths blindly
+        homepage = None
+        if parsed.path.strip("/"):
+            homepage = self._fetch_url(f"{base_domain}/")
+            if homepage.success:
+                # Navigation built by JavaScript has no anchors: the fixed paths still run
+                links = find_contact_links(homepage.html or "", homepage.url)
+                candidates.extend(links[:MAX_CONTACT_LINKS])
+            else:
+                homepage = None
+
+        candidates.extend(urljoin(base_domain, path) for path in CONTACT_PATHS)
+        result = self._first_found(list(dict.fromkeys(candidates)))
+        if result is not None:
+            self._contact_urls[parsed.netloc] = result.url
+            return result
+        if homepage is not None:
+            return homepage
 
         # All paths failed, return last error
         return ScrapedPage(
@@ -222,6 +326,45 @@ class ContactPageScraper:
             error="ALL_PATHS_FAILED",
         )
 
+    def _first_found(self, contact_urls: List[str]) -> Optional[ScrapedPage]:
+        """Fetch candidate contact URLs concurrently and return the first that succeeds.
+
+        URLs are fetched ``path_concurrency`` at a time, but the earliest one in
+        the list that succeeds wins, as if they were tried one by one.
+
+        Args:
+            contact_urls: Candidate URLs, most relevant first.
+
+        Returns:
+            ScrapedPage of the winning URL, or None if all failed.
+        """
+        pool = ThreadPoolExecutor(max_workers=min(self.path_concurrency, len(contact_urls)))
+        try:
+            fetches = [pool.submit(self._fetch_if_found, contact_url) for contact_url in contact_urls]
+            for contact_url, fetch in zip(contact_urls, fetches):
+                result = fetch.result()
+
+                if result.success:
+                    log_event(
+                        self.logger,
+                        level=20,
+                        message="Successfully scraped contact page",
+                        extra={"url": result.url, "path": urlparse(contact_url).path},
+                    )
+                    return result
+
+                # Log failure but continue trying
+                log_event(
+                    self.logger,
+                    level=10,
+                    message="Contact path failed, trying next",
+                    extra={"url": contact_url, "error": result.error},
+                )
+        finally:
+            # Later paths are not needed once one succeeded; in-flight ones finish in the background
+            pool.shutdown(wait=False, cancel_futures=True)
+        return None
+
     def scrape_url(self, url: str) -> ScrapedPage:
         """Scrape a specific URL (no path detection).
 
@@ -0,0 +1,97 @@
+"""Circuit breaker used to stop calling an optional dependency while it keeps failing."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Optional
+
+
+class CircuitBreaker:
+    """Rolling failure-rate breaker (closed -> open -> half-open).
+
+    While closed, the outcome of the last ``window`` calls is kept; once the
+    window is full and the share of failures exceeds ``threshold``, the circuit
+    opens and ``allow()`` returns False for ``cooldown`` seconds. After that a
+    single trial call is let through: success closes the circuit again, failure
+    re-opens it for another cooldown. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.5,
+        window: int = 20,
+        cooldown: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the breaker.
+
+        Args:
+            threshold: Failure rate (0-1) above which the circuit opens.
+            window: Number of recent calls the rate is computed over.
+            cooldown: Seconds calls are skipped once the circuit is open.
+            clock: Monotonic time source in seconds (injectable for tests).
+        """
+        self.threshold = threshold
+        self.window = window
+        self.cooldown = cooldown
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._opened_at: Optional[float] = None
+        self._probing = False
+        self.trips = 0
+
+    @property
+    def open(self) -> bool:
+        """True while calls are being skipped (cooldown not yet elapsed)."""
+        with self._lock:
+            return self._opened_at is not None and self._clock() - self._opened_at < self.cooldown
+
+    def allow(self) -> bool:
+        """Return whether a call may be made now.
+
+        Returns:
+            True if closed, or if this caller gets the half-open trial call.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._probing or self._clock() - self._opened_at < self.cooldown:
+                return False
+            self._probing = True
+            return True
+
+    def record(self, success: bool) -> bool:
+        """Record the outcome of an allowed call.
+
+        Args:
+            success: False if the dependency failed (timeout, error).
+
+        Returns:
+            True if this outcome opened the circuit.
+        """
+        with self._lock:
+            if self._opened_at is not None:
+                if not self._probing:
+                    # Call started before the circuit opened
+                    return False
+                self._probing = False
+                if success:
+                    self._opened_at = None
+                    return False
+                self._opened_at = self._clock()
+                self.trips += 1
+                return True
+
+            self._outcomes.append(success)
+            if len(self._outcomes) < self.window:
+                return False
+            failures = self._outcomes.count(False)
+            if failures / self.window <= self.threshold:
+                return False
+            self._outcomes.clear()
+            self._opened_at = self._clock()
+            self.trips += 1
+            return True
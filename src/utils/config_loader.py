@@ -1,12 +1,27 @@
 """Configuration loader for YAML files."""
 
+import copy
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Union
 import logging
 
 logger = logging.getLogger("lead_enrichment")
 
+# libyaml-backed loader when PyYAML was built with it (same safe subset, much faster)
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=32)
+def _parse_yaml(filepath: str, mtime_ns: int) -> Any:
+    """Parse a YAML file once per (path, modification time).
+
+    Callers get deep copies (see ``load_yaml``), so the cached value is never mutated.
+    """
+    with open(filepath, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
 
 def load_yaml(filepath: Path) -> Dict[str, Any]:
     """Load YAML file and return as dictionary.
@@ -25,14 +40,15 @@ def load_yaml(filepath: Path) -> Dict[str, Any]:
         if not filepath.exists():
             raise FileNotFoundError(f"Config file not found: {filepath}")
 
-        with open(filepath, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+        # Configs are re-read by every enricher/engine instance: parse each file once
+        # and re-parse only when it changes on disk
+        config = _parse_yaml(str(filepath.resolve()), filepath.stat().st_mtime_ns)
 
         if config is None:
             logger.warning(f"YAML file is empty: {filepath}")
             return {}
 
-        return config
+        return copy.deepcopy(config)
 
     except yaml.YAMLError as e:
         logger.error(f"Error parsing YAML file {filepath}: {e}")
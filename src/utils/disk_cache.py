@@ -0,0 +1,102 @@
+"""Persistent key-value cache on SQLite, used to reuse paid lookups across runs."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+
+def hash_key(*parts: Any) -> str:
+    """Build a stable cache key from the given values (sha256 of their JSON form).
+
+    Args:
+        *parts: JSON-serializable values identifying the input.
+
+    Returns:
+        Hex digest.
+    """
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class DiskCache:
+    """JSON values stored in a SQLite file, grouped by namespace, with a TTL.
+
+    One connection is shared by all threads and guarded by a lock; entries
+    older than ``ttl`` seconds are ignored and purged when the cache is opened.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        ttl: float,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Open (or create) the cache file.
+
+        Args:
+            path: SQLite file path (parent directories are created).
+            ttl: Seconds an entry stays valid.
+            clock: Time source in seconds since the epoch (injectable for tests).
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " namespace TEXT NOT NULL,"
+                " key TEXT NOT NULL,"
+                " value TEXT NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " PRIMARY KEY (namespace, key))"
+            )
+            self._conn.execute("DELETE FROM entries WHERE expires_at <= ?", (self._clock(),))
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """Return the stored value, or None if missing or expired.
+
+        Args:
+            namespace: Value group (e.g. "scrape").
+            key: Entry key (see ``hash_key``).
+
+        Returns:
+            Decoded JSON value, or None.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM entries WHERE namespace = ? AND key = ? AND expires_at > ?",
+                (namespace, key, self._clock()),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a JSON-serializable value.
+
+        Args:
+            namespace: Value group (e.g. "scrape").
+            key: Entry key (see ``hash_key``).
+            value: Value to store.
+            ttl: Seconds this entry stays valid (default: the cache's ``ttl``).
+        """
+        payload = json.dumps(value, ensure_ascii=False)
+        expires_at = self._clock() + (self.ttl if ttl is None else ttl)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                (namespace, key, payload, expires_at),
+            )
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
@@ -15,6 +15,9 @@ from ..utils.config_loader import load_yaml_config
 
 logger = setup_logger()
 
+# Columns added/updated by revalidate_cifs (read by the orchestrator)
+CIF_VALIDATION_COLUMNS = ("CIF_VALID", "CIF_REASON", "CIF_RECHECKED")
+
 
 def revalidate_cifs(df: pd.DataFrame, rules: dict[str, Any] | None = None) -> pd.DataFrame:
     """Revalida CIFs que fallaron en Tier1.
@@ -68,17 +71,20 @@ def revalidate_cifs(df: pd.DataFrame, rules: dict[str, Any] | None = None) -> pd
         (df_result["CIF_VALID"] == False) | (df_result["CIF_VALID"].isna())
     ) & (df_result[cif_column].notna()) & (df_result[cif_column] != "")
 
-    df_to_revalidate = df_result[mask_to_revalidate].copy()
+    cifs_to_revalidate = df_result.loc[mask_to_revalidate, cif_column]
 
-    if len(df_to_revalidate) == 0:
+    if len(cifs_to_revalidate) == 0:
         logger.info("No CIFs to revalidate")
         return df_result
 
-    logger.info(f"Revalidating CIFs for {len(df_to_revalidate)} rows")
+    logger.info(f"Revalidating CIFs for {len(cifs_to_revalidate)} rows")
 
-    # Revalidate each CIF
-    for idx, row in df_to_revalidate.iterrows():
-        cif_value = str(row.get(cif_column, "")).strip()
+    # Revalidate each CIF (results collected per column, written back once)
+    rechecked_index = []
+    valid_flags: list[bool] = []
+    reasons: list[str] = []
+    for idx, cif_raw in zip(cifs_to_revalidate.index, cifs_to_revalidate.tolist()):
+        cif_value = str(cif_raw).strip()
 
         if not cif_value:
             continue
@@ -86,13 +92,15 @@ def revalidate_cifs(df: pd.DataFrame, rules: dict[str, Any] | None = None) -> pd
         # Revalidate
         result = validator.validate(cif_value)
 
-        # Update validation columns
-        df_result.loc[idx, "CIF_VALID"] = result.is_valid
-        if result.is_valid:
-            df_result.loc[idx, "CIF_REASON"] = "ok"
-        else:
-            df_result.loc[idx, "CIF_REASON"] = result.error or "invalid"
-        df_result.loc[idx, "CIF_RECHECKED"] = True
+        rechecked_index.append(idx)
+        valid_flags.append(result.is_valid)
+        reasons.append("ok" if result.is_valid else (result.error or "invalid"))
+
+    # Update validation columns
+    if rechecked_index:
+        df_result.loc[rechecked_index, "CIF_VALID"] = valid_flags
+        df_result.loc[rechecked_index, "CIF_REASON"] = reasons
+        df_result.loc[rechecked_index, "CIF_RECHECKED"] = True
 
     logger.info(f"CIF revalidation complete")
     return df_result
@@ -5,16 +5,48 @@ Validates all emails in a DataFrame and adds validation columns.
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 import pandas as pd
 
-from .email_validator import EmailValidator
+from .email_validator import EmailValidationResult, EmailValidator
+from .mx_cache import MxCache
 from ..utils.logger import setup_logger
 from ..utils.config_loader import load_yaml_config
 
 logger = setup_logger()
 
+# Columns added/updated by validate_all_emails (read by the orchestrator)
+EMAIL_VALIDATION_COLUMNS = ("EMAIL_VALID", "EMAIL_REASON", "EMAIL_VALIDATION_LEVEL")
+
+
+def _is_empty_email(email: Any) -> bool:
+    return pd.isna(email) or (isinstance(email, str) and not email.strip())
+
+
+async def _validate_concurrently(
+    validator: EmailValidator, emails: list[str], concurrency: int
+) -> dict[str, EmailValidationResult]:
+    """Validate distinct emails with at most ``concurrency`` MX queries in flight.
+
+    Args:
+        validator: Email validator (its async resolver is shared by all queries).
+        emails: Distinct email addresses.
+        concurrency: Maximum simultaneous validations.
+
+    Returns:
+        Validation result per email.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(email: str) -> EmailValidationResult:
+        async with semaphore:
+            return await validator.validate_async(email)
+
+    results = await asyncio.gather(*(bounded(email) for email in emails))
+    return dict(zip(emails, results))
+
 
 def validate_all_emails(df: pd.DataFrame, rules: dict[str, Any] | None = None) -> pd.DataFrame:
     """Valida todas las direcciones de email del DataFrame.
@@ -61,43 +93,57 @@ def validate_all_emails(df: pd.DataFrame, rules: dict[str, Any] | None = None) -
     mx_config = rules.get("mx_check", {})
     mx_enabled = mx_config.get("enabled", True)
     mx_timeout = min(mx_config.get("timeout", 2.0), 5.0)  # Maximum 5 seconds
+    mx_concurrency = max(1, int(mx_config.get("concurrency", 50)))
 
-    # Initialize validator
-    validator = EmailValidator(dns_timeout=mx_timeout)
+    # Initialize validator (repeated domains are only queried once)
+    mx_cache = MxCache(
+        ttl=float(mx_config.get("cache_ttl", 3600)),
+        maxsize=int(mx_config.get("cache_maxsize", 50_000)),
+    )
+    validator = EmailValidator(dns_timeout=mx_timeout, mx_cache=mx_cache)
 
     logger.info(f"Validating emails for {len(df_result)} rows")
 
-    # Validate each email
-    for idx, row in df_result.iterrows():
-        email = row.get(email_column)
+    # MX queries for all distinct emails run concurrently, then results are mapped back per row
+    emails = df_result[email_column].tolist()
+    distinct_emails = list(dict.fromkeys(str(email) for email in emails if not _is_empty_email(email)))
+    results = asyncio.run(_validate_concurrently(validator, distinct_emails, mx_concurrency)) if distinct_emails else {}
 
+    # Results collected per column, written back once
+    valid_flags: list[bool] = []
+    reasons: list[str] = []
+    levels: list[str] = []
+    for email in emails:
         # Check if empty
-        if pd.isna(email) or (isinstance(email, str) and not email.strip()):
-            df_result.loc[idx, "EMAIL_VALID"] = False
-            df_result.loc[idx, "EMAIL_REASON"] = "empty"
-            df_result.loc[idx, "EMAIL_VALIDATION_LEVEL"] = "none"
+        if _is_empty_email(email):
+            valid_flags.append(False)
+            reasons.append("empty")
+            levels.append("none")
             continue
 
-        # Validate email
-        result = validator.validate(str(email))
+        result = results[str(email)]
 
         if not result.valid:
-            df_result.loc[idx, "EMAIL_VALID"] = False
-            df_result.loc[idx, "EMAIL_REASON"] = result.error or "invalid_syntax"
-            df_result.loc[idx, "EMAIL_VALIDATION_LEVEL"] = "none"
+            valid_flags.append(False)
+            reasons.append(result.error or "invalid_syntax")
+            levels.append("none")
         elif result.generic:
-            df_result.loc[idx, "EMAIL_VALID"] = True  # Syntax valid
-            df_result.loc[idx, "EMAIL_REASON"] = "generic_email"
-            df_result.loc[idx, "EMAIL_VALIDATION_LEVEL"] = "syntax"
+            valid_flags.append(True)  # Syntax valid
+            reasons.append("generic_email")
+            levels.append("syntax")
         elif result.deliverable:
-            df_result.loc[idx, "EMAIL_VALID"] = True
-            df_result.loc[idx, "EMAIL_REASON"] = "ok"
-            df_result.loc[idx, "EMAIL_VALIDATION_LEVEL"] = "mx"
+            valid_flags.append(True)
+            reasons.append("ok")
+            levels.append("mx")
         else:
             # Syntax valid but MX check failed
-            df_result.loc[idx, "EMAIL_VALID"] = True  # Syntax is valid
-            df_result.loc[idx, "EMAIL_REASON"] = result.error or "no_mx"
-            df_result.loc[idx, "EMAIL_VALIDATION_LEVEL"] = "syntax"  # Only syntax validated
+            valid_flags.append(True)  # Syntax is valid
+            reasons.append(result.error or "no_mx")
+            levels.append("syntax")  # Only syntax validated
+
+    df_result["EMAIL_VALID"] = valid_flags
+    df_result["EMAIL_REASON"] = reasons
+    df_result["EMAIL_VALIDATION_LEVEL"] = levels
 
     logger.info(f"Email validation complete")
     return df_result
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 import re
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterable, Optional
 
+import dns.asyncresolver
 import dns.resolver
 import dns.exception
 
 from ..api_manager.utils.logger import get_logger, log_event
+from .mx_cache import MxCache
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailValidationResult:
     """Result of email validation."""
 
@@ -29,8 +32,39 @@ EMAIL_REGEX = re.compile(
     r"^[a-zA-Z0-9][a-zA-Z0-9._+-]*@[a-zA-Z0-9]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*\.[a-zA-Z]{2,}$"
 )
 
+# MX lookup errors that are definitive answers (safe to cache); timeouts and
+# other DNS failures are transient and retried on the next lookup
+CACHEABLE_MX_ERRORS = {None, "DOMAIN_NOT_FOUND"}
+
+# Reserved / private TLDs that never resolve publicly: not worth prefetching
+RESERVED_TLDS = frozenset({"local", "localhost", "test", "example", "invalid", "internal", "lan", "home"})
+
+# Free mailbox providers: their MX records always exist, so addresses there are
+# deliverable without a DNS query (whether they are generic depends on the local part)
+FREE_MAIL_DOMAINS = frozenset({
+    "gmail.com",
+    "googlemail.com",
+    "hotmail.com",
+    "hotmail.es",
+    "outlook.com",
+    "outlook.es",
+    "live.com",
+    "msn.com",
+    "yahoo.com",
+    "yahoo.es",
+    "ymail.com",
+    "icloud.com",
+    "me.com",
+    "aol.com",
+    "gmx.com",
+    "gmx.es",
+    "protonmail.com",
+    "proton.me",
+    "telefonica.net",
+})
+
 # Generic email local parts to reject
-GENERIC_LOCAL_PARTS = {
+GENERIC_LOCAL_PARTS = frozenset({
     "info",
     "contact",
     "contacto",
@@ -51,7 +85,7 @@ GENERIC_LOCAL_PARTS = {
     "abuse",
     "privacy",
     "legal",
-}
+})
 
 
 class EmailValidator:
@@ -63,14 +97,19 @@ class EmailValidator:
     - Generic email detection (info@, contact@, etc.)
     """
 
-    def __init__(self, dns_timeout: float = 5.0) -> None:
+    def __init__(self, dns_timeout: float = 5.0, mx_cache: Optional[MxCache] = None) -> None:
         """Initialize email validator.
 
         Args:
             dns_timeout: DNS query timeout in seconds (default: 5.0).
+            mx_cache: Optional per-domain cache of MX lookups (None: always query DNS).
         """
         self.dns_timeout = dns_timeout
+        self.mx_cache = mx_cache
         self.logger = get_logger("tier2.email_validator")
+        # Shared async resolver and in-flight MX queries (created on first validate_async)
+        self._async_resolver: Optional[dns.asyncresolver.Resolver] = None
+        self._mx_pending: dict[str, asyncio.Task] = {}
 
     def _validate_syntax(self, email: str) -> bool:
         """Validate email syntax using regex.
@@ -99,21 +138,45 @@ class EmailValidator:
             error_message: Error message if DNS query failed, None if successful.
         """
         try:
-            # Query MX records
             answers = dns.resolver.resolve(domain, "MX", lifetime=self.dns_timeout)
-            if answers:
-                mx_records = [str(rdata.exchange) for rdata in answers]
-                log_event(
-                    self.logger,
-                    level=10,
-                    message="MX records found",
-                    extra={"domain": domain, "mx_count": len(mx_records)},
-                )
-                return True, None
+        except Exception as exc:
+            return self._mx_error(domain, exc)
+        return self._mx_answers(domain, answers)
 
-            return False, None
+    async def _check_mx_record_async(self, domain: str) -> tuple[bool, Optional[str]]:
+        """Async counterpart of ``_check_mx_record`` using the shared async resolver.
+
+        Args:
+            domain: Domain name to check (without @).
+
+        Returns:
+            Tuple of (has_mx, error_message), as ``_check_mx_record``.
+        """
+        if self._async_resolver is None:
+            self._async_resolver = dns.asyncresolver.Resolver()
+        try:
+            answers = await self._async_resolver.resolve(domain, "MX", lifetime=self.dns_timeout)
+        except Exception as exc:
+            return self._mx_error(domain, exc)
+        return self._mx_answers(domain, answers)
+
+    def _mx_answers(self, domain: str, answers) -> tuple[bool, Optional[str]]:
+        """Interpret a successful MX query."""
+        if answers:
+            mx_records = [str(rdata.exchange) for rdata in answers]
+            log_event(
+                self.logger,
+                level=10,
+                message="MX records found",
+                extra={"domain": domain, "mx_count": len(mx_records)},
+            )
+            return True, None
 
-        except dns.resolver.NoAnswer:
+        return False, None
+
+    def _mx_error(self, domain: str, exc: Exception) -> tuple[bool, Optional[str]]:
+        """Map a failed MX query to (has_mx, error_message)."""
+        if isinstance(exc, dns.resolver.NoAnswer):
             # No MX record found
             log_event(
                 self.logger,
@@ -123,11 +186,11 @@ class EmailValidator:
             )
             return False, None
 
-        except dns.resolver.NXDOMAIN:
+        if isinstance(exc, dns.resolver.NXDOMAIN):
             # Domain doesn't exist
             return False, "DOMAIN_NOT_FOUND"
 
-        except dns.resolver.Timeout:
+        if isinstance(exc, dns.resolver.Timeout):
             log_event(
                 self.logger,
                 level=30,
@@ -136,7 +199,7 @@ class EmailValidator:
             )
             return False, "DNS_TIMEOUT"
 
-        except dns.exception.DNSException as exc:
+        if isinstance(exc, dns.exception.DNSException):
             log_event(
                 self.logger,
                 level=30,
@@ -145,14 +208,13 @@ class EmailValidator:
             )
             return False, f"DNS_ERROR: {str(exc)}"
 
-        except Exception as exc:
-            log_event(
-                self.logger,
-                level=40,
-                message="Unexpected error checking MX",
-                extra={"domain": domain, "error": str(exc)},
-            )
-            return False, f"UNEXPECTED_ERROR: {str(exc)}"
+        log_event(
+            self.logger,
+            level=40,
+            message="Unexpected error checking MX",
+            extra={"domain": domain, "error": str(exc)},
+        )
+        return False, f"UNEXPECTED_ERROR: {str(exc)}"
 
     def _is_generic_email(self, email: str) -> bool:
         """Check if email is generic (info@, contact@, etc.).
@@ -166,29 +228,24 @@ class EmailValidator:
         if not email or "@" not in email:
             return True
 
-        local_part = email.split("@")[0].lower().strip()
+        local_part = email.partition("@")[0].lower().strip()
 
-        # Check exact match
-        if local_part in GENERIC_LOCAL_PARTS:
-            return True
-
-        # Check if starts with generic prefix (e.g., "info2", "contacto1")
-        for generic in GENERIC_LOCAL_PARTS:
-            if local_part.startswith(generic) and (
-                local_part == generic or local_part[len(generic) :].isdigit()
-            ):
-                return True
+        # Exact match, or a generic prefix followed only by digits (e.g., "info2", "contacto1"):
+        # two set lookups instead of a scan over every generic prefix
+        return (
+            local_part in GENERIC_LOCAL_PARTS
+            or local_part.rstrip("0123456789") in GENERIC_LOCAL_PARTS
+        )
 
-        return False
-
-    def validate(self, email: str) -> EmailValidationResult:
-        """Validate email address comprehensively.
+    def _prevalidate(self, email: str) -> EmailValidationResult | str:
+        """Run the checks that need no network (syntax, generic mailbox).
 
         Args:
             email: Email address to validate.
 
         Returns:
-            EmailValidationResult with validation details.
+            The final EmailValidationResult, or the domain whose MX record
+            still has to be checked (free mail providers are not checked).
         """
         if not email:
             return EmailValidationResult(
@@ -219,10 +276,21 @@ class EmailValidator:
                 error="GENERIC_EMAIL",
             )
 
-        # Step 3: MX record check (only for non-generic emails)
-        domain = email.split("@")[1]
-        has_mx, mx_error = self._check_mx_record(domain)
+        domain = email.rsplit("@", 1)[1]
+        if domain in FREE_MAIL_DOMAINS:
+            return self._mx_result(True, None)
+
+        # Step 3 (MX record check) is left to the caller
+        return domain
 
+    def _cache_mx(self, domain: str, mx: tuple[bool, Optional[str]]) -> None:
+        """Store a definitive MX answer in the cache (transient errors are retried)."""
+        if self.mx_cache is not None and mx[1] in CACHEABLE_MX_ERRORS:
+            self.mx_cache.put(domain, mx)
+
+    @staticmethod
+    def _mx_result(has_mx: bool, mx_error: Optional[str]) -> EmailValidationResult:
+        """Build the result for a non-generic email from its MX check."""
         return EmailValidationResult(
             valid=True,
             deliverable=has_mx,
@@ -230,6 +298,98 @@ class EmailValidator:
             error=mx_error if not has_mx else None,
         )
 
+    def validate(self, email: str) -> EmailValidationResult:
+        """Validate email address comprehensively.
+
+        Args:
+            email: Email address to validate.
+
+        Returns:
+            EmailValidationResult with validation details.
+        """
+        domain = self._prevalidate(email)
+        if isinstance(domain, EmailValidationResult):
+            return domain
+
+        mx = self.mx_cache.get(domain) if self.mx_cache is not None else None
+        if mx is None:
+            mx = self._check_mx_record(domain)
+            self._cache_mx(domain, mx)
+        return self._mx_result(*mx)
+
+    async def validate_async(self, email: str) -> EmailValidationResult:
+        """Validate email address without blocking the event loop.
+
+        Same checks as ``validate``; MX queries go through one shared async
+        resolver and concurrent validations of the same domain share one query.
+
+        Args:
+            email: Email address to validate.
+
+        Returns:
+            EmailValidationResult with validation details.
+        """
+        domain = self._prevalidate(email)
+        if isinstance(domain, EmailValidationResult):
+            return domain
+
+        return self._mx_result(*await self._mx_for_domain(domain))
+
+    async def prefetch_mx(self, domains: Iterable[str], concurrency: int = 50) -> int:
+        """Resolve MX records ahead of validation so later lookups hit the cache.
+
+        Domains already cached, free mail providers, or under a reserved TLD
+        (.local, .test...), are skipped. Validations of a domain still being prefetched wait for the same
+        query instead of issuing another one.
+
+        Args:
+            domains: Domains expected to be validated soon (e.g. lead websites).
+            concurrency: Maximum simultaneous MX queries.
+
+        Returns:
+            Number of domains queried.
+        """
+        if self.mx_cache is None:
+            return 0
+        to_fetch = set()
+        for domain in domains:
+            domain = domain.strip().strip(".").lower()
+            if "." not in domain or domain.rsplit(".", 1)[1] in RESERVED_TLDS or domain in FREE_MAIL_DOMAINS:
+                continue
+            if self.mx_cache.get(domain) is None:
+                to_fetch.add(domain)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(domain: str) -> None:
+            async with semaphore:
+                await self._shared_mx_lookup(domain)
+
+        await asyncio.gather(*(fetch(domain) for domain in to_fetch), return_exceptions=True)
+        return len(to_fetch)
+
+    async def _mx_for_domain(self, domain: str) -> tuple[bool, Optional[str]]:
+        """Cached MX answer for a domain, or the shared in-flight query for it."""
+        mx = self.mx_cache.get(domain) if self.mx_cache is not None else None
+        if mx is not None:
+            return mx
+        return await self._shared_mx_lookup(domain)
+
+    async def _shared_mx_lookup(self, domain: str) -> tuple[bool, Optional[str]]:
+        """Query MX records, joining the in-flight query for the domain if any."""
+        task = self._mx_pending.get(domain)
+        if task is None:
+            task = asyncio.ensure_future(self._lookup_mx_async(domain))
+            self._mx_pending[domain] = task
+            task.add_done_callback(lambda _: self._mx_pending.pop(domain, None))
+        return await task
+
+    async def _lookup_mx_async(self, domain: str) -> tuple[bool, Optional[str]]:
+        """Query MX records asynchronously and cache the answer."""
+        mx = await self._check_mx_record_async(domain)
+        self._cache_mx(domain, mx)
+        return mx
+
 
 def load_email_validator_from_config() -> EmailValidator:
     """Helper to create EmailValidator with default settings."""
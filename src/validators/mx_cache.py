@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+# (has_mx, error_message), as returned by EmailValidator._check_mx_record
+MxResult = Tuple[bool, Optional[str]]
+
+
+class MxCache:
+    """Thread-safe LRU cache with TTL for MX lookups, keyed by lowercased domain.
+
+    Batches often repeat the same domains (corporate domains, gmail.com...),
+    so each domain only needs one DNS round-trip per ``ttl`` seconds.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 3600.0,
+        maxsize: int = 50_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize MX cache.
+
+        Args:
+            ttl: Seconds an entry stays valid (default: 3600, a typical MX record TTL).
+            maxsize: Maximum number of domains kept (default: 50000).
+            clock: Time source in seconds (injectable for tests).
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._clock = clock
+        self._entries: OrderedDict[str, Tuple[MxResult, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, domain: str) -> Optional[MxResult]:
+        """Return the cached result for a domain, or None if missing/expired.
+
+        Args:
+            domain: Domain name (case-insensitive).
+
+        Returns:
+            Cached (has_mx, error_message), or None on a miss.
+        """
+        key = domain.lower()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                result, expires_at = entry
+                if expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return result
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, domain: str, result: MxResult) -> None:
+        """Store the result for a domain, evicting the least recently used entry if full.
+
+        Args:
+            domain: Domain name (case-insensitive).
+            result: (has_mx, error_message) to cache.
+        """
+        key = domain.lower()
+        with self._lock:
+            self._entries[key] = (result, self._clock() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -15,6 +15,9 @@ from ..utils.config_loader import load_yaml_config
 
 logger = setup_logger()
 
+# Columns added/updated by validate_all_phones (read by the orchestrator)
+PHONE_VALIDATION_COLUMNS = ("PHONE_VALID", "PHONE_REASON", "PHONE_NORMALIZED")
+
 
 def validate_all_phones(df: pd.DataFrame, rules: dict[str, Any] | None = None) -> pd.DataFrame:
     """Valida todos los teléfonos del DataFrame.
@@ -61,28 +64,33 @@ def validate_all_phones(df: pd.DataFrame, rules: dict[str, Any] | None = None) -
 
     logger.info(f"Validating phones for {len(df_result)} rows")
 
-    # Validate each phone
-    for idx, row in df_result.iterrows():
-        phone = row.get(phone_column)
-
+    # Validate each phone (results collected per column, written back once)
+    valid_flags: list[bool] = []
+    reasons: list[str] = []
+    normalized: list[str] = []
+    for phone in df_result[phone_column].tolist():
         # Check if empty
         if pd.isna(phone) or (isinstance(phone, str) and not str(phone).strip()):
-            df_result.loc[idx, "PHONE_VALID"] = False
-            df_result.loc[idx, "PHONE_REASON"] = "empty"
-            df_result.loc[idx, "PHONE_NORMALIZED"] = ""
+            valid_flags.append(False)
+            reasons.append("empty")
+            normalized.append("")
             continue
 
         # Validate phone
         result = validator.validate(str(phone))
 
         if result.is_valid:
-            df_result.loc[idx, "PHONE_VALID"] = True
-            df_result.loc[idx, "PHONE_REASON"] = "ok"
-            df_result.loc[idx, "PHONE_NORMALIZED"] = result.international_format
+            valid_flags.append(True)
+            reasons.append("ok")
+            normalized.append(result.international_format)
         else:
-            df_result.loc[idx, "PHONE_VALID"] = False
-            df_result.loc[idx, "PHONE_REASON"] = result.error or "invalid"
-            df_result.loc[idx, "PHONE_NORMALIZED"] = result.formatted_phone
+            valid_flags.append(False)
+            reasons.append(result.error or "invalid")
+            normalized.append(result.formatted_phone)
+
+    df_result["PHONE_VALID"] = valid_flags
+    df_result["PHONE_REASON"] = reasons
+    df_result["PHONE_NORMALIZED"] = normalized
 
     logger.info(f"Phone validation complete")
     return df_result
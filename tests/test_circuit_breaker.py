@@ -0,0 +1,50 @@
+"""Unit tests for the circuit breaker."""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.circuit_breaker import CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_circuit_opens_when_failure_rate_exceeds_threshold():
+    """Test that the circuit opens only once the window is full and over the threshold."""
+    breaker = CircuitBreaker(threshold=0.5, window=4, cooldown=60, clock=FakeClock())
+
+    assert not any(breaker.record(success) for success in (False, True, False, True))
+    assert not breaker.record(False)
+    assert breaker.allow()
+    assert breaker.record(False)
+    assert breaker.open
+    assert not breaker.allow()
+    assert breaker.trips == 1
+
+
+def test_half_open_trial_closes_or_reopens_circuit():
+    """Test that after the cooldown one trial call decides whether to close the circuit."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(threshold=0.5, window=2, cooldown=60, clock=clock)
+    breaker.record(False)
+    breaker.record(False)
+
+    clock.now = 60
+    assert breaker.allow()
+    assert not breaker.allow()
+    assert breaker.record(False)
+    assert not breaker.allow()
+
+    clock.now = 120
+    assert breaker.allow()
+    assert not breaker.record(True)
+    assert not breaker.open
+    assert breaker.allow()
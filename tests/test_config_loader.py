@@ -0,0 +1,34 @@
+"""Unit tests for the YAML config loader."""
+
+import os
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.config_loader import load_yaml_config
+
+
+def test_load_yaml_config_returns_independent_copies(tmp_path):
+    """Test that mutating a loaded config does not leak into later loads."""
+    path = tmp_path / "rules.yaml"
+    path.write_text("tier2:\n  max_concurrency: 8\n", encoding="utf-8")
+
+    first = load_yaml_config(path)
+    first["tier2"]["max_concurrency"] = 1
+
+    assert load_yaml_config(path) == {"tier2": {"max_concurrency": 8}}
+
+
+def test_load_yaml_config_rereads_modified_file(tmp_path):
+    """Test that a file edited on disk is parsed again."""
+    path = tmp_path / "rules.yaml"
+    path.write_text("value: 1\n", encoding="utf-8")
+    assert load_yaml_config(path) == {"value": 1}
+
+    path.write_text("value: 2\n", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert load_yaml_config(path) == {"value": 2}
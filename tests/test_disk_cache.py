@@ -0,0 +1,44 @@
+"""Unit tests for the SQLite disk cache."""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.disk_cache import DiskCache, hash_key
+
+
+def test_disk_cache_persists_values_until_ttl(tmp_path):
+    """Test that values survive reopening the file and expire after the TTL."""
+    now = [1000.0]
+    path = tmp_path / "cache" / "tier2.sqlite3"
+
+    cache = DiskCache(path, ttl=60, clock=lambda: now[0])
+    cache.set("scrape", hash_key("https://empresa.es"), {"html": "<p>hola</p>", "success": True})
+    cache.close()
+
+    reopened = DiskCache(path, ttl=60, clock=lambda: now[0])
+    assert reopened.get("scrape", hash_key("https://empresa.es")) == {"html": "<p>hola</p>", "success": True}
+    assert reopened.get("parse", hash_key("https://empresa.es")) is None
+    now[0] += 60
+    assert reopened.get("scrape", hash_key("https://empresa.es")) is None
+
+
+def test_disk_cache_entry_ttl_overrides_default(tmp_path):
+    """Test that an entry stored with its own TTL expires on that schedule."""
+    now = [1000.0]
+    cache = DiskCache(tmp_path / "cache.sqlite3", ttl=3600, clock=lambda: now[0])
+    cache.set("linkedin", "miss", {"success": False}, ttl=60)
+    cache.set("linkedin", "hit", {"success": True})
+
+    now[0] += 60
+    assert cache.get("linkedin", "miss") is None
+    assert cache.get("linkedin", "hit") == {"success": True}
+    cache.close()
+
+
+def test_hash_key_depends_on_every_part():
+    """Test that keys differ when any input part differs."""
+    assert hash_key("Empresa", "Madrid", None) == hash_key("Empresa", "Madrid", None)
+    assert hash_key("Empresa", "Madrid", None) != hash_key("Empresa", "Sevilla", None)
@@ -0,0 +1,54 @@
+"""Unit tests for EmailResearcher with stubbed Tavily and OpenAI clients."""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.ai.email_researcher import EmailResearcher
+
+
+def _completion(payload, prompt_tokens):
+    return Mock(
+        choices=[Mock(message=Mock(content=json.dumps(payload)))],
+        usage=Mock(prompt_tokens=prompt_tokens),
+    )
+
+
+def test_research_email_reports_prompt_tokens_of_both_phases():
+    """Test that tokens_used adds up the OpenAI usage of phase 1 and phase 2."""
+    researcher = EmailResearcher(tavily_api_key="tvly-test", openai_api_key="test-key")
+    researcher.tavily_client = Mock()
+    researcher.tavily_client.search.return_value = {
+        "results": [{"content": "Empresa A SL, Madrid. Contacto: ana@empresa-a.es", "url": "https://empresa-a.es"}]
+    }
+    researcher.openai_client = Mock()
+    researcher.openai_client.chat.completions.create.side_effect = [
+        _completion({"razon_social_oficial": "Empresa A SL", "company_exists": True, "confidence": 0.9}, 120),
+        _completion({"email": "ana@empresa-a.es", "contact_name": "Ana", "source_url": "https://empresa-a.es"}, 80),
+    ]
+
+    result = researcher.research_email("Empresa A", city="Madrid", website="https://empresa-a.es")
+
+    assert researcher.openai_client.chat.completions.create.call_count == 2
+    assert result.search_phase_reached == 2
+    assert result.tokens_used == 200
+
+
+def test_tavily_client_without_session_support(monkeypatch):
+    """Test that releases of tavily-python without ``session=`` still get a client."""
+
+    class OldTavilyClient:
+        def __init__(self, api_key):
+            self.api_key = api_key
+
+    monkeypatch.setattr("src.ai.email_researcher.TavilyClient", OldTavilyClient)
+    monkeypatch.setattr("src.ai.email_researcher._TAVILY_TAKES_SESSION", False)
+
+    researcher = EmailResearcher(tavily_api_key="tvly-test", openai_api_key="test-key")
+
+    assert researcher.tavily_client.api_key == "tvly-test"
+    researcher.close()
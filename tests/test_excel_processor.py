@@ -0,0 +1,65 @@
+"""Unit tests for excel_processor.write_excel."""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import openpyxl
+import pandas as pd
+import pytest
+
+from src.core.excel_processor import write_excel
+
+
+def _sample_df() -> pd.DataFrame:
+    return pd.DataFrame({
+        "NOMBRE CLIENTE": ["Empresa A", "Empresa B"],
+        "CONSUMO": [100, 50],
+        "PRIORITY": [3, 1],
+    })
+
+
+def test_write_excel_adds_errors_sheet(tmp_path):
+    """Test that errors are written to an 'Errores' sheet in the same file."""
+    output_path = tmp_path / "out.xlsx"
+    errors = [
+        {"row": 2, "field": "CIF", "error": "invalid checksum"},
+        {"row": "N/A", "field": "SYSTEM", "error": "boom"},
+    ]
+
+    write_excel(_sample_df(), {}, output_path, preserve_format=False, errors=errors)
+
+    wb = openpyxl.load_workbook(output_path)
+    assert wb.sheetnames == ["LEADS ENRIQUECIDOS", "BBDD ORIGINAL", "Errores"]
+    assert list(wb["Errores"].values) == [
+        ("row", "field", "error"),
+        (2, "CIF", "invalid checksum"),
+        ("N/A", "SYSTEM", "boom"),
+    ]
+
+
+def test_write_excel_without_errors_has_no_errors_sheet(tmp_path):
+    """Test that no 'Errores' sheet is created when there are no errors."""
+    output_path = tmp_path / "out.xlsx"
+
+    write_excel(_sample_df(), {}, output_path, preserve_format=False, errors=[])
+
+    wb = openpyxl.load_workbook(output_path)
+    assert "Errores" not in wb.sheetnames
+
+
+def test_write_excel_removes_partial_file_on_error(tmp_path, monkeypatch):
+    """Test that a formatting failure does not leave a truncated workbook behind."""
+    output_path = tmp_path / "out.xlsx"
+
+    def fail(ws):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr("src.core.excel_processor._auto_adjust_column_widths", fail)
+
+    with pytest.raises(RuntimeError):
+        write_excel(_sample_df(), {}, output_path, preserve_format=False)
+
+    assert not output_path.exists()
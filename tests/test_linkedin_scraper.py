@@ -0,0 +1,146 @@
+"""Unit tests for LinkedInScraper browser reuse."""
+
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scrapers import linkedin_scraper
+from src.scrapers.linkedin_scraper import LinkedInScraper
+
+
+def test_find_company_reuses_one_browser_until_close(monkeypatch):
+    """Test that searches share a launched browser and close() shuts it down."""
+    playwright = MagicMock()
+    browser = playwright.chromium.launch.return_value
+    browser.is_connected.return_value = True
+    page = browser.new_context.return_value.new_page.return_value
+    page.content.return_value = '<a href="https://www.linkedin.com/company/acme">Acme</a>'
+    monkeypatch.setattr(linkedin_scraper, "sync_playwright", lambda: MagicMock(start=lambda: playwright))
+    monkeypatch.setattr(linkedin_scraper.time, "sleep", lambda seconds: None)
+    scraper = LinkedInScraper(browsers=1)
+
+    results = [scraper.find_company(name) for name in ("Acme", "Acme SL", "Acme Iberia")]
+    scraper.close()
+
+    assert [r.company_url for r in results] == ["https://www.linkedin.com/company/acme"] * 3
+    assert playwright.chromium.launch.call_count == 1
+    assert browser.new_context.return_value.close.call_count == 3
+    browser.close.assert_called_once()
+    playwright.stop.assert_called_once()
+    assert scraper.find_company(" ").error == "EMPTY_COMPANY_NAME"
+
+
+def test_context_manager_closes_browsers_once(monkeypatch):
+    """Test that leaving the with-block stops the browser and a second close() is a no-op."""
+    playwright = MagicMock()
+    browser = playwright.chromium.launch.return_value
+    browser.is_connected.return_value = True
+    browser.new_context.return_value.new_page.return_value.content.return_value = ""
+    monkeypatch.setattr(linkedin_scraper, "sync_playwright", lambda: MagicMock(start=lambda: playwright))
+    monkeypatch.setattr(linkedin_scraper.time, "sleep", lambda seconds: None)
+
+    with LinkedInScraper(browsers=2) as scraper:
+        scraper.find_company("Acme")
+
+    scraper.close()
+
+    browser.close.assert_called_once()
+    playwright.stop.assert_called_once()
+
+
+def test_find_company_times_out_when_the_browser_thread_hangs(monkeypatch):
+    """Test that a hung browser thread yields a TIMEOUT result instead of blocking the caller."""
+    playwright = MagicMock()
+    browser = playwright.chromium.launch.return_value
+    browser.is_connected.return_value = True
+    release = threading.Event()
+    browser.new_context.return_value.new_page.return_value.goto.side_effect = lambda *args, **kwargs: release.wait(5)
+    monkeypatch.setattr(linkedin_scraper, "sync_playwright", lambda: MagicMock(start=lambda: playwright))
+    monkeypatch.setattr(linkedin_scraper.time, "sleep", lambda seconds: None)
+    scraper = LinkedInScraper(browsers=1)
+    scraper._result_timeout = 0.1
+
+    try:
+        result = scraper.find_company("Acme")
+    finally:
+        release.set()
+        scraper.close()
+
+    assert (result.success, result.error) == (False, "TIMEOUT")
+
+
+def test_shared_browser_is_launched_once_and_reached_over_cdp(monkeypatch):
+    """Test that with cdp_port every search thread connects to one launched Chromium."""
+    playwright = MagicMock()
+    for browser in (playwright.chromium.launch.return_value, playwright.chromium.connect_over_cdp.return_value):
+        browser.is_connected.return_value = True
+        browser.new_context.return_value.new_page.return_value.content.return_value = (
+            "https://www.linkedin.com/company/acme"
+        )
+    monkeypatch.setattr(linkedin_scraper, "sync_playwright", lambda: MagicMock(start=lambda: playwright))
+    monkeypatch.setattr(linkedin_scraper.time, "sleep", lambda seconds: None)
+
+    with LinkedInScraper(browsers=3, cdp_port=9333) as scraper:
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            results = list(pool.map(scraper.find_company, ["Acme", "Acme SL", "Acme Iberia"]))
+
+    assert all(r.success for r in results)
+    playwright.chromium.launch.assert_called_once()
+    assert "--remote-debugging-port=9333" in playwright.chromium.launch.call_args.kwargs["args"]
+    connects = playwright.chromium.connect_over_cdp.call_args_list
+    assert connects and all(call.args[0] == "http://127.0.0.1:9333" for call in connects)
+    playwright.chromium.launch.return_value.close.assert_called_once()
+    playwright.chromium.launch.return_value.new_context.assert_not_called()
+
+
+def test_find_companies_batches_names_into_one_query(monkeypatch):
+    """Test that queued names share one Google query and misses fall back to single searches."""
+    playwright = MagicMock()
+    browser = playwright.chromium.launch.return_value
+    browser.is_connected.return_value = True
+    page = browser.new_context.return_value.new_page.return_value
+    links = [
+        ("https://es.linkedin.com/company/beta-foods", "Beta Foods | LinkedIn"),
+        ("/url?q=https://www.linkedin.com/company/acme%3Fsa%3DU", "ACME S.L. - LinkedIn"),
+        ("https://www.linkedin.com/company/zeta", "Zeta Ltd"),
+    ]
+    page.query_selector_all.return_value = [
+        MagicMock(get_attribute=lambda name, href=href: href, inner_text=lambda text=text: text)
+        for href, text in links
+    ]
+    page.content.return_value = '<a href="https://www.linkedin.com/company/gamma-group">Gamma</a>'
+    monkeypatch.setattr(linkedin_scraper, "sync_playwright", lambda: MagicMock(start=lambda: playwright))
+    monkeypatch.setattr(linkedin_scraper.time, "sleep", lambda seconds: None)
+
+    with LinkedInScraper(browsers=1, batch_size=8) as scraper:
+        results = scraper.find_companies(["Acme SL", "Beta Foods", "Gamma", "Acme SL", ""])
+
+    assert {name: r.company_url for name, r in results.items()} == {
+        "Acme SL": "https://www.linkedin.com/company/acme",
+        "Beta Foods": "https://es.linkedin.com/company/beta-foods",
+        "Gamma": "https://www.linkedin.com/company/gamma-group",
+        "": None,
+    }
+    urls = [call.args[0] for call in page.goto.call_args_list]
+    assert len(urls) == 2
+    assert "%22Acme+SL%22+OR+%22Beta+Foods%22+OR+%22Gamma%22" in urls[0]
+
+
+def test_match_companies_assigns_each_link_once():
+    """Test greedy matching: closest name wins a shared link and weak matches are dropped."""
+    candidates = [
+        ("https://www.linkedin.com/company/acme-iberia", "Acme Iberia | LinkedIn"),
+        ("https://www.linkedin.com/company/acme", "Acme | LinkedIn"),
+    ]
+
+    matches = linkedin_scraper._match_companies(["Acme", "Acme Iberia SA", "Omega"], candidates, 0.9)
+
+    assert matches == {
+        "Acme Iberia SA": "https://www.linkedin.com/company/acme-iberia",
+        "Acme": "https://www.linkedin.com/company/acme",
+    }
@@ -1,16 +1,27 @@
 """Unit tests for M3 components: Tier3, Scoring, Batch Validators."""
 
 import sys
+import threading
 from pathlib import Path
 
 # Add project root to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import pytest
+import numpy as np
 import pandas as pd
 from unittest.mock import Mock, MagicMock
 
-from src.enrichers.tier3_enricher import Tier3Enricher, SimpleSearchClient, SimpleHttpClient
+from src.enrichers.tier3_enricher import (
+    MAX_HTTP_TIMEOUT,
+    SearchClient,
+    Tier3Enricher,
+    SimpleSearchClient,
+    SimpleHttpClient,
+    _compile_query_template,
+    _empty_mask,
+    _format_queries,
+)
 from src.core.scoring_engine import ScoringEngine
 from src.validators.email_batch_validator import validate_all_emails
 from src.validators.phone_batch_validator import validate_all_phones
@@ -109,6 +120,332 @@ class TestTier3Enricher:
         # Second row should be enriched
         assert result.loc[1, "CNAE"] == "5678"
 
+    def test_enrich_cnae_keeps_only_well_formed_codes(self):
+        """Test that found codes are stripped and only 4-5 digit codes are written."""
+        df = pd.DataFrame({"RAZON_SOCIAL": ["A", "B", "C", "D"], "CIF": [""] * 4, "CNAE": [None] * 4})
+        search_client = Mock()
+        search_client.search_company_cnae = Mock(side_effect=[" 6201 ", "62A1", None, 47111])
+
+        enricher = Tier3Enricher(search_client=search_client, http_client=Mock(), rules={"concurrency": 1})
+        result = enricher.enrich_cnae(df)
+
+        assert result["CNAE"].tolist() == ["6201", None, None, "47111"]
+        assert result["CNAE_SOURCE"].eq("search").tolist() == [True, False, False, True]
+        assert isinstance(result["CNAE_SOURCE"].dtype, pd.CategoricalDtype)
+
+    def test_enrich_website_checks_rows_concurrently_in_order(self):
+        """Test that slow searches overlap and each result lands on its own row."""
+        import time
+
+        df = pd.DataFrame({
+            "RAZON_SOCIAL": [f"Company {i}" for i in range(8)],
+            "CIF": [""] * 8,
+            "WEBSITE": [None] * 8,
+        })
+
+        def slow_search(query):
+            time.sleep(0.1)
+            return f"{query.split()[-1]}.com"
+
+        search_client = Mock()
+        search_client.search_company_website = Mock(side_effect=slow_search)
+        http_client = Mock()
+        http_client.is_url_alive = Mock(return_value=True)
+        rules = {"concurrency": 8, "website": {"domains_blacklist": []}}
+
+        enricher = Tier3Enricher(search_client=search_client, http_client=http_client, rules=rules)
+        start = time.perf_counter()
+        result = enricher.enrich_website(df)
+
+        assert time.perf_counter() - start < 0.5
+        assert result["WEBSITE"].tolist() == [f"https://{i}.com" for i in range(8)]
+
+    def test_enrich_cnae_writes_rows_sharing_an_index_label(self):
+        """Test that found values land on the right rows when index labels repeat."""
+        df = pd.DataFrame(
+            {"RAZON_SOCIAL": ["A", "B", "C"], "CIF": ["1", "2", "3"], "CNAE": [None, None, "4711"]},
+            index=[0, 0, 1],
+        )
+        search_client = Mock()
+        search_client.search_company_cnae = Mock(side_effect=lambda query: {"A": "6201", "B": None}[query[0]])
+
+        enricher = Tier3Enricher(search_client=search_client, http_client=Mock(), rules={"concurrency": 1})
+        result = enricher.enrich_cnae(df)
+
+        assert result["CNAE"].tolist() == ["6201", None, "4711"]
+        assert result["CNAE_SOURCE"].eq("search").tolist() == [True, False, False]
+
+    def test_enrich_cnae_searches_repeated_queries_once(self):
+        """Test that rows building the same query share one search."""
+        df = pd.DataFrame({"RAZON_SOCIAL": ["A", "B", "A", "A"], "CIF": ["1", "2", "1", "1"], "CNAE": [None] * 4})
+        search_client = Mock()
+        search_client.search_company_cnae = Mock(side_effect=lambda query: "6201" if query.startswith("A") else None)
+
+        enricher = Tier3Enricher(search_client=search_client, http_client=Mock(), rules={"concurrency": 4})
+        result = enricher.enrich_cnae(df)
+
+        assert result["CNAE"].tolist() == ["6201", None, "6201", "6201"]
+        assert sorted(call.args[0] for call in search_client.search_company_cnae.call_args_list) == [
+            "A 1 CNAE",
+            "B 2 CNAE",
+        ]
+
+    def test_enrich_website_sends_distinct_queries_in_one_batch(self):
+        """Test that clients with a batch method get every distinct query in one call."""
+
+        class BatchSearchClient(SimpleSearchClient):
+            def search_company_website(self, query):
+                raise AssertionError("single-query search should not be used")
+
+        df = pd.DataFrame({"RAZON_SOCIAL": ["A", "B", "A", None], "CIF": [""] * 4, "WEBSITE": [None] * 4})
+        search_client = BatchSearchClient()
+        search_client.search_company_website_batch = Mock(return_value=["a.com", None])
+        http_client = Mock()
+        http_client.is_url_alive = Mock(return_value=True)
+
+        enricher = Tier3Enricher(search_client=search_client, http_client=http_client, rules={})
+        result = enricher.enrich_website(df)
+
+        search_client.search_company_website_batch.assert_called_once_with(["A", "B"])
+        assert result["WEBSITE"].tolist() == ["https://a.com", None, "https://a.com", None]
+
+    def test_search_client_subclass_without_batch_methods_searches_per_query(self):
+        """Test that a client inheriting the protocol is not mistaken for a batch client."""
+
+        class SingleSearchClient(SearchClient):
+            def search_company_website(self, query):
+                return None
+
+            def search_company_cnae(self, query):
+                return "6201"
+
+        df = pd.DataFrame({"RAZON_SOCIAL": ["A", "B"], "CIF": ["1", "2"], "WEBSITE": [None, None], "CNAE": [None, None]})
+        enricher = Tier3Enricher(search_client=SingleSearchClient(), http_client=Mock(), rules={})
+        result = enricher.process_missing_only(df)
+
+        assert result["CNAE"].tolist() == ["6201", "6201"]
+        assert result["WEBSITE"].isna().all()
+
+    def test_simple_search_client_batch_keeps_order_and_isolates_failures(self):
+        """Test the default threaded batch search."""
+        client = SimpleSearchClient(max_workers=4)
+        client.search_company_cnae = Mock(side_effect=lambda query: 1 / 0 if query == "b" else query.upper())
+
+        assert client.search_company_cnae_batch(["a", "b", "c"]) == ["A", None, "C"]
+
+    def test_enrich_website_checks_each_url_once_and_blacklists_by_domain(self):
+        """Test that repeated candidates are checked once and blacklisting matches whole domains."""
+        candidates = ["https://shared.com", "shared.com", "https://m.facebook.com/empresa", "https://netflix.com"]
+        df = pd.DataFrame({
+            "RAZON_SOCIAL": [f"Company {i}" for i in range(4)],
+            "CIF": [""] * 4,
+            "WEBSITE": [None] * 4,
+        })
+        search_client = Mock()
+        search_client.search_company_website = Mock(side_effect=candidates)
+        http_client = Mock()
+        http_client.is_url_alive = Mock(return_value=True)
+        rules = {"concurrency": 1, "website": {"domains_blacklist": ["facebook.com", "x.com"]}}
+
+        enricher = Tier3Enricher(search_client=search_client, http_client=http_client, rules=rules)
+        result = enricher.enrich_website(df)
+
+        assert result["WEBSITE"].tolist() == ["https://shared.com", "https://shared.com", None, "https://netflix.com"]
+        assert [call.args[0] for call in http_client.is_url_alive.call_args_list] == [
+            "https://shared.com",
+            "https://netflix.com",
+        ]
+
+    def test_enrich_website_reuses_url_verdicts_across_calls(self):
+        """Test that alive and dead URLs are checked once for the enricher's lifetime."""
+        df = pd.DataFrame({"RAZON_SOCIAL": ["A", "B"], "CIF": [""] * 2, "WEBSITE": [None] * 2})
+        search_client = Mock()
+        search_client.search_company_website = Mock(side_effect=lambda query: f"{query.lower()}.com")
+        http_client = Mock()
+        http_client.is_url_alive = Mock(side_effect=lambda url, timeout: url == "https://a.com")
+        rules = {"concurrency": 1, "website": {"domains_blacklist": ["facebook.com"]}}
+
+        enricher = Tier3Enricher(search_client=search_client, http_client=http_client, rules=rules)
+        first = enricher.enrich_website(df)
+        second = enricher.enrich_website(df)
+
+        assert first["WEBSITE"].tolist() == second["WEBSITE"].tolist() == ["https://a.com", None]
+        assert search_client.search_company_website.call_count == 4
+        assert http_client.is_url_alive.call_count == 2
+
+    def test_normalize_url_adds_scheme_once(self):
+        """Test URL normalization (module helper and enricher delegate)."""
+        enricher = Tier3Enricher(search_client=Mock(), http_client=Mock(), rules={})
+
+        assert enricher._normalize_url(" empresa.es ") == "https://empresa.es"
+        assert enricher._normalize_url("http://empresa.es") == "http://empresa.es"
+        assert enricher._normalize_url("   ") == ""
+
+    def test_blacklist_keywords_match_anywhere_in_host(self):
+        """Test that dotless blacklist entries keep matching as substrings of the host."""
+        rules = {"website": {"domains_blacklist": ["paginasamarillas", "www.Einforma.com"]}}
+        enricher = Tier3Enricher(search_client=Mock(), http_client=Mock(), rules=rules)
+
+        assert enricher._is_blacklisted_domain("https://www.paginasamarillas.es/empresa")
+        assert enricher._is_blacklisted_domain("app.einforma.com")
+        assert not enricher._is_blacklisted_domain("https://empresa.es")
+
+    def test_enrich_website_blacklists_hosts_of_any_url_shape(self):
+        """Test that hosts are taken from candidates with userinfo, ports, case or no scheme."""
+        candidates = ["HTTP://user@Facebook.com:8080/x", " linkedin.com/company/a ", "empresa.es:443", None]
+        df = pd.DataFrame({"RAZON_SOCIAL": [f"Company {i}" for i in range(4)], "WEBSITE": [None] * 4})
+        search_client = Mock()
+        search_client.search_company_website = Mock(side_effect=candidates)
+        http_client = Mock()
+        http_client.is_url_alive = Mock(return_value=True)
+        rules = {"concurrency": 1, "website": {"domains_blacklist": ["facebook.com", "linkedin"]}}
+
+        enricher = Tier3Enricher(search_client=search_client, http_client=http_client, rules=rules)
+        result = enricher.enrich_website(df)
+
+        assert result["WEBSITE"].tolist() == [None, None, "https://empresa.es:443", None]
+        assert result["WEBSITE_SOURCE"].eq("search").tolist() == [False, False, True, False]
+
+    def test_process_missing_only_leaves_input_untouched(self):
+        """Test that only the written columns are copied and the input frame is not modified."""
+        df = pd.DataFrame({
+            "RAZON_SOCIAL": ["Company A", "Company B"],
+            "NOTAS": ["a", "b"],
+            "WEBSITE": [None, "https://b.com"],
+        })
+        search_client = Mock()
+        search_client.search_company_website = Mock(return_value="https://a.com")
+        search_client.search_company_cnae = Mock(return_value="6201")
+        http_client = Mock()
+        http_client.is_url_alive = Mock(return_value=True)
+
+        enricher = Tier3Enricher(search_client=search_client, http_client=http_client, rules={"concurrency": 1})
+        result = enricher.process_missing_only(df)
+
+        assert result["WEBSITE"].tolist() == ["https://a.com", "https://b.com"]
+        assert result["CNAE"].tolist() == ["6201", "6201"]
+        assert df.columns.tolist() == ["RAZON_SOCIAL", "NOTAS", "WEBSITE"]
+        assert df["WEBSITE"].tolist() == [None, "https://b.com"]
+        assert np.shares_memory(result["NOTAS"].to_numpy(), df["NOTAS"].to_numpy())
+
+    def test_found_source_added_to_existing_categorical(self):
+        """Test that a source column already stored as category gets the search label added."""
+        df = pd.DataFrame({
+            "RAZON_SOCIAL": ["A", "B"],
+            "CNAE": ["4711", None],
+            "CNAE_SOURCE": pd.Categorical(["tier1", None]),
+        })
+        search_client = Mock()
+        search_client.search_company_cnae = Mock(return_value="6201")
+
+        enricher = Tier3Enricher(search_client=search_client, http_client=Mock(), rules={"concurrency": 1})
+        result = enricher.enrich_cnae(df)
+
+        assert result["CNAE_SOURCE"].tolist() == ["tier1", "search"]
+        assert df["CNAE_SOURCE"].cat.categories.tolist() == ["tier1"]
+
+    def test_query_template_is_compiled_into_parts(self):
+        """Test that templates compile to merged literals and fields, and fill whole columns."""
+        df = pd.DataFrame({"RAZON_SOCIAL": ["Acme", None], "CIF": ["B12345678", "A1"]})
+
+        assert _compile_query_template("{razon_social}{cif!s:.3} CNAE") == (
+            ("RAZON_SOCIAL", None),
+            ("CIF", "{0!s:.3}"),
+            " CNAE",
+        )
+        assert _format_queries("{razon_social}{cif!s:.3} CNAE", df).tolist() == ["AcmeB12 CNAE", "A1 CNAE"]
+        assert _format_queries("empresas", df).tolist() == ["empresas", "empresas"]
+        assert _format_queries("{razon_social}  {cif} CNAE", df.assign(CIF=[None, ""])).tolist() == [
+            "Acme CNAE",
+            "",
+        ]
+        with pytest.raises(KeyError):
+            _compile_query_template("{nombre}")
+
+    def test_process_missing_only_runs_website_and_cnae_side_by_side(self):
+        """Test that the WEBSITE and CNAE searches overlap instead of running one after the other."""
+        both_searching = threading.Barrier(2, timeout=5)
+
+        def search(result):
+            def wait(query):
+                both_searching.wait()
+                return result
+            return wait
+
+        df = pd.DataFrame({"RAZON_SOCIAL": ["Company A"], "CIF": ["B12345678"]})
+        search_client = Mock()
+        search_client.search_company_website = Mock(side_effect=search("https://a.com"))
+        search_client.search_company_cnae = Mock(side_effect=search("6201"))
+        http_client = Mock()
+        http_client.is_url_alive = Mock(return_value=True)
+
+        enricher = Tier3Enricher(search_client=search_client, http_client=http_client, rules={"concurrency": 1})
+        result = enricher.process_missing_only(df)
+
+        assert result.columns.tolist() == ["RAZON_SOCIAL", "CIF", "WEBSITE", "CNAE", "WEBSITE_SOURCE", "CNAE_SOURCE"]
+        assert result.loc[0, ["WEBSITE", "CNAE"]].tolist() == ["https://a.com", "6201"]
+
+    def test_http_client_reuses_one_session(self):
+        """Test that URL checks go through the client's pooled session."""
+        with SimpleHttpClient(accepted_status_codes=[200]) as client:
+            client._session.head = Mock(side_effect=[Mock(status_code=200), Mock(status_code=404)])
+
+            assert client.is_url_alive("a.com", 3.0)
+            assert not client.is_url_alive("https://a.com/missing", 3.0)
+
+        assert [call.args[0] for call in client._session.head.call_args_list] == [
+            "https://a.com",
+            "https://a.com/missing",
+        ]
+
+    def test_http_client_caps_timeout_and_sets_user_agent_once(self):
+        """Test that checks never wait longer than the cap and reuse the session headers."""
+        client = SimpleHttpClient(accepted_status_codes=[200])
+        client._session.head = Mock(return_value=Mock(status_code=200))
+
+        assert client.is_url_alive("https://a.com", 30)
+        assert client._session.head.call_args.kwargs["timeout"] == MAX_HTTP_TIMEOUT
+        assert client._session.headers["User-Agent"].startswith("Mozilla/5.0")
+        client.close()
+
+    def test_empty_mask_matches_is_empty(self):
+        """Test that the vectorized empty mask follows the per-value rule for every dtype."""
+        enricher = Tier3Enricher(search_client=Mock(), http_client=Mock(), rules={})
+        columns = [
+            pd.Series([None, "", "   ", "https://a.com", float("nan"), 1234]),
+            pd.Series([None, None]),
+            pd.Series([1.0, float("nan")]),
+            pd.Series(["", "6201"], dtype="string"),
+        ]
+
+        for series in columns:
+            assert _empty_mask(series).tolist() == [enricher._is_empty(value) for value in series.tolist()]
+
+    def test_enrich_website_builds_queries_per_column(self):
+        """Test that queries are built from whole columns and results written back by row."""
+        df = pd.DataFrame({
+            "RAZON_SOCIAL": ["Company A", "Company B", None],
+            "CIF": ["B12345678", float("nan"), "A87654321"],
+            "WEBSITE": [float("nan")] * 3,
+        }, index=[10, 20, 30])
+
+        search_client = Mock()
+        search_client.search_company_website = Mock(
+            side_effect=lambda query: "b.com" if query.startswith("Company B") else None
+        )
+        http_client = Mock()
+        http_client.is_url_alive = Mock(return_value=True)
+        rules = {"website": {"query_template": "{razon_social} ({cif!s:.3})", "domains_blacklist": []}}
+
+        enricher = Tier3Enricher(search_client=search_client, http_client=http_client, rules=rules)
+        result = enricher.enrich_website(df)
+
+        queries = [call.args[0] for call in search_client.search_company_website.call_args_list]
+        assert queries == ["Company A (B12)", "Company B ()", "(A87)"]
+        assert result["WEBSITE"].tolist()[1] == "https://b.com"
+        assert result["WEBSITE_SOURCE"].eq("search").tolist() == [False, True, False]
+        assert pd.isna(result.loc[10, "WEBSITE"])
+
 
 class TestScoringEngine:
     """Tests for ScoringEngine."""
@@ -207,6 +544,34 @@ class TestScoringEngine:
         quality = engine.assign_data_quality(completeness=30.0, confidence=20.0)
         assert quality == "Low"
 
+    def test_annotate_dataframe_matches_annotate_row(self):
+        """Test that vectorized annotation matches the per-row annotation."""
+        df = pd.DataFrame({
+            "CIF": ["B12345678", "A87654321", None, "", "C11111111"],
+            "CIF_VALID": [True, "false", None, True, "yes"],
+            "CIF_FORMAT_OK": [True, False, False, False, True],
+            "RAZON_SOCIAL": ["Company A", "NOT_FOUND", None, "Company D", "  "],
+            "TELEFONO": ["612345678", None, "", "699999999", "912345678"],
+            "PHONE_VALID": [True, False, False, True, False],
+            "EMAIL": ["a@company.com", "bad", None, "d@company.com", ""],
+            "EMAIL_VALID": [True, False, None, True, False],
+            "EMAIL_VALIDATION_LEVEL": ["mx", "syntax", None, "syntax", ""],
+            "EMAIL_SPECIFIC": ["", "NO_EMAIL_FOUND", None, "ventas@d.com", ""],
+            "WEBSITE": ["https://a.com", "NOT_FOUND", None, "", "https://e.com"],
+            "WEBSITE_SOURCE": ["tier3", "", None, "", "tier3"],
+            "CNAE": ["1234", None, "", "", "5678"],
+            "CNAE_SOURCE": ["official_register", None, "", "", "Chamber of Commerce"],
+        }, index=[5, 6, 7, 8, 9])
+
+        engine = ScoringEngine()
+        result = engine.annotate_dataframe(df)
+
+        for idx, row in df.iterrows():
+            expected = engine.annotate_row(row)
+            for col in ("COMPLETITUD_SCORE", "CONFIDENCE_SCORE", "DATA_QUALITY", "DATA_SOURCES"):
+                assert result.loc[idx, col] == expected[col], f"{col} mismatch at row {idx}"
+        assert result["LAST_UPDATED"].nunique() == 1
+
 
 class TestEmailBatchValidator:
     """Tests for batch email validator."""
@@ -69,3 +69,23 @@ def test_m3_full_pipeline():
     print(f"COMPLETITUD_SCORE promedio: {df_result['COMPLETITUD_SCORE'].mean():.1f}")
 
     return df_result
+
+
+def test_validator_columns_are_merged_back(monkeypatch):
+    """Test that every column a batch validator returns reaches the result."""
+    from src.core import orchestrator
+    from src.validators.phone_batch_validator import validate_all_phones
+
+    def phones_with_extra_column(df, rules):
+        df_result = validate_all_phones(df, rules)
+        df_result["PHONE_TYPE"] = "mobile"
+        return df_result
+
+    monkeypatch.setattr(orchestrator, "validate_all_phones", phones_with_extra_column)
+    df = pd.DataFrame({"CIF": ["B12345678"], "EMAIL": [""], "TELEFONO": ["612345678"]})
+
+    df_result = run_tier3_and_validation(df, enable_tier3=False)
+
+    assert df_result.loc[0, "PHONE_TYPE"] == "mobile"
+    assert df_result.loc[0, "TELEFONO"] == "612345678"
+    assert bool(df_result.loc[0, "PHONE_VALID"])
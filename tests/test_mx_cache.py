@@ -0,0 +1,141 @@
+"""Unit tests for the MX lookup cache."""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.validators.email_validator import EmailValidator
+from src.validators.mx_cache import MxCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_mx_cache_expires_entries_after_ttl():
+    """Test that entries are served until the TTL elapses."""
+    clock = FakeClock()
+    cache = MxCache(ttl=300, maxsize=10, clock=clock)
+
+    cache.put("Example.com", (True, None))
+    clock.now = 299
+    assert cache.get("example.com") == (True, None)
+    clock.now = 300
+    assert cache.get("example.com") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_mx_cache_evicts_least_recently_used():
+    """Test that the least recently used domain is dropped when full."""
+    cache = MxCache(ttl=300, maxsize=2)
+
+    cache.put("a.com", (True, None))
+    cache.put("b.com", (True, None))
+    cache.get("a.com")
+    cache.put("c.com", (False, "DOMAIN_NOT_FOUND"))
+
+    assert cache.get("b.com") is None
+    assert cache.get("a.com") == (True, None)
+    assert cache.get("c.com") == (False, "DOMAIN_NOT_FOUND")
+    assert cache.evictions == 1
+    assert len(cache) == 2
+
+
+def test_email_validator_queries_dns_once_per_domain():
+    """Test that repeated domains hit the cache and transient errors are retried."""
+    validator = EmailValidator(mx_cache=MxCache())
+    validator._check_mx_record = Mock(side_effect=lambda domain: (
+        (False, "DNS_TIMEOUT") if domain == "slow.com" else (True, None)
+    ))
+
+    assert validator.validate("ana@empresa.com").deliverable
+    assert validator.validate("LUIS@Empresa.com").deliverable
+    validator.validate("ana@slow.com")
+    validator.validate("luis@slow.com")
+
+    assert [call.args[0] for call in validator._check_mx_record.call_args_list] == [
+        "empresa.com",
+        "slow.com",
+        "slow.com",
+    ]
+
+
+def test_validate_async_shares_in_flight_queries_per_domain():
+    """Test that concurrent async validations of one domain issue a single MX query."""
+    validator = EmailValidator(mx_cache=MxCache())
+    calls = []
+
+    async def fake_check(domain):
+        calls.append(domain)
+        await asyncio.sleep(0.01)
+        return True, None
+
+    validator._check_mx_record_async = fake_check
+
+    async def run():
+        return await asyncio.gather(
+            validator.validate_async("ana@empresa.com"),
+            validator.validate_async("luis@empresa.com"),
+            validator.validate_async("info@empresa.com"),
+            validator.validate_async("eva@otra.com"),
+        )
+
+    results = asyncio.run(run())
+
+    assert sorted(calls) == ["empresa.com", "otra.com"]
+    assert [r.deliverable for r in results] == [True, True, False, True]
+    assert results[2].generic
+    assert validator.mx_cache.get("empresa.com") == (True, None)
+
+
+def test_is_generic_email_matches_prefix_plus_digits_only():
+    """Test the generic mailbox check (exact name or name followed by digits)."""
+    validator = EmailValidator()
+
+    assert validator._is_generic_email("Info@empresa.com")
+    assert validator._is_generic_email("contacto12@empresa.com")
+    assert not validator._is_generic_email("infoana@empresa.com")
+    assert not validator._is_generic_email("ana2@empresa.com")
+
+
+def test_prefetch_mx_fills_cache_once_per_domain():
+    """Test that prefetch skips cached and reserved domains and later validations hit the cache."""
+    validator = EmailValidator(mx_cache=MxCache())
+    validator.mx_cache.put("cached.com", (True, None))
+    calls = []
+
+    async def fake_check(domain):
+        calls.append(domain)
+        return True, None
+
+    validator._check_mx_record_async = fake_check
+
+    queried = asyncio.run(validator.prefetch_mx(["Empresa.com", "empresa.com.", "cached.com", "intranet.local"]))
+    result = asyncio.run(validator.validate_async("ana@empresa.com"))
+
+    assert queried == 1
+    assert calls == ["empresa.com"]
+    assert result.deliverable
+
+
+def test_free_mail_domains_skip_the_mx_query():
+    """Test that addresses at free mail providers are deliverable without DNS."""
+    validator = EmailValidator(mx_cache=MxCache())
+    validator._check_mx_record = Mock(return_value=(True, None))
+
+    result = validator.validate("Ana.Lopez@Gmail.com")
+    generic = validator.validate("info@hotmail.com")
+    queried = asyncio.run(validator.prefetch_mx(["gmail.com", "outlook.es"]))
+
+    assert (result.valid, result.deliverable, result.generic) == (True, True, False)
+    assert generic.error == "GENERIC_EMAIL"
+    assert queried == 0
+    validator._check_mx_record.assert_not_called()
@@ -0,0 +1,129 @@
+"""Unit tests for OpenAIParser (token budgeting, batching and retries)."""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import openai
+
+from src.ai import openai_parser
+from src.ai.openai_parser import OpenAIParser
+
+
+class WordEncoding:
+    """Stand-in tokenizer: one token per whitespace-separated word."""
+
+    def encode(self, text, disallowed_special=()):
+        return text.split()
+
+    def decode(self, ids):
+        return " ".join(ids)
+
+
+def _parser(monkeypatch, encoding):
+    monkeypatch.setattr(openai_parser, "_load_encoding", lambda model: encoding)
+    parser = OpenAIParser(api_key="test-key")
+    parser.client = Mock()
+    parser.client.chat.completions.create.return_value = Mock(
+        choices=[Mock(message=Mock(content='{"emails": ["ana@empresa.es"], "contacts": []}'))]
+    )
+    return parser
+
+
+def test_parse_html_truncates_to_token_budget(monkeypatch):
+    """Test that HTML is cut to the tokens left after the prompt template."""
+    parser = _parser(monkeypatch, WordEncoding())
+    html = " ".join(f"w{i}" for i in range(OpenAIParser.MAX_TOKENS * 2))
+
+    result = parser.parse_html(html)
+
+    prompt = parser.client.chat.completions.create.call_args.kwargs["messages"][1]["content"]
+    assert len(prompt.split()) == OpenAIParser.MAX_TOKENS
+    assert result.tokens_used == OpenAIParser.MAX_TOKENS
+    assert result.emails == ["ana@empresa.es"]
+
+
+def test_parse_html_estimates_tokens_without_tokenizer(monkeypatch):
+    """Test the length-based fallback when tiktoken is not available."""
+    parser = _parser(monkeypatch, None)
+    html = "<p>" + "x" * 400 + "</p>"
+
+    result = parser.parse_html(html)
+
+    assert result.tokens_used == parser._template_tokens + len(html) // 4
+
+
+def test_parse_html_batch_maps_answers_back_to_pages(monkeypatch):
+    """Test that one call serves several pages and missing answers become errors."""
+    parser = _parser(monkeypatch, WordEncoding())
+    parser.client.chat.completions.create.return_value = Mock(
+        choices=[Mock(message=Mock(content=(
+            '{"documents": ['
+            '{"doc": 2, "emails": ["eva@otra.es"], "contacts": [{"name": "Eva", "title": "CEO", "email": null}]},'
+            '{"doc": 1, "emails": ["info@empresa.es", "ana@empresa.es"], "contacts": []}'
+            ']}'
+        )))]
+    )
+
+    results = parser.parse_html_batch(["<p>ana</p>", "", "<p>eva</p>", "<p>luis</p>"])
+
+    assert parser.client.chat.completions.create.call_count == 1
+    prompt = parser.client.chat.completions.create.call_args.kwargs["messages"][1]["content"]
+    assert "<<<DOC 3>>>\n<p>luis</p>" in prompt
+    assert results[0].emails == ["ana@empresa.es"]
+    assert results[1].error == "Empty HTML content"
+    assert results[2].contacts[0].name == "Eva"
+    assert results[3].error == "MISSING_IN_BATCH_RESPONSE"
+
+
+def test_offline_batch_round_trip(monkeypatch):
+    """Test that pages are queued as a Batch API job and its output is parsed per page."""
+    parser = _parser(monkeypatch, WordEncoding())
+    client = parser.client
+    client.files.create.return_value = Mock(id="file-in")
+    client.batches.create.return_value = Mock(id="batch-1")
+    client.batches.retrieve.side_effect = [
+        Mock(status="in_progress"),
+        Mock(status="completed", output_file_id="file-out"),
+    ]
+    output = [
+        {"custom_id": "a", "response": {"status_code": 200, "body": {
+            "choices": [{"message": {"content": '{"emails": ["ana@empresa.es"], "contacts": []}'}}],
+            "usage": {"prompt_tokens": 120},
+        }}},
+        {"custom_id": "b", "response": {"status_code": 429, "body": {"error": {"message": "rate limited"}}}},
+    ]
+    client.files.content.return_value = Mock(text="\n".join(json.dumps(line) for line in output))
+    sleeps = []
+
+    batch_id = parser.submit_offline_batch({"a": "<p>ana</p>", "b": "<p>luis</p>"})
+    results = parser.collect_offline_batch(batch_id, poll_interval=30, sleep=sleeps.append)
+
+    uploaded = client.files.create.call_args.kwargs["file"][1].decode("utf-8").splitlines()
+    assert [json.loads(line)["custom_id"] for line in uploaded] == ["a", "b"]
+    assert client.batches.create.call_args.kwargs["endpoint"] == "/v1/chat/completions"
+    assert sleeps == [30]
+    assert results["a"].emails == ["ana@empresa.es"]
+    assert results["a"].tokens_used == 120
+    assert results["b"].error == "OPENAI_ERROR: rate limited"
+
+
+def test_parse_html_retries_rate_limited_calls(monkeypatch):
+    """Test that a 429 is retried and every attempt goes through the rate limiters."""
+    parser = _parser(monkeypatch, WordEncoding())
+    monkeypatch.setattr("src.api_manager.utils.retry.time.sleep", lambda seconds: None)
+    ok = parser.client.chat.completions.create.return_value
+    rate_limited = openai.RateLimitError("slow down", response=Mock(status_code=429, headers={}), body=None)
+    parser.client.chat.completions.create.side_effect = [rate_limited, ok]
+    parser.request_limiter = Mock()
+    parser.token_limiter = Mock()
+
+    result = parser.parse_html("<p>ana</p>")
+
+    assert result.emails == ["ana@empresa.es"]
+    assert parser.request_limiter.acquire.call_count == 2
+    assert parser.token_limiter.acquire.call_args.args[0] == result.tokens_used + OpenAIParser.MAX_OUTPUT_TOKENS
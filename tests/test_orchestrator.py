@@ -0,0 +1,91 @@
+"""Unit tests for the core orchestrator with stubbed enrichers."""
+
+import json
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import openpyxl
+import pandas as pd
+
+from src.core import orchestrator
+
+
+class StubTier1Enricher:
+    """Tier1Enricher stand-in returning fixed output columns."""
+
+    columns = {}
+
+    def __init__(self, config_path=None):
+        pass
+
+    def enrich_dataframe(self, df, progress_callback=None, check_stop_callback=None):
+        return self.columns, None
+
+
+def test_tier1_write_back_keeps_good_columns_when_one_fails(monkeypatch):
+    """Test that a Tier1 column that cannot be written does not drop the others."""
+    StubTier1Enricher.columns = {"PHONE": ["611111111", "622222222"], "BROKEN": ["a", "b", "c"]}
+    monkeypatch.setattr(orchestrator, "Tier1Enricher", StubTier1Enricher)
+    df = pd.DataFrame({"CONSUMO": [100, 50], "_IS_RED_ROW": [False, False]})
+
+    df_result, _ = orchestrator.run_pipeline(df, tier1_only=True)
+
+    assert df_result["PHONE"].tolist() == ["611111111", "622222222"]
+    assert df_result["BROKEN"].isna().all()
+
+
+class FailingTier3Enricher:
+    """Tier3Enricher stand-in whose search backend is down."""
+
+    def __init__(self, rules=None):
+        pass
+
+    def process_missing_only(self, df):
+        raise RuntimeError("search backend down")
+
+    def close(self):
+        pass
+
+
+def _input_excel(tmp_path):
+    input_path = tmp_path / "leads.xlsx"
+    pd.DataFrame({
+        "NOMBRE CLIENTE": ["Empresa A", "Empresa B"],
+        "CIF": ["B12345678", ""],
+        "EMAIL": ["ana@empresa.es", ""],
+        "TELEFONO": ["612345678", ""],
+        "CONSUMO": [100, 50],
+    }).to_excel(input_path, index=False)
+    return input_path
+
+
+def test_stage_errors_reach_the_json_errors_file(tmp_path, monkeypatch):
+    """Test that a failing Tier3 stage is recorded instead of aborting the run."""
+    monkeypatch.delenv("TAVILY_API_KEY", raising=False)
+    monkeypatch.setattr(orchestrator, "Tier3Enricher", FailingTier3Enricher)
+    output_path = tmp_path / "out.xlsx"
+
+    _, metrics = orchestrator.process_file(_input_excel(tmp_path), output_path, tiers=[3], errors_sink="json")
+
+    errors = json.loads(output_path.with_suffix(".errors.json").read_text(encoding="utf-8"))
+    assert {"row": "N/A", "field": "TIER3", "error": "search backend down"} in errors
+    assert metrics["errors_count"] == len(errors)
+
+
+def test_stage_errors_reach_the_errores_sheet(tmp_path, monkeypatch):
+    """Test that the saved workbook has an Errores sheet listing stage errors."""
+    monkeypatch.delenv("TAVILY_API_KEY", raising=False)
+    monkeypatch.setattr(orchestrator, "Tier3Enricher", FailingTier3Enricher)
+    output_path = tmp_path / "out.xlsx"
+
+    orchestrator.process_file(_input_excel(tmp_path), output_path, tiers=[3], errors_sink="excel")
+
+    workbook = openpyxl.load_workbook(output_path)
+    rows = list(workbook["Errores"].iter_rows(values_only=True))
+    workbook.close()
+    assert rows[0] == ("row", "field", "error")
+    assert ("N/A", "TIER3", "search backend down") in rows[1:]
+    assert not output_path.with_suffix(".errors.json").exists()
@@ -0,0 +1,68 @@
+"""Unit tests for PriorityEngine."""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+
+from src.core.priority_engine import PriorityEngine
+
+
+class TestPriorityEngine:
+    """Tests for PriorityEngine."""
+
+    def test_calculate_priorities_with_service_columns(self):
+        """Test vectorized priorities using LUZ/GAS columns and CONSUMO fallback."""
+        df = pd.DataFrame({
+            "CONSUMO_MWH": [350, 350, 210, 120, 80, 50, None, "", "abc"],
+            "CONSUMO": [None, None, None, None, None, None, 150, 75, 300],
+            "LUZ": ["X", "X", "X", None, None, None, None, None, "X"],
+            "GAS": ["X", None, "X", None, None, None, None, None, "X"],
+        })
+
+        engine = PriorityEngine()
+        priorities = engine.calculate_priorities(df)
+
+        assert priorities.tolist() == [4, 3, 3, 3, 2, 1, 3, 2, 1]
+
+    def test_calculate_priorities_matches_calculate_priority(self):
+        """Test that vectorized priorities match the per-row calculation."""
+        df = pd.DataFrame({
+            "CONSUMO": [400, 400, 250, 250, 100, 99.5, 70, 69, None, "120", ""],
+            "L/V": ["L/G", "L", "LG", "V", None, "L", "G", "L/G", "L/G", np.nan, "L/G"],
+        }, index=[10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20])
+
+        engine = PriorityEngine()
+        priorities = engine.calculate_priorities(df)
+        expected = [engine.calculate_priority(row) for _, row in df.iterrows()]
+
+        assert priorities.tolist() == expected
+        assert priorities.index.equals(df.index)
+
+    def test_service_columns_match_calculate_priority_for_integers(self):
+        """Test that 0/1 service flags are present on both paths and only False is absent."""
+        df = pd.DataFrame({
+            "CONSUMO_MWH": [350] * 7,
+            "LUZ": [0, 1, False, True, None, "", "X"],
+            "GAS": [0, 0, 1, False, 1, "X", ""],
+        }, dtype=object)
+
+        engine = PriorityEngine()
+        priorities = engine.calculate_priorities(df)
+        expected = [engine.calculate_priority(row) for _, row in df.iterrows()]
+
+        assert priorities.tolist() == expected
+        assert priorities.tolist()[:2] == [4, 4]
+
+    def test_calculate_priorities_empty_dataframe(self):
+        """Test that an empty DataFrame yields an empty Series."""
+        df = pd.DataFrame({"CONSUMO_MWH": [], "LUZ": [], "GAS": []})
+
+        engine = PriorityEngine()
+        priorities = engine.calculate_priorities(df)
+
+        assert len(priorities) == 0
@@ -0,0 +1,42 @@
+"""Unit tests for the per-minute token bucket."""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api_manager.utils.rate_limiter import TokenBucket
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def test_token_bucket_allows_burst_then_paces_calls():
+    """Test that a full bucket serves a burst and then waits for the refill."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=60, period=60, clock=clock, sleep=clock.sleep)
+
+    assert [bucket.acquire() for _ in range(60)] == [0.0] * 60
+    assert bucket.acquire() == 1.0
+    assert bucket.acquire(2) == 2.0
+    assert clock.now == 3.0
+
+
+def test_token_bucket_refills_up_to_capacity():
+    """Test that idle time refills the bucket but never beyond its capacity."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1000, period=60, clock=clock, sleep=clock.sleep)
+
+    bucket.acquire(1000)
+    clock.now = 600
+    assert bucket.acquire(1000) == 0.0
+    assert bucket.acquire(500) == 30.0
@@ -63,3 +63,37 @@ def test_tier1_enricher_enrich_batch() -> None:
     assert len(leads) == 2
     assert "CIF_VALID" in leads[0]
     assert "CIF_VALID" in leads[1]
+
+
+def test_tier1_enricher_enrich_dataframe_projects_input_columns() -> None:
+    """Test that enrich_dataframe only feeds Tier1 input columns and returns output columns."""
+    import pandas as pd
+
+    from src.api_manager.tier1_enricher import TIER1_OUTPUT_COLUMNS
+
+    enricher = Tier1Enricher(config_path="config/tier1_config.yaml")
+    seen_leads = []
+
+    def fake_enrich_lead(lead):
+        seen_leads.append(lead)
+        return {"CIF": lead.get("CIF"), "PHONE": "+34 612 34 56 78", "ERRORS": ""}
+
+    enricher.enrich_lead = fake_enrich_lead
+
+    df = pd.DataFrame({
+        "CIF": ["B12345678", "A28015865"],
+        "NOMBRE CLIENTE": ["Company 1", "Company 2"],
+        "OBSERVACIONES": ["Nota 1", "Nota 2"],
+    })
+
+    columns, report = enricher.enrich_dataframe(df)
+
+    assert seen_leads == [
+        {"CIF": "B12345678", "NOMBRE CLIENTE": "Company 1"},
+        {"CIF": "A28015865", "NOMBRE CLIENTE": "Company 2"},
+    ]
+    assert list(columns) == list(TIER1_OUTPUT_COLUMNS)
+    assert columns["CIF"] == ["B12345678", "A28015865"]
+    assert columns["CIF_VALID"] == [None, None]
+    assert report.total == 2
+    assert report.phone_found == 2
@@ -0,0 +1,560 @@
+"""Unit tests for Tier2Enricher batch enrichment."""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pandas as pd
+
+from src.enrichers.tier2_enricher import Tier2Enricher, TIER2_OUTPUT_COLUMNS, _company_key, _company_names, _lead_domains, _prefilter_html
+from src.scrapers.linkedin_scraper import LinkedInResult
+from src.scrapers.web_scraper import ScrapedPage
+from src.ai.openai_parser import ContactInfo, ParsedContactData
+from src.utils.disk_cache import DiskCache
+
+
+def _enricher_with_stubs(delays):
+    """Tier2Enricher whose network clients are replaced by local stubs."""
+    enricher = Tier2Enricher()
+    enricher._disk_cache = None
+    enricher._mx_prefetch_concurrency = 0
+    enricher.openai_parser = None
+    enricher.email_researcher = None
+    enricher.scraper = Mock()
+    enricher.scraper.scrape_contact_page = Mock(
+        return_value=Mock(success=False, html=None, error="TIMEOUT")
+    )
+
+    def find_company(company_name):
+        time.sleep(delays[company_name])
+        return LinkedInResult(company_url=f"https://linkedin.com/company/{company_name}", success=True)
+
+    enricher.linkedin_scraper = Mock()
+    enricher.linkedin_scraper.find_company = Mock(side_effect=find_company)
+    return enricher
+
+
+def test_enrich_dataframe_keeps_row_order_when_run_concurrently():
+    """Test that results come back in row order even if later leads finish first."""
+    delays = {"slow": 0.2, "medium": 0.1, "fast": 0.0}
+    enricher = _enricher_with_stubs(delays)
+
+    df = pd.DataFrame({
+        "RAZON_SOCIAL": ["slow", "medium", "fast"],
+        "WEBSITE": ["https://a.com", "", "https://c.com"],
+        "PRIORITY": [2, 3, 4],
+    })
+
+    columns, report = enricher.enrich_dataframe(df)
+
+    assert list(columns) == list(TIER2_OUTPUT_COLUMNS)
+    assert columns["LINKEDIN_COMPANY"] == [
+        "https://linkedin.com/company/slow",
+        "https://linkedin.com/company/medium",
+        "https://linkedin.com/company/fast",
+    ]
+    assert columns["TIER2_ERRORS"] == ["SCRAPE_FAILED:TIMEOUT", "NO_WEBSITE", "SCRAPE_FAILED:TIMEOUT"]
+    assert report.total == 3
+    assert report.linkedin_found == 3
+
+
+def test_enrich_batch_updates_leads_in_place():
+    """Test that enrich_batch writes the Tier2 columns back into each lead."""
+    enricher = _enricher_with_stubs({"Empresa A": 0.0})
+    leads = [{"RAZON_SOCIAL": "Empresa A", "WEBSITE": "", "PRIORITY": 2}, {"WEBSITE": "", "PRIORITY": 2}]
+
+    report = enricher.enrich_batch(leads)
+
+    assert leads[0]["LINKEDIN_COMPANY"] == "https://linkedin.com/company/Empresa A"
+    assert leads[1]["LINKEDIN_COMPANY"] is None
+    assert enricher.linkedin_scraper.find_company.call_count == 1
+    assert report.total == 2
+
+
+def test_enrich_dataframe_resolves_each_company_once():
+    """Test that leads sharing a company reuse one LinkedIn lookup and one email research."""
+    enricher = _enricher_with_stubs({"Cadena": 0.05, "cadena": 0.05, "CADENA, S.L.": 0.05, "Otra": 0.0})
+    research_result = Mock(
+        email="juan@cadena.es",
+        source_url="https://cadena.es",
+        confidence=0.9,
+        notes=None,
+        company_enrichment=None,
+        contact_name=None,
+        contact_position=None,
+        error=None,
+        tokens_used=500,
+    )
+    enricher.email_researcher = Mock()
+    enricher.email_researcher.research_email = Mock(return_value=research_result)
+    enricher.email_validator = Mock()
+    enricher.email_validator.validate_async = AsyncMock(return_value=Mock(valid=True, deliverable=True, generic=False))
+
+    df = pd.DataFrame({
+        "RAZON_SOCIAL": ["Cadena", "cadena", "Otra", "CADENA, S.L."],
+        "WEBSITE": ["", "", "", ""],
+        "PRIORITY": [3, 3, 3, 3],
+    })
+
+    columns, report = enricher.enrich_dataframe(df, enable_email_research=True)
+
+    assert enricher.linkedin_scraper.find_company.call_count == 2
+    assert enricher.email_researcher.research_email.call_count == 2
+    assert columns["EMAIL_RESEARCHED"] == ["juan@cadena.es"] * 4
+    assert columns["EMAIL_VALID"] == [True] * 4
+    assert columns["LINKEDIN_COMPANY"][3] == columns["LINKEDIN_COMPANY"][0]
+    assert report.emails_researched == 4
+    assert report.total_openai_tokens == 2 * 500
+
+
+def test_prefilter_html_keeps_only_contact_regions():
+    """Test that scripts and layout are dropped and contact regions are kept."""
+    html = """
+    <html><head><script>var tracking = "x@tracker.com";</script><style>body {}</style></head>
+    <body>
+      <nav><a href="/">Inicio</a><a href="/productos">Productos</a></nav>
+      <h2>Equipo comercial</h2>
+      <div><p>Juan Pérez, Director: juan.perez@empresa.es</p></div>
+      <a href="mailto:ventas@empresa.es">Escríbenos</a>
+      <footer>Calle Mayor 1, Madrid</footer>
+    </body></html>
+    """
+
+    lines = _prefilter_html(html).split("\n")
+
+    assert "Equipo comercial" in lines
+    assert "Juan Pérez, Director: juan.perez@empresa.es" in lines
+    assert "Escríbenos <mailto:ventas@empresa.es>" in lines
+    assert "Calle Mayor 1, Madrid" in lines
+    assert not any("tracker" in line or "Productos" in line for line in lines)
+
+
+def test_prefilter_html_falls_back_to_visible_text():
+    """Test that pages without contact regions yield their visible text, capped in length."""
+    html = "<body><script>track()</script><div><p>Bienvenido   a</p><p>Bienvenido   a</p><p>Empresa A</p></div></body>"
+
+    assert _prefilter_html(html) == "Bienvenido a\nEmpresa A"
+    assert _prefilter_html(html, max_chars=5) == "Bienv"
+    assert _prefilter_html("<script>track()</script>") == ""
+
+
+def test_prefilter_html_keeps_json_ld_with_emails():
+    """Test that schema.org JSON-LD blocks listing an email survive the script removal."""
+    html = (
+        '<script type="application/ld+json">{"@type": "Organization", "email": "ana@empresa.es"}</script>'
+        '<script type="application/ld+json">{"@type": "WebSite"}</script><nav>Inicio</nav>'
+    )
+
+    assert _prefilter_html(html) == '{"@type": "Organization", "email": "ana@empresa.es"}'
+
+
+def test_disk_cache_reuses_scrape_and_parse_across_runs(tmp_path):
+    """Test that a second run reads the scrape and OpenAI parse from the disk cache."""
+    html = "<footer>Ana López, Gerente: ana@empresa.es</footer>"
+    parsed = ParsedContactData(
+        emails=["ana@empresa.es"],
+        contacts=[ContactInfo(name="Ana López", title="Gerente", email="ana@empresa.es")],
+        tokens_used=120,
+    )
+    lead = {"RAZON_SOCIAL": "Empresa", "WEBSITE": "https://empresa.es", "PRIORITY": 2}
+
+    results = []
+    for _ in range(2):
+        enricher = _enricher_with_stubs({"Empresa": 0.0})
+        enricher._disk_cache = DiskCache(tmp_path / "cache.sqlite3", ttl=3600)
+        enricher.scraper.scrape_contact_page = Mock(
+            return_value=ScrapedPage(html=html, url="https://empresa.es/contacto", success=True)
+        )
+        enricher.openai_parser = Mock()
+        enricher.openai_parser.parse_html = Mock(return_value=parsed)
+        enricher.email_validator = Mock()
+        enricher.email_validator.validate = Mock(return_value=Mock(valid=True, deliverable=True, generic=False))
+        results.append((enricher, enricher.enrich_lead(lead)))
+
+    (first, first_result), (second, second_result) = results
+    assert first.scraper.scrape_contact_page.call_count == 1
+    assert second.scraper.scrape_contact_page.call_count == 0
+    assert second.openai_parser.parse_html.call_count == 0
+    assert second_result.contact_name == first_result.contact_name == "Ana López"
+    assert second_result.email_specific == "ana@empresa.es"
+    assert (first_result.openai_tokens_used, second_result.openai_tokens_used) == (120, 0)
+
+
+def test_disk_cache_keeps_linkedin_and_failed_scrapes_per_domain(tmp_path):
+    """Test that LinkedIn answers and unscrapable sites are cached, misses only for negative_ttl."""
+    now = [1000.0]
+    cache = DiskCache(tmp_path / "cache.sqlite3", ttl=3600, clock=lambda: now[0])
+    failed = ScrapedPage(html=None, url="https://empresa.es", success=False, error="ALL_PATHS_FAILED")
+    enricher = _enricher_with_stubs({"Empresa S.L.": 0.0})
+    enricher._disk_cache = cache
+    enricher.scraper.scrape_contact_page = Mock(return_value=failed)
+    enricher.linkedin_scraper.find_company.side_effect = None
+    enricher.linkedin_scraper.find_company.return_value = LinkedInResult(None, False, "NOT_FOUND")
+
+    for website in ("https://empresa.es", "http://www.empresa.es/"):
+        enricher._scrape_and_parse(website)
+        enricher._find_linkedin("Empresa S.L.")
+    assert enricher.scraper.scrape_contact_page.call_count == 1
+    assert enricher.linkedin_scraper.find_company.call_count == 1
+
+    now[0] += enricher._negative_ttl
+    found = LinkedInResult("https://linkedin.com/company/empresa", True)
+    enricher.linkedin_scraper.find_company.return_value = found
+    assert enricher._find_linkedin("Empresa S.L.") == found.company_url
+    now[0] += enricher._negative_ttl
+    assert enricher._find_linkedin("Empresa S.L.") == found.company_url
+    assert enricher.linkedin_scraper.find_company.call_count == 2
+    cache.close()
+
+
+def test_disk_cache_keeps_deep_links_on_one_host_apart(tmp_path):
+    """Test that two paths on one host do not share a cached contact page."""
+    cache = DiskCache(tmp_path / "cache.sqlite3", ttl=3600)
+    enricher = _enricher_with_stubs({})
+    enricher._disk_cache = cache
+    enricher.scraper.scrape_contact_page = Mock(
+        side_effect=lambda website: ScrapedPage(html=f"<p>{website}</p>", url=website, success=True)
+    )
+
+    for website in ("https://facebook.com/empresaA", "facebook.com/empresaB", "https://www.facebook.com/empresaA/"):
+        enricher._scrape_and_parse(website)
+
+    assert [call.args[0] for call in enricher.scraper.scrape_contact_page.call_args_list] == [
+        "https://facebook.com/empresaA",
+        "facebook.com/empresaB",
+    ]
+    cache.close()
+
+
+def test_scraper_uses_shared_session_sized_for_concurrency():
+    """Test that the contact scraper reuses the enricher's pooled keep-alive session."""
+    enricher = Tier2Enricher()
+    try:
+        adapter = enricher._http.get_adapter("https://empresa.es")
+        assert enricher.scraper.session is enricher._http
+        assert adapter._pool_maxsize >= enricher.max_concurrency
+        assert enricher._http.max_redirects == 5
+    finally:
+        enricher.close()
+
+
+def test_enrich_batch_stream_reads_leads_chunk_by_chunk():
+    """Test that streamed leads reach the sink in order, one chunk read at a time."""
+    names = [f"Empresa {i}" for i in range(5)]
+    enricher = _enricher_with_stubs(dict.fromkeys(names, 0.0))
+    enricher.chunk_size = 2
+    produced = []
+    received = []
+
+    def leads():
+        for name in names:
+            produced.append(name)
+            yield {"RAZON_SOCIAL": name, "WEBSITE": "", "PRIORITY": 2}
+
+    def sink(lead):
+        received.append((lead["RAZON_SOCIAL"], lead["LINKEDIN_COMPANY"], len(produced)))
+
+    report = enricher.enrich_batch_stream(leads(), sink)
+
+    assert [name for name, _, _ in received] == names
+    assert received[0][1] == "https://linkedin.com/company/Empresa 0"
+    # When a chunk is delivered, at most that chunk has been read from the source
+    assert [seen for _, _, seen in received] == [2, 2, 4, 4, 5]
+    assert report.total == 5
+    assert report.linkedin_found == 5
+    assert report.errors == []
+
+
+def test_concurrent_contact_pages_share_one_openai_call():
+    """Test that pages scraped by concurrent leads are parsed in one batched call."""
+    names = ["A", "B", "C", "D"]
+    enricher = _enricher_with_stubs(dict.fromkeys(names, 0.0))
+    enricher._parse_batch_wait = 0.5
+    enricher.scraper.scrape_contact_page = Mock(
+        side_effect=lambda website: ScrapedPage(html=f"<footer>{website}</footer>", url=website, success=True)
+    )
+    enricher.openai_parser = Mock()
+    enricher.openai_parser.parse_html_batch = Mock(side_effect=lambda pages: [
+        ParsedContactData(emails=[], contacts=[ContactInfo(name=page, title=None, email=None)], tokens_used=10)
+        for page in pages
+    ])
+
+    df = pd.DataFrame({
+        "RAZON_SOCIAL": names,
+        "WEBSITE": [f"https://{name.lower()}.es" for name in names],
+        "PRIORITY": [2, 2, 2, 2],
+    })
+
+    columns, report = enricher.enrich_dataframe(df)
+
+    assert enricher.openai_parser.parse_html_batch.call_count == 1
+    assert columns["CONTACT_NAME"] == [f"https://{name.lower()}.es" for name in names]
+    assert report.total_openai_tokens == 40
+
+
+def test_linkedin_lookups_stop_while_circuit_is_open():
+    """Test that repeated LinkedIn timeouts stop further lookups in the batch."""
+    enricher = _enricher_with_stubs({})
+    enricher.linkedin_scraper.find_company = Mock(
+        return_value=LinkedInResult(company_url=None, success=False, error="TIMEOUT")
+    )
+    leads = [{"RAZON_SOCIAL": f"Empresa {i}", "WEBSITE": "", "PRIORITY": 2} for i in range(30)]
+
+    report = enricher.enrich_batch(leads)
+
+    assert enricher.linkedin_scraper.find_company.call_count == enricher._linkedin_breaker.window
+    assert enricher._linkedin_breaker.open
+    assert report.total == 30
+
+
+def test_prefilter_process_pool_is_started_once_per_enricher():
+    """Test that pages are prefiltered in one worker pool reused across batches until close()."""
+    enricher = _enricher_with_stubs({"A": 0.0, "B": 0.0})
+    enricher._html_workers = 2
+    enricher._parse_batch_size = 1
+    html = "<nav>Menú</nav><footer>Ana López, Gerente: ana@empresa.es</footer>"
+    enricher.scraper.scrape_contact_page = Mock(
+        return_value=ScrapedPage(html=html, url="https://a.es", success=True)
+    )
+    enricher.openai_parser = Mock()
+    enricher.openai_parser.parse_html = Mock(return_value=ParsedContactData(emails=[], contacts=[], tokens_used=1))
+
+    df = pd.DataFrame({"RAZON_SOCIAL": ["A", "B"], "WEBSITE": ["https://a.es", "https://b.es"], "PRIORITY": [2, 2]})
+
+    enricher.enrich_dataframe(df)
+    pool = enricher._html_pool
+    enricher.enrich_dataframe(df)
+
+    parsed = [call.args[0] for call in enricher.openai_parser.parse_html.call_args_list]
+    assert parsed == [_prefilter_html(html)] * 4
+    assert pool is not None and enricher._html_pool is pool
+    enricher.close()
+    assert enricher._html_pool is None
+
+
+def test_enrich_lead_overlaps_linkedin_with_scrape():
+    """Test that a single enrich_lead call runs the LinkedIn lookup alongside the scrape."""
+    enricher = _enricher_with_stubs({"Empresa A": 0.2})
+
+    def slow_scrape(website):
+        time.sleep(0.2)
+        return ScrapedPage(html=None, url=website, success=False, error="TIMEOUT")
+
+    enricher.scraper.scrape_contact_page = Mock(side_effect=slow_scrape)
+
+    start = time.perf_counter()
+    result = enricher.enrich_lead({"RAZON_SOCIAL": "Empresa A", "WEBSITE": "https://a.es", "PRIORITY": 2})
+    elapsed = time.perf_counter() - start
+
+    assert result.linkedin_company == "https://linkedin.com/company/Empresa A"
+    assert result.errors == ["SCRAPE_FAILED:TIMEOUT"]
+    assert elapsed < 0.35
+
+
+def test_enrich_lead_researches_while_scraping():
+    """Test that email research runs alongside the contact page and fills in its email."""
+    enricher = _enricher_with_stubs({"Empresa A": 0.0})
+
+    def slow_scrape(website):
+        time.sleep(0.2)
+        return ScrapedPage(html=None, url=website, success=False, error="TIMEOUT")
+
+    def slow_research(company, city=None, website=None):
+        time.sleep(0.2)
+        return Mock(
+            email="ana@empresa.es",
+            source_url=website,
+            confidence=0.8,
+            notes=None,
+            company_enrichment=None,
+            contact_name="Ana",
+            contact_position=None,
+            error=None,
+            tokens_used=0,
+        )
+
+    enricher.scraper.scrape_contact_page = Mock(side_effect=slow_scrape)
+    enricher.email_researcher = Mock()
+    enricher.email_researcher.research_email = Mock(side_effect=slow_research)
+    enricher.email_validator = Mock()
+    enricher.email_validator.validate_async = AsyncMock(return_value=Mock(valid=True, deliverable=True, generic=False))
+
+    start = time.perf_counter()
+    result = enricher.enrich_lead(
+        {"RAZON_SOCIAL": "Empresa A", "WEBSITE": "https://a.es", "PRIORITY": 3}, enable_email_research=True
+    )
+    elapsed = time.perf_counter() - start
+
+    assert result.email_specific == "ana@empresa.es"
+    assert result.email_valid
+    assert result.contact_name == "Ana"
+    assert result.errors == ["SCRAPE_FAILED:TIMEOUT"]
+    assert elapsed < 0.35
+
+
+def test_lead_domains_reads_website_host_and_email():
+    """Test the domains pre-resolved for a lead."""
+    assert _lead_domains({"WEBSITE": "www.Empresa.es/contacto", "EMAIL": "ana@Otra.com"}) == {"empresa.es", "otra.com"}
+    assert _lead_domains({"WEBSITE": "https://tienda.empresa.es", "EMAIL": None}) == {"tienda.empresa.es"}
+    assert _lead_domains({"WEBSITE": ""}) == set()
+    assert _lead_domains({"WEBSITE": float("nan"), "EMAIL": float("nan")}) == set()
+    assert Tier2Enricher._website({"WEBSITE": float("nan")}) is None
+
+
+def test_company_names_match_per_lead_fallback():
+    """Test that the vectorized company names follow the per-lead column preference."""
+    df = pd.DataFrame({
+        "RAZON_SOCIAL": ["  Empresa A ", None, float("nan"), "", "   ", None],
+        "NOMBRE CLIENTE": [None, "Cliente B", None, None, None, None],
+        "NOMBRE_EMPRESA": ["Otra", "Otra", "Empresa C", 12345, "Empresa D", None],
+    })
+
+    names = _company_names(df).tolist()
+
+    assert names == ["Empresa A", "Cliente B", "Empresa C", "12345", "Empresa D", ""]
+    records = df.to_dict(orient="records")
+    assert names == [Tier2Enricher._company_name(lead) for lead in records]
+
+
+def test_company_key_ignores_case_accents_and_legal_form():
+    """Test that branches of one company share a lookup key."""
+    assert _company_key("MERCADONA, S.A.") == _company_key("Mercadona SA") == "mercadona"
+    assert _company_key("Construcciones Pérez S.L.U.") == "construcciones perez"
+    assert _company_key("S.L.") == "sl"
+
+
+def test_enrich_batch_offline_uses_batch_api_answers():
+    """Test that contact pages are scraped once and parsed through one Batch API job."""
+    enricher = _enricher_with_stubs({"A": 0.0, "B": 0.0})
+    pages = {
+        "https://a.es": "<footer>Ana López: ana@a.es</footer>",
+        "https://b.es": "<footer>Luis Gil: luis@b.es</footer>",
+    }
+    enricher.scraper.scrape_contact_page = Mock(
+        side_effect=lambda website: ScrapedPage(html=pages[website], url=website, success=True)
+    )
+    enricher.openai_parser = Mock()
+    enricher.openai_parser.submit_offline_batch = Mock(return_value="batch-1")
+
+    def collect(batch_id, poll_interval, timeout):
+        submitted = enricher.openai_parser.submit_offline_batch.call_args.args[0]
+        return {
+            key: ParsedContactData(emails=[], contacts=[ContactInfo(name=text, title=None, email=None)], tokens_used=5)
+            for key, text in submitted.items()
+            if "Ana" in text
+        }
+
+    enricher.openai_parser.collect_offline_batch = Mock(side_effect=collect)
+    enricher.openai_parser.parse_html = Mock(return_value=ParsedContactData(emails=[], contacts=[], error="LIVE"))
+    enricher._parse_batch_size = 1
+    leads = [
+        {"RAZON_SOCIAL": "A", "WEBSITE": "https://a.es", "PRIORITY": 2},
+        {"RAZON_SOCIAL": "B", "WEBSITE": "https://b.es", "PRIORITY": 2},
+    ]
+
+    report = enricher.enrich_batch_offline(leads)
+
+    assert enricher.scraper.scrape_contact_page.call_count == 2
+    assert len(enricher.openai_parser.submit_offline_batch.call_args.args[0]) == 2
+    assert leads[0]["CONTACT_NAME"] == "Ana López: ana@a.es"
+    assert leads[1]["TIER2_ERRORS"] == "OPENAI_PARSE:LIVE"
+    assert enricher.openai_parser.parse_html.call_count == 1
+    assert report.total_openai_tokens == 5
+
+
+def test_research_failures_log_one_traceback_per_error_type(caplog):
+    """Test that a systematic research failure is logged once and summarized per batch."""
+    enricher = _enricher_with_stubs({"A": 0, "B": 0, "C": 0})
+    enricher.email_researcher = Mock()
+    enricher.email_researcher.research_email = Mock(side_effect=PermissionError("401 Unauthorized"))
+    df = pd.DataFrame({"RAZON_SOCIAL": ["A", "B", "C"], "WEBSITE": ["", "", ""], "PRIORITY": [3, 3, 3]})
+
+    with caplog.at_level("INFO", logger=enricher.logger.name):
+        columns, _ = enricher.enrich_dataframe(df, enable_email_research=True)
+
+    assert all("EMAIL_RESEARCH_ERROR:401 Unauthorized" in errors for errors in columns["TIER2_ERRORS"])
+    assert sum(1 for record in caplog.records if record.exc_info) == 1
+    assert "PermissionError x3" in caplog.text
+
+
+def test_leads_sharing_a_website_scrape_and_parse_once():
+    """Test that leads on the same site root reuse one contact page and deep links get their own."""
+    enricher = _enricher_with_stubs(dict.fromkeys(["A", "B", "C", "D"], 0.0))
+    enricher._parse_batch_size = 1
+    enricher.scraper.scrape_contact_page = Mock(
+        side_effect=lambda website: ScrapedPage(html=f"<footer>{website}</footer>", url=website, success=True)
+    )
+    enricher.openai_parser = Mock()
+    enricher.openai_parser.parse_html = Mock(return_value=ParsedContactData(
+        emails=[], contacts=[ContactInfo(name="Ana", title="CEO", email=None)], tokens_used=7
+    ))
+
+    df = pd.DataFrame({
+        "RAZON_SOCIAL": ["A", "B", "C", "D"],
+        "WEBSITE": ["https://www.cadena.es", "cadena.es/", "cadena.es/tiendas", "https://otra.es"],
+        "PRIORITY": [2, 2, 2, 2],
+    })
+
+    columns, report = enricher.enrich_dataframe(df)
+
+    assert sorted(call.args[0] for call in enricher.scraper.scrape_contact_page.call_args_list) == [
+        "cadena.es/tiendas",
+        "https://otra.es",
+        "https://www.cadena.es",
+    ]
+    assert enricher.openai_parser.parse_html.call_count == 3
+    assert columns["CONTACT_NAME"] == ["Ana"] * 4
+    assert report.total_openai_tokens == 21
+
+
+def test_email_research_runs_under_its_own_concurrency_limit():
+    """Test that research calls are capped separately and low-priority leads skip them."""
+    names = ["A", "B", "C", "D"]
+    enricher = _enricher_with_stubs(dict.fromkeys(names, 0.0))
+    enricher._research_slots = threading.BoundedSemaphore(1)
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+
+    def slow_research(company, city=None, website=None):
+        with lock:
+            in_flight.append(company)
+            peak.append(len(in_flight))
+        time.sleep(0.05)
+        with lock:
+            in_flight.remove(company)
+        return Mock(email=None, company_enrichment=None, confidence=0.0, notes=None, tokens_used=0, error=None)
+
+    enricher.email_researcher = Mock()
+    enricher.email_researcher.research_email = Mock(side_effect=slow_research)
+    df = pd.DataFrame({"RAZON_SOCIAL": names, "WEBSITE": [""] * 4, "PRIORITY": [3, 4, "x", 2]})
+
+    enricher.enrich_dataframe(df, enable_email_research=True)
+
+    assert sorted(call.kwargs["company"] for call in enricher.email_researcher.research_email.call_args_list) == ["A", "B"]
+    assert max(peak) == 1
+
+
+def test_email_researcher_is_built_only_when_research_runs(monkeypatch):
+    """Test that the researcher is loaded lazily, once, with the shared rate limiters."""
+    from src.enrichers import tier2_enricher
+
+    load = Mock(return_value=Mock())
+    monkeypatch.setattr(tier2_enricher, "load_email_researcher_from_config", load)
+    enricher = Tier2Enricher()
+    enricher._disk_cache = None
+    enricher._mx_prefetch_concurrency = 0
+    enricher.linkedin_scraper = Mock(find_company=Mock(return_value=LinkedInResult(None, False, "NOT_FOUND")))
+
+    enricher.enrich_batch([{"RAZON_SOCIAL": "A", "WEBSITE": "", "PRIORITY": 3}])
+    assert load.call_count == 0
+
+    researcher = enricher.email_researcher
+    assert enricher.email_researcher is researcher
+    assert load.call_count == 1
+    assert researcher.tavily_limiter is enricher._tavily_rpm
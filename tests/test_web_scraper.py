@@ -0,0 +1,151 @@
+"""Unit tests for ContactPageScraper path detection."""
+
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scrapers.web_scraper import (
+    CONTACT_PATHS,
+    ContactPageScraper,
+    ScrapedPage,
+    build_session,
+    find_contact_links,
+)
+
+
+def test_contact_paths_are_fetched_concurrently_and_first_path_wins():
+    """Test that paths overlap but the earliest successful path is returned."""
+    overlapping = threading.Barrier(3, timeout=5)
+    scraper = ContactPageScraper(session=Mock(), path_concurrency=3)
+
+    def fetch(url):
+        if url == "https://empresa.es":
+            return ScrapedPage(html=None, url=url, success=False, error="HTTP_404")
+        if url.endswith(tuple(CONTACT_PATHS[:3])):
+            overlapping.wait()
+        ok = url.endswith(("/contactanos", "/contact"))
+        return ScrapedPage(html="<p>hola</p>" if ok else None, url=url, success=ok, error=None if ok else "HTTP_404")
+
+    scraper._fetch_url = scraper._fetch_if_found = Mock(side_effect=fetch)
+
+    result = scraper.scrape_contact_page("empresa.es")
+
+    assert result.url == "https://empresa.es/contactanos"
+
+
+def test_scrape_contact_page_reports_all_paths_failed():
+    """Test the error when neither the base URL nor any path answers."""
+    scraper = ContactPageScraper(session=Mock(), path_concurrency=2)
+    scraper._fetch_url = scraper._fetch_if_found = Mock(
+        side_effect=lambda url: ScrapedPage(html=None, url=url, success=False, error="TIMEOUT")
+    )
+
+    result = scraper.scrape_contact_page("https://empresa.es/")
+
+    assert (result.success, result.error) == (False, "ALL_PATHS_FAILED")
+    assert scraper._fetch_url.call_count == 1 + len(CONTACT_PATHS)
+
+
+def test_contact_paths_are_probed_with_head_before_get():
+    """Test that missing paths cost a HEAD only and found ones are fetched at their final URL."""
+    session = Mock()
+    session.head.side_effect = lambda url, **kwargs: {
+        "https://a.es/contacto": Mock(status_code=404, url=url),
+        "https://a.es/about": Mock(status_code=405, url=url),
+        "https://a.es/legal": Mock(status_code=403, url=url),
+        "https://a.es/team": Mock(status_code=200, url="https://a.es/equipo/"),
+    }[url]
+    session.get.side_effect = lambda url, **kwargs: Mock(url=url, text="<p>ok</p>", raise_for_status=Mock())
+    scraper = ContactPageScraper(session=session)
+
+    missing = scraper._fetch_if_found("https://a.es/contacto")
+    no_head = scraper._fetch_if_found("https://a.es/about")
+    blocked_head = scraper._fetch_if_found("https://a.es/legal")
+    redirected = scraper._fetch_if_found("https://a.es/team")
+
+    assert (missing.success, missing.error) == (False, "HTTP_404")
+    assert no_head.success and blocked_head.success and redirected.url == "https://a.es/equipo/"
+    assert [call.args[0] for call in session.get.call_args_list] == [
+        "https://a.es/about",
+        "https://a.es/legal",
+        "https://a.es/equipo/",
+    ]
+
+
+def test_build_session_sets_default_headers_once():
+    """Test that browser-like headers live on the session instead of each request."""
+    session = build_session(pool_size=5, pool_hosts=50)
+
+    assert session.headers["Connection"] == "keep-alive"
+    assert session.headers["Accept-Language"].startswith("es-ES")
+    assert session.get_adapter("https://a.es")._pool_connections == 50
+    session.close()
+
+
+def test_find_contact_links_ranks_same_site_links():
+    """Test that contact links are resolved, kept on-site and ordered by keyword relevance."""
+    html = """
+        <a href="/nosotros/equipo">Nuestro equipo</a>
+        <a class="nav" href="https://www.empresa.es/hablemos#form"><span>Contacto</span></a>
+        <a href="https://facebook.com/empresa">Contact us on Facebook</a>
+        <a href="mailto:info@empresa.es">contacto</a>
+        <a href="/blog">Blog</a>
+    """
+
+    links = find_contact_links(html, "https://empresa.es/")
+
+    assert links == ["https://www.empresa.es/hablemos", "https://empresa.es/nosotros/equipo"]
+
+
+def test_failed_deep_link_uses_homepage_links_before_fixed_paths():
+    """Test that a broken deep link falls back to the contact page linked from the homepage."""
+    pages = {
+        "https://empresa.es/": '<a href="/hablemos">Contáctanos</a>',
+        "https://empresa.es/hablemos": "<p>info@empresa.es</p>",
+    }
+    scraper = ContactPageScraper(session=Mock(), path_concurrency=1)
+
+    def fetch(url):
+        html = pages.get(url)
+        return ScrapedPage(html=html, url=url, success=html is not None, error=None if html else "HTTP_404")
+
+    scraper._fetch_url = scraper._fetch_if_found = Mock(side_effect=fetch)
+
+    first = scraper.scrape_contact_page("https://empresa.es/productos/viejo")
+    first_calls = [call.args[0] for call in scraper._fetch_url.call_args_list]
+    scraper._fetch_url.reset_mock()
+    pages.pop("https://empresa.es/")
+    second = scraper.scrape_contact_page("empresa.es/otro")
+    second_calls = [call.args[0] for call in scraper._fetch_url.call_args_list]
+
+    assert first.url == second.url == "https://empresa.es/hablemos"
+    assert first_calls[:3] == [
+        "https://empresa.es/productos/viejo",
+        "https://empresa.es/",
+        "https://empresa.es/hablemos",
+    ]
+    # The page found for the site is tried first next time
+    assert second_calls[:3] == ["https://empresa.es/otro", "https://empresa.es/", "https://empresa.es/hablemos"]
+
+
+def test_homepage_without_contact_links_still_probes_fixed_paths():
+    """Test that a homepage with script-built navigation falls through to the contact paths."""
+    pages = {
+        "https://empresa.es/": "<div id='app'></div>",
+        "https://empresa.es" + CONTACT_PATHS[1]: "<p>info@empresa.es</p>",
+    }
+    scraper = ContactPageScraper(session=Mock(), path_concurrency=1)
+
+    def fetch(url):
+        html = pages.get(url)
+        return ScrapedPage(html=html, url=url, success=html is not None, error=None if html else "HTTP_404")
+
+    scraper._fetch_url = scraper._fetch_if_found = Mock(side_effect=fetch)
+
+    result = scraper.scrape_contact_page("https://empresa.es/productos/viejo")
+
+    assert result.url == "https://empresa.es" + CONTACT_PATHS[1]